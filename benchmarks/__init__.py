@@ -0,0 +1 @@
+"""Benchmarks for the Hunter.io API client."""
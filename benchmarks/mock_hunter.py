@@ -0,0 +1,141 @@
+"""Local stand-in for the Hunter.io API serving recorded fixtures."""
+
+import asyncio
+import copy
+import json
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any, Optional
+
+import httpx
+
+from hunter_client.config import HTTP_SERVICE_UNAVAILABLE, MAX_LIMIT
+from hunter_client.endpoints import HunterEndpoints
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / 'tests' / 'fixtures'
+DEFAULT_TOTAL_RESULTS = 250
+HTTP_OK = 200
+HTTP_NOT_FOUND = 404
+
+ASGIReceive = Callable[[], Awaitable[dict[str, Any]]]
+ASGISend = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+def load_fixture(name: str) -> dict[str, Any]:
+    """Load a recorded Hunter.io response from ``tests/fixtures``."""
+    fixture_path = FIXTURES_DIR / '{0}.json'.format(name)
+    fixture: dict[str, Any] = json.loads(fixture_path.read_text())
+    return fixture
+
+
+def domain_search_payload(limit: int, offset: int = 0, total_results: int = DEFAULT_TOTAL_RESULTS) -> dict[str, Any]:
+    """Build a domain search page of ``limit`` emails from the recorded fixture."""
+    payload = load_fixture('domain_search')
+    templates = payload['data']['emails']
+    emails = []
+    for index in range(offset, min(offset + limit, total_results)):
+        email = copy.deepcopy(templates[index % len(templates)])
+        email['value'] = 'user{0}@example.com'.format(index)
+        emails.append(email)
+    payload['data']['emails'] = emails
+    payload['meta'].update(results=total_results, limit=limit, offset=offset)
+    return payload
+
+
+class MockHunter:
+    """Serves Hunter.io endpoints from fixtures with optional latency and failures.
+
+    ``latency`` seconds are added to every response and ``error_rate`` of the
+    requests fail with a 503. Response bodies are encoded once per distinct
+    page so the mock itself stays cheap under load.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0,
+        error_rate: float = 0,
+        total_results: int = DEFAULT_TOTAL_RESULTS,
+        seed: Optional[int] = None,
+    ) -> None:
+        """Initialize with the fixtures loaded."""
+        self.latency = latency
+        self.error_rate = error_rate
+        self.total_results = total_results
+        self.requests = 0
+        self._random = random.Random(seed)
+        self._bodies: dict[str, bytes] = {
+            HunterEndpoints.email_finder.path: json.dumps(load_fixture('email_finder')).encode(),
+            HunterEndpoints.email_verifier.path: json.dumps(load_fixture('email_verifier')).encode(),
+            HunterEndpoints.account.path: json.dumps(load_fixture('account')).encode(),
+        }
+        self._pages: dict[tuple[int, int], bytes] = {}
+        self._lock = threading.Lock()
+
+    def respond(self, path: str, params: dict[str, str]) -> tuple[int, bytes]:
+        """Return the status code and JSON body for a request."""
+        with self._lock:
+            self.requests += 1
+            failed = self._random.random() < self.error_rate
+        if failed:
+            return HTTP_SERVICE_UNAVAILABLE, b'{"errors": [{"details": "Service unavailable"}]}'
+        endpoint_path = '/{0}'.format(path.rstrip('/').rsplit('/', 1)[-1])
+        if endpoint_path == HunterEndpoints.domain_search.path:
+            return HTTP_OK, self._domain_page(params)
+        body = self._bodies.get(endpoint_path)
+        if body is None:
+            return HTTP_NOT_FOUND, b'{"errors": [{"details": "Not found"}]}'
+        return HTTP_OK, body
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        """Answer a request for ``httpx.MockTransport``."""
+        if self.latency:
+            time.sleep(self.latency)
+        status_code, body = self.respond(request.url.path, dict(request.url.params))
+        return _json_response(status_code, body)
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        """Answer a request for an async ``httpx.MockTransport``."""
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        status_code, body = self.respond(request.url.path, dict(request.url.params))
+        return _json_response(status_code, body)
+
+    def transport(self) -> httpx.MockTransport:
+        """Return a transport for ``HunterClient``."""
+        return httpx.MockTransport(self.handle)
+
+    def async_transport(self) -> httpx.MockTransport:
+        """Return a transport for ``AsyncHunterClient``."""
+        return httpx.MockTransport(self.handle_async)
+
+    async def __call__(self, scope: dict[str, Any], receive: ASGIReceive, send: ASGISend) -> None:
+        """Serve the mock as an ASGI app, e.g. ``uvicorn benchmarks.mock_hunter:app``."""
+        if scope['type'] != 'http':
+            return
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        query = httpx.QueryParams(scope['query_string'].decode())
+        status_code, body = self.respond(scope['path'], dict(query))
+        headers = [(b'content-type', b'application/json'), (b'content-length', str(len(body)).encode())]
+        await send({'type': 'http.response.start', 'status': status_code, 'headers': headers})
+        await send({'type': 'http.response.body', 'body': body})
+
+    def _domain_page(self, params: dict[str, str]) -> bytes:
+        """Return the encoded domain search page for ``limit`` and ``offset``."""
+        page_key = (int(params.get('limit', MAX_LIMIT)), int(params.get('offset', 0)))
+        page = self._pages.get(page_key)
+        if page is None:
+            page = json.dumps(domain_search_payload(*page_key, total_results=self.total_results)).encode()
+            self._pages[page_key] = page
+        return page
+
+
+def _json_response(status_code: int, body: bytes) -> httpx.Response:
+    """Wrap an encoded body in an httpx response."""
+    return httpx.Response(status_code, content=body, headers={'content-type': 'application/json'})
+
+
+app = MockHunter()
@@ -0,0 +1,323 @@
+"""Run the Hunter.io client benchmarks and write the results as JSON.
+
+Usage::
+
+    python -m benchmarks.run --output benchmark-results.json
+    python -m benchmarks.run --compare baseline.json
+
+Every scenario runs against ``MockHunter`` in-process, so results measure the
+client, parsing and FastAPI layers rather than the network.
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import statistics
+import subprocess  # noqa: S404
+import sys
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable, Iterator
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional, get_args
+
+import httpx
+
+from benchmarks.mock_hunter import MockHunter, domain_search_payload, load_fixture
+from hunter_client.client import AsyncHunterClient
+from hunter_client.config import HUNTER_API_BASE_URL
+from hunter_client.email_table import EmailTable
+from hunter_client.endpoints import HunterEndpoints
+from hunter_client.http_client import BaseHTTPClient
+from hunter_client.main import app
+from hunter_client.models.account import AccountInformationResponse
+from hunter_client.models.common import Email
+from hunter_client.models.domain import DomainSearchResponse
+from hunter_client.models.email_finder import EmailFinderResponse
+from hunter_client.models.verifier import EmailVerifierResponse
+from hunter_client.rate_limit import RateLimiter
+from hunter_client.response_handler import (
+    DEFAULT_DECODE_MODE,
+    DecodeMode,
+    process_api_response,
+    validate_response_json,
+)
+from hunter_client.retry import RetryPolicy
+from hunter_client.services import fetch_model
+
+DEFAULT_OUTPUT = 'benchmark-results.json'
+DEFAULT_MEMORY_EMAILS = 20000
+LARGE_PAGE_EMAILS = 100
+PERCENTILE_CUTS = 100
+MILLISECONDS = 1000
+MEBIBYTE = 1024 * 1024
+REGRESSION_THRESHOLD = 0.1
+
+UNLIMITED_RATES: dict[str, float] = {
+    HunterEndpoints.domain_search.path: 0,
+    HunterEndpoints.email_finder.path: 0,
+    HunterEndpoints.email_verifier.path: 0,
+    HunterEndpoints.account.path: 0,
+}
+
+
+def summarize(durations: list[float], elapsed: float) -> dict[str, float]:
+    """Reduce per-operation durations (seconds) to throughput and latency percentiles."""
+    cuts = statistics.quantiles(durations, n=PERCENTILE_CUTS, method='inclusive')
+    return {
+        'operations': len(durations),
+        'ops_per_sec': round(len(durations) / elapsed, 1),
+        'mean_ms': round(statistics.fmean(durations) * MILLISECONDS, 4),
+        'p50_ms': round(cuts[49] * MILLISECONDS, 4),
+        'p99_ms': round(cuts[98] * MILLISECONDS, 4),
+    }
+
+
+def measure(operation: Callable[[int], Any], iterations: int) -> dict[str, float]:
+    """Time ``operation(index)`` sequentially ``iterations`` times."""
+    durations = []
+    started_at = time.perf_counter()
+    for index in range(iterations):
+        operation_started_at = time.perf_counter()
+        operation(index)
+        durations.append(time.perf_counter() - operation_started_at)
+    return summarize(durations, time.perf_counter() - started_at)
+
+
+async def measure_concurrent(
+    operation: Callable[[int], Awaitable[Any]],
+    iterations: int,
+    concurrency: int,
+) -> dict[str, float]:
+    """Time ``iterations`` awaited operations with ``concurrency`` in flight."""
+    durations: list[float] = []
+    indexes = iter(range(iterations))
+
+    async def worker() -> None:
+        for index in indexes:
+            operation_started_at = time.perf_counter()
+            await operation(index)
+            durations.append(time.perf_counter() - operation_started_at)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(durations, time.perf_counter() - started_at)
+
+
+def bench_client_get(mock: MockHunter, iterations: int) -> dict[str, float]:
+    """Measure raw ``BaseHTTPClient.get`` throughput, bypassing cache and parsing."""
+    client = BaseHTTPClient(
+        'bench_key',
+        rate_limiter=RateLimiter(UNLIMITED_RATES),
+        retry_policy=RetryPolicy(max_attempts=1),
+        transport=mock.transport(),
+    )
+    request_params = {'email': 'patrick@example.com'}
+    try:
+        return measure(lambda _: client.get(HunterEndpoints.email_verifier.path, request_params), iterations)
+    finally:
+        client.close()
+
+
+def bench_parse(
+    payload: dict[str, Any],
+    response_model: type[Any],
+    decode_mode: DecodeMode,
+    iterations: int,
+) -> dict[str, float]:
+    """Measure ``process_api_response`` for one encoded payload."""
+    body = json.dumps(payload).encode()
+    request = httpx.Request('GET', HUNTER_API_BASE_URL)
+
+    def parse(_: int) -> Any:
+        response = httpx.Response(200, content=body, request=request)
+        return process_api_response(response, response_model, decode_mode)
+
+    return measure(parse, iterations)
+
+
+def bench_parse_modes(iterations: int) -> dict[str, dict[str, float]]:
+    """Measure parsing of every response type in each decode mode."""
+    payloads = {
+        'domain_search_small': (load_fixture('domain_search'), DomainSearchResponse),
+        'domain_search_100': (domain_search_payload(LARGE_PAGE_EMAILS), DomainSearchResponse),
+        'email_finder': (load_fixture('email_finder'), EmailFinderResponse),
+        'email_verifier': (load_fixture('email_verifier'), EmailVerifierResponse),
+        'account': (load_fixture('account'), AccountInformationResponse),
+    }
+    results = {}
+    for payload_name, (payload, response_model) in payloads.items():
+        for decode_mode in get_args(DecodeMode):
+            suffix = '' if decode_mode == DEFAULT_DECODE_MODE else '_{0}'.format(decode_mode)
+            scenario = 'parse_{0}{1}'.format(payload_name, suffix)
+            results[scenario] = bench_parse(payload, response_model, decode_mode, iterations)
+    return results
+
+
+def bench_cache_hit(mock: MockHunter, iterations: int) -> dict[str, float]:
+    """Measure ``fetch_model`` latency when every lookup is served from cache."""
+    client = BaseHTTPClient(
+        'bench_key',
+        rate_limiter=RateLimiter(UNLIMITED_RATES),
+        transport=mock.transport(),
+    )
+    request_params = {'domain': 'example.com', 'limit': LARGE_PAGE_EMAILS}
+    endpoint = HunterEndpoints.domain_search.path
+    try:
+        fetch_model(client, endpoint, DomainSearchResponse, request_params)
+        return measure(lambda _: fetch_model(client, endpoint, DomainSearchResponse, request_params), iterations)
+    finally:
+        client.close()
+
+
+async def bench_api(mock: MockHunter, iterations: int, concurrency: int, cached: bool) -> dict[str, float]:
+    """Measure end-to-end ``/domain-search`` requests through the FastAPI app.
+
+    With ``cached`` every request repeats the same search; otherwise each
+    request searches a new domain and goes upstream to the mock.
+    """
+    hunter_client = AsyncHunterClient('bench_key', transport=mock.async_transport())
+    hunter_client._http_client.rate_limiter = RateLimiter(UNLIMITED_RATES)  # noqa: WPS437
+    app.state.hunter_client = hunter_client
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url='http://bench') as api:
+
+            async def search(index: int) -> None:
+                domain = 'example.com' if cached else 'domain{0}.example'.format(index)
+                response = await api.get('/domain-search', params={'domain': domain, 'limit': LARGE_PAGE_EMAILS})
+                response.raise_for_status()
+
+            await search(0)
+            return await measure_concurrent(search, iterations, concurrency)
+    finally:
+        app.state.hunter_client = None
+        await hunter_client.aclose()
+
+
+def iter_decoded_emails(total: int) -> Iterator[Email]:
+    """Yield ``total`` emails decoded page by page from encoded responses, as from the network."""
+    for offset in range(0, total, LARGE_PAGE_EMAILS):
+        body = json.dumps(domain_search_payload(LARGE_PAGE_EMAILS, offset, total_results=total)).encode()
+        yield from validate_response_json(body, DomainSearchResponse).emails
+
+
+def measure_memory(build: Callable[[], Any]) -> dict[str, float]:
+    """Measure the memory still held by what ``build`` returns, and the peak while building it."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        built = build()
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        'emails': len(built),
+        'retained_bytes': retained,
+        'peak_bytes': peak,
+        'bytes_per_email': round(retained / max(len(built), 1), 1),
+    }
+
+
+def bench_memory(total: int) -> dict[str, dict[str, float]]:
+    """Compare holding many domain search emails as ``Email`` models and as an ``EmailTable``."""
+    return {
+        'email_list': measure_memory(lambda: list(iter_decoded_emails(total))),
+        'email_table': measure_memory(lambda: EmailTable.from_emails(iter_decoded_emails(total))),
+    }
+
+
+def run_benchmarks(iterations: int, concurrency: int, latency: float) -> dict[str, dict[str, float]]:
+    """Run every scenario and return its summary keyed by name."""
+    mock = MockHunter(latency=latency)
+    return {
+        'client_get': bench_client_get(mock, iterations),
+        **bench_parse_modes(iterations),
+        'cache_hit': bench_cache_hit(mock, iterations),
+        'api_domain_search_hit': asyncio.run(bench_api(mock, iterations, concurrency, cached=True)),
+        'api_domain_search_miss': asyncio.run(bench_api(mock, iterations, concurrency, cached=False)),
+    }
+
+
+def git_commit() -> Optional[str]:
+    """Return the current commit hash, if run from a git checkout."""
+    try:
+        completed = subprocess.run(  # noqa: S603, S607
+            ['git', 'rev-parse', 'HEAD'],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip()
+
+
+def compare(results: dict[str, dict[str, float]], baseline_path: Path) -> list[str]:
+    """Describe throughput changes against a previous results file."""
+    baseline = json.loads(baseline_path.read_text())['results']
+    lines = []
+    for name, summary in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        change = summary['ops_per_sec'] / previous['ops_per_sec'] - 1
+        marker = '  REGRESSION' if change < -REGRESSION_THRESHOLD else ''
+        lines.append('{0:<32} {1:>+7.1%}{2}'.format(name, change, marker))
+    return lines
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Run the benchmarks from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--iterations', type=int, default=2000, help='operations per scenario')
+    parser.add_argument('--concurrency', type=int, default=50, help='in-flight API requests')
+    parser.add_argument('--latency', type=float, default=0, help='mock upstream latency in seconds')
+    parser.add_argument('--output', type=Path, default=Path(DEFAULT_OUTPUT), help='results file')
+    parser.add_argument('--compare', type=Path, help='previous results file to compare against')
+    parser.add_argument(
+        '--memory-emails',
+        type=int,
+        default=DEFAULT_MEMORY_EMAILS,
+        help='emails held in the memory comparison',
+    )
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.iterations, args.concurrency, args.latency)
+    memory = bench_memory(args.memory_emails)
+    report = {
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'settings': {'iterations': args.iterations, 'concurrency': args.concurrency, 'latency': args.latency},
+        'results': results,
+        'memory': memory,
+    }
+    args.output.write_text('{0}\n'.format(json.dumps(report, indent=2)))
+
+    for name, summary in results.items():
+        sys.stdout.write(
+            '{0:<32} {1[ops_per_sec]:>10} ops/s  p50 {1[p50_ms]:.3f} ms  p99 {1[p99_ms]:.3f} ms\n'.format(
+                name,
+                summary,
+            ),
+        )
+    for name, usage in memory.items():
+        sys.stdout.write(
+            '{0:<32} {1[bytes_per_email]:>10} B/email  peak {2:.1f} MiB\n'.format(
+                'memory_{0}'.format(name),
+                usage,
+                usage['peak_bytes'] / MEBIBYTE,
+            ),
+        )
+    if args.compare is not None:
+        sys.stdout.write('\n'.join(compare(results, args.compare)) + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,303 @@
+"""Resumable batch enrichment of CSV and NDJSON files."""
+
+import asyncio
+import csv
+import io
+import itertools
+import json
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Literal, Optional
+
+import httpx
+from pydantic import BaseModel
+
+from hunter_client.client import AsyncHunterClient
+from hunter_client.config import BATCH_CONCURRENCY, CHECKPOINT_WIDTH, HTTP_ERROR_CODE, HTTP_TOO_MANY_REQUESTS
+from hunter_client.response_handler import HunterAPIError
+
+BatchFormat = Literal['csv', 'ndjson']
+Row = dict[str, Any]
+ERROR_COLUMN = 'hunter_error'
+RESULT_PREFIX = 'hunter_'
+
+
+@dataclass(frozen=True)
+class BatchOperation:
+    """A per-row lookup and the result fields it adds to CSV output."""
+
+    name: str
+    columns: tuple[str, ...]
+    lookup: Callable[[AsyncHunterClient, Row], Awaitable[BaseModel]]
+
+
+class InvalidRow(dict[str, Any]):
+    """An NDJSON line that is not a JSON object, kept as ``{'line': ...}`` and written with ``error``."""
+
+    def __init__(self, line: str, error: str) -> None:
+        """Initialize from the raw line and why it was rejected."""
+        super().__init__(line=line)
+        self.error = error
+
+
+@dataclass(frozen=True)
+class RowOutcome:
+    """Result of one row: a model or a row-level error."""
+
+    row: Row
+    result: Optional[BaseModel] = None
+    error: Optional[str] = None
+    status_code: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class BatchSummary:
+    """Row counts of a finished batch run."""
+
+    skipped: int
+    written: int
+    errors: int
+
+
+def _optional(row: Row, column: str) -> Optional[str]:
+    """Return a stripped cell, or None if it is missing or blank."""
+    cell_value = row.get(column)
+    if cell_value is None:
+        return None
+    cell_value = str(cell_value).strip()
+    return cell_value or None
+
+
+def _required(row: Row, column: str) -> str:
+    """Return a stripped cell, raising ``ValueError`` if it is missing or blank."""
+    cell_value = _optional(row, column)
+    if cell_value is None:
+        raise ValueError('Missing {0!r} column'.format(column))
+    return cell_value
+
+
+async def _find(client: AsyncHunterClient, row: Row) -> BaseModel:
+    """Look up the email of the person in a row."""
+    return await client.email.find(
+        domain=_required(row, 'domain'),
+        first_name=_optional(row, 'first_name'),
+        last_name=_optional(row, 'last_name'),
+        full_name=_optional(row, 'full_name'),
+    )
+
+
+async def _verify(client: AsyncHunterClient, row: Row) -> BaseModel:
+    """Verify the email address in a row."""
+    return await client.email.verify(_required(row, 'email'))
+
+
+OPERATIONS = {
+    'find': BatchOperation('find', ('email', 'score', 'position', 'company'), _find),
+    'verify': BatchOperation('verify', ('status', 'result', 'score'), _verify),
+}
+
+
+def detect_format(path: Path) -> BatchFormat:
+    """Infer a file format from its extension, defaulting to CSV."""
+    return 'ndjson' if path.suffix.lower() in {'.ndjson', '.jsonl'} else 'csv'
+
+
+def iter_rows(path: Path, input_format: BatchFormat) -> Iterator[Row]:
+    """Stream rows from a CSV file with a header or an NDJSON file of objects.
+
+    NDJSON lines that are not JSON objects are yielded as ``InvalidRow``.
+    """
+    with path.open(newline='', encoding='utf-8') as input_file:
+        if input_format == 'csv':
+            yield from csv.DictReader(input_file)
+            return
+        for line in input_file:
+            if line.strip():
+                yield parse_ndjson_row(line)
+
+
+def parse_ndjson_row(line: str) -> Row:
+    """Decode one NDJSON line, returning an ``InvalidRow`` unless it holds a JSON object."""
+    try:
+        row = json.loads(line)
+    except json.JSONDecodeError as error:
+        return InvalidRow(line.rstrip('\r\n'), 'Invalid JSON: {0}'.format(error))
+    if not isinstance(row, dict):
+        return InvalidRow(line.rstrip('\r\n'), 'Expected a JSON object, got {0}'.format(type(row).__name__))
+    return row
+
+
+def is_fatal(error: Exception) -> bool:
+    """Check whether an error should stop the batch instead of being recorded for the row.
+
+    Throttling, exhausted quota, server errors and transport failures are not
+    the row's fault, so the row is left for a resumed run.
+    """
+    if isinstance(error, HunterAPIError):
+        status_code = error.status_code or 0
+        return status_code == HTTP_TOO_MANY_REQUESTS or status_code >= HTTP_ERROR_CODE
+    return isinstance(error, httpx.HTTPError)
+
+
+class Checkpoint:
+    """Rows completed and output bytes written, overwritten in place after every row."""
+
+    def __init__(self, path: Path) -> None:
+        """Initialize without touching the file."""
+        self.path = path
+        self._file: Optional[IO[bytes]] = None
+
+    def load(self) -> tuple[int, int]:
+        """Return ``(rows, offset)`` from a previous run, or zeros."""
+        if not self.path.exists():
+            return 0, 0
+        state = json.loads(self.path.read_bytes())
+        return int(state['rows']), int(state['offset'])
+
+    def save(self, rows: int, offset: int) -> None:
+        """Record progress; the fixed width keeps each update a single small write."""
+        if self._file is None:
+            self._file = self.path.open('r+b' if self.path.exists() else 'wb')
+        state = json.dumps({'rows': rows, 'offset': offset}).encode()
+        self._file.seek(0)
+        self._file.write(state.ljust(CHECKPOINT_WIDTH))
+        self._file.flush()
+
+    def close(self) -> None:
+        """Close the checkpoint file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class ResultWriter:
+    """Appends row outcomes to an output file, flushing each one."""
+
+    def __init__(self, output_file: IO[bytes], output_format: BatchFormat, operation: BatchOperation) -> None:
+        """Initialize over a binary file positioned where output continues."""
+        self._file = output_file
+        self._format = output_format
+        self._operation = operation
+        self._fieldnames: Optional[list[str]] = None
+
+    def start(self, first_row: Row, write_header: bool) -> None:
+        """Fix the CSV columns from the first input row and write the header for a new file."""
+        if self._format != 'csv':
+            return
+        result_columns = ['{0}{1}'.format(RESULT_PREFIX, column) for column in self._operation.columns]
+        self._fieldnames = [*first_row, *result_columns, ERROR_COLUMN]
+        if write_header:
+            self._write_csv(dict(zip(self._fieldnames, self._fieldnames)))
+
+    def write(self, outcome: RowOutcome) -> int:
+        """Write one outcome and return the output offset after it."""
+        if self._format == 'csv':
+            self._write_csv(self._csv_record(outcome))
+        else:
+            record = {
+                'row': outcome.row,
+                'result': None if outcome.result is None else outcome.result.model_dump(mode='json', by_alias=True),
+                'error': outcome.error,
+                'status_code': outcome.status_code,
+            }
+            self._file.write(json.dumps(record).encode())
+            self._file.write(b'\n')
+        self._file.flush()
+        return self._file.tell()
+
+    def _csv_record(self, outcome: RowOutcome) -> Row:
+        """Flatten an outcome into the CSV columns."""
+        record = dict(outcome.row)
+        if outcome.result is not None:
+            result_data = outcome.result.model_dump(mode='json', by_alias=True)
+            for column in self._operation.columns:
+                record['{0}{1}'.format(RESULT_PREFIX, column)] = result_data.get(column)
+        record[ERROR_COLUMN] = outcome.error
+        return record
+
+    def _write_csv(self, record: Row) -> None:
+        """Encode one CSV record."""
+        line = io.StringIO()
+        csv.DictWriter(line, fieldnames=self._fieldnames or [], extrasaction='ignore').writerow(record)
+        self._file.write(line.getvalue().encode())
+
+
+async def _lookup(client: AsyncHunterClient, operation: BatchOperation, row: Row) -> RowOutcome:
+    """Run one row's lookup, keeping row-level errors as part of the outcome."""
+    if isinstance(row, InvalidRow):
+        return RowOutcome(row, error=row.error)
+    try:
+        return RowOutcome(row, await operation.lookup(client, row))
+    except HunterAPIError as error:
+        if is_fatal(error):
+            raise
+        return RowOutcome(row, error=str(error), status_code=error.status_code)
+    except ValueError as error:
+        return RowOutcome(row, error=str(error))
+
+
+async def run_batch(
+    client: AsyncHunterClient,
+    operation: BatchOperation,
+    input_path: Path,
+    output_path: Path,
+    input_format: Optional[BatchFormat] = None,
+    output_format: Optional[BatchFormat] = None,
+    concurrency: int = BATCH_CONCURRENCY,
+    checkpoint_path: Optional[Path] = None,
+) -> BatchSummary:
+    """Enrich every input row into the output file, resuming from a checkpoint.
+
+    At most ``concurrency`` lookups are in flight; results are written in
+    input order so progress is a row count plus an output offset. Rows already
+    recorded in the checkpoint are skipped and anything written after it is
+    truncated, so a resumed run neither repeats nor duplicates written rows.
+    Throttling, quota and upstream failures stop the run (see ``is_fatal``);
+    lookups still in flight then are repeated on resume, for free when the
+    client has a persistent cache.
+    """
+    checkpoint = Checkpoint(checkpoint_path or output_path.with_name('{0}.checkpoint'.format(output_path.name)))
+    done_rows, offset = checkpoint.load()
+    if done_rows and not output_path.exists():
+        raise ValueError('Checkpoint {0} refers to missing output {1}'.format(checkpoint.path, output_path))
+    rows = iter_rows(input_path, input_format or detect_format(input_path))
+    first_row = next(rows, None)
+    if first_row is None:
+        output_path.touch()
+        return BatchSummary(skipped=0, written=0, errors=0)
+    pending = itertools.islice(itertools.chain([first_row], rows), done_rows, None)
+    written = 0
+    errors = 0
+    window: deque[asyncio.Task[RowOutcome]] = deque()
+
+    async def write_oldest() -> None:
+        nonlocal written, errors
+        outcome = await window.popleft()
+        written += 1
+        if outcome.error is not None:
+            errors += 1
+        checkpoint.save(done_rows + written, writer.write(outcome))
+
+    with output_path.open('r+b' if done_rows else 'wb') as output_file:
+        if done_rows:
+            output_file.truncate(offset)
+            output_file.seek(offset)
+        writer = ResultWriter(output_file, output_format or detect_format(output_path), operation)
+        writer.start(first_row, write_header=not done_rows)
+        if not done_rows:
+            checkpoint.save(0, output_file.tell())
+        try:
+            for row in pending:
+                window.append(asyncio.create_task(_lookup(client, operation, row)))
+                if len(window) >= concurrency:
+                    await write_oldest()
+            while window:
+                await write_oldest()
+        finally:
+            for task in window:
+                task.cancel()
+            await asyncio.gather(*window, return_exceptions=True)
+            checkpoint.close()
+    return BatchSummary(skipped=done_rows, written=written, errors=errors)
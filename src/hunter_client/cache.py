@@ -0,0 +1,437 @@
+"""Response cache backends for Hunter.io API client."""
+
+import asyncio
+import pickle  # noqa: S403
+import sqlite3
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from hunter_client.config import (
+    CACHE_COMPRESS_MIN_BYTES,
+    CACHE_MAX_BYTES,
+    CACHE_SIZE,
+    DISK_CACHE_COMPACT_INTERVAL,
+    DISK_CACHE_MAX_BYTES,
+)
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Caching rules for a single endpoint.
+
+    ``ttl`` is in seconds; ``None`` keeps entries until they are evicted and
+    ``0`` disables caching. Error responses are only stored when
+    ``cache_errors`` is set. Entries older than ``stale_after`` seconds are
+    still served but refreshed in the background (stale-while-revalidate).
+    """
+
+    ttl: Optional[float] = None
+    cache_errors: bool = False
+    stale_after: Optional[float] = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether responses for this endpoint are cached at all."""
+        return self.ttl is None or self.ttl > 0
+
+
+@dataclass
+class CacheStats:
+    """Counters describing cache effectiveness."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass
+class CacheEntry:
+    """A cached value with its expiry deadline and accounted size."""
+
+    value: Any
+    expires_at: Optional[float]
+    size: int
+
+
+@dataclass(frozen=True)
+class StaleableValue:
+    """A cached value with the wall-clock time after which it is stale."""
+
+    value: Any
+    fresh_until: float
+
+    def is_stale(self) -> bool:
+        """Check whether the value is past its soft TTL."""
+        return time.time() >= self.fresh_until
+
+
+class CacheBackend(ABC):
+    """Interface implemented by all cache backends."""
+
+    stats: CacheStats
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value or None on a miss."""
+
+    @abstractmethod
+    def set(self, key: str, cache_value: Any, ttl: Optional[float] = None, size: int = 0) -> None:
+        """Store a value for ``ttl`` seconds, accounting ``size`` bytes."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove a single entry if present."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """Async variant of ``get``; backends doing blocking I/O run it off the event loop."""
+        return self.get(key)
+
+    async def aset(self, key: str, cache_value: Any, ttl: Optional[float] = None, size: int = 0) -> None:
+        """Async variant of ``set``; backends doing blocking I/O run it off the event loop."""
+        self.set(key, cache_value, ttl=ttl, size=size)
+
+    def close(self) -> None:
+        """Release resources held by the backend."""
+
+
+class LRUCache(CacheBackend):
+    """Thread-safe in-memory LRU cache bounded by entry count and bytes."""
+
+    def __init__(
+        self,
+        max_entries: int = CACHE_SIZE,
+        max_bytes: int = CACHE_MAX_BYTES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an empty cache."""
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._clock = clock
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of stored entries."""
+        return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        """Return the accounted size of all stored entries."""
+        return self._total_bytes
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            if entry.expires_at is not None and entry.expires_at <= self._clock():
+                self._remove(key)
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry.value
+
+    def set(self, key: str, cache_value: Any, ttl: Optional[float] = None, size: int = 0) -> None:
+        """Store a value for ``ttl`` seconds, accounting ``size`` bytes."""
+        if size > self.max_bytes:
+            return
+        expires_at = None if ttl is None else self._clock() + ttl
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = CacheEntry(cache_value, expires_at, size)
+            self._total_bytes += size
+            self._evict()
+
+    def delete(self, key: str) -> None:
+        """Remove a single entry if present."""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def _remove(self, key: str) -> None:
+        """Drop an entry and release its bytes; caller holds the lock."""
+        entry = self._entries.pop(key)
+        self._total_bytes -= entry.size
+
+    def _evict(self) -> None:
+        """Evict least recently used entries until both bounds hold."""
+        while len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.stats.evictions += 1
+
+
+class SQLiteCache(CacheBackend):
+    """File-backed cache shared by every process that opens the same path.
+
+    The database runs in WAL mode so many workers can read concurrently while
+    one writes. Values are pickled and zlib-compressed above
+    ``compress_min_bytes``; only point it at a file you trust. Expired rows
+    are purged, and the byte budget enforced, by a background compaction
+    thread every ``compact_interval`` seconds (``0`` disables it).
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = DISK_CACHE_MAX_BYTES,
+        compact_interval: float = DISK_CACHE_COMPACT_INTERVAL,
+        compress_min_bytes: int = CACHE_COMPRESS_MIN_BYTES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Open or create the cache database."""
+        self.path = path
+        self.max_bytes = max_bytes
+        self.compress_min_bytes = compress_min_bytes
+        self.stats = CacheStats()
+        self._clock = clock
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._closed = threading.Event()
+        self._create_schema()
+        self._compactor: Optional[threading.Thread] = None
+        if compact_interval > 0:
+            self._compactor = threading.Thread(
+                target=self._compact_periodically,
+                args=(compact_interval,),
+                name='hunter-cache-compactor',
+                daemon=True,
+            )
+            self._compactor.start()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value or None on a miss."""
+        entry = self.get_entry(key)
+        return None if entry is None else entry.value
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """Return the stored entry, with its wall-clock expiry, or None."""
+        row = (
+            self._connection()
+            .execute(
+                'SELECT payload, compressed, expires_at, size FROM cache_entries WHERE key = ?',
+                (key,),
+            )
+            .fetchone()
+        )
+        if row is None:
+            self.stats.misses += 1
+            return None
+        payload, compressed, expires_at, size = row
+        if expires_at is not None and expires_at <= self._clock():
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return CacheEntry(self._decode(payload, compressed), expires_at, size)
+
+    def set(self, key: str, cache_value: Any, ttl: Optional[float] = None, size: int = 0) -> None:
+        """Store a value for ``ttl`` seconds.
+
+        The disk budget accounts the stored payload size, so ``size`` is ignored.
+        """
+        payload = pickle.dumps(cache_value, protocol=pickle.HIGHEST_PROTOCOL)
+        compressed = len(payload) >= self.compress_min_bytes
+        if compressed:
+            payload = zlib.compress(payload)
+        now = self._clock()
+        expires_at = None if ttl is None else now + ttl
+        with self._connection() as connection:
+            connection.execute(
+                'INSERT OR REPLACE INTO cache_entries '
+                + '(key, payload, compressed, expires_at, stored_at, size) VALUES (?, ?, ?, ?, ?, ?)',
+                (key, payload, int(compressed), expires_at, now, len(payload)),
+            )
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """Return the cached value from a worker thread, so a busy database cannot stall the event loop."""
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, cache_value: Any, ttl: Optional[float] = None, size: int = 0) -> None:
+        """Store a value from a worker thread, so a busy database cannot stall the event loop."""
+        await asyncio.to_thread(self.set, key, cache_value, ttl, size)
+
+    def delete(self, key: str) -> None:
+        """Remove a single entry if present."""
+        with self._connection() as connection:
+            connection.execute('DELETE FROM cache_entries WHERE key = ?', (key,))
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._connection() as connection:
+            connection.execute('DELETE FROM cache_entries')
+
+    def compact(self) -> int:
+        """Purge expired rows and trim to the byte budget; return rows removed."""
+        with self._connection() as connection:
+            removed = connection.execute(
+                'DELETE FROM cache_entries WHERE expires_at IS NOT NULL AND expires_at <= ?',
+                (self._clock(),),
+            ).rowcount
+            removed += self._trim(connection)
+        self._connection().execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        # execute() steps the pragma once, freeing a single page; executescript() runs it to completion
+        self._connection().executescript('PRAGMA incremental_vacuum')
+        self.stats.evictions += removed
+        return removed
+
+    def close(self) -> None:
+        """Stop background compaction and close all connections."""
+        self._closed.set()
+        if self._compactor is not None:
+            self._compactor.join()
+        with self._connections_lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use."""
+        connection: Optional[sqlite3.Connection] = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30.0, check_same_thread=False)
+            # auto_vacuum only takes effect on a new file, so before WAL mode writes its header
+            connection.execute('PRAGMA auto_vacuum=INCREMENTAL')
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
+
+    def _create_schema(self) -> None:
+        """Create the cache table on first use of the database file."""
+        connection = self._connection()
+        with connection:
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS cache_entries ('
+                + 'key TEXT PRIMARY KEY, payload BLOB NOT NULL, compressed INTEGER NOT NULL, '
+                + 'expires_at REAL, stored_at REAL NOT NULL, size INTEGER NOT NULL)',
+            )
+            connection.execute(
+                'CREATE INDEX IF NOT EXISTS cache_entries_stored_at ON cache_entries (stored_at)',
+            )
+
+    def _trim(self, connection: sqlite3.Connection) -> int:
+        """Delete the oldest rows until the stored payloads fit ``max_bytes``."""
+        total_bytes = connection.execute('SELECT COALESCE(SUM(size), 0) FROM cache_entries').fetchone()[0]
+        removed = 0
+        while total_bytes > self.max_bytes:
+            row = connection.execute(
+                'SELECT key, size FROM cache_entries ORDER BY stored_at LIMIT 1',
+            ).fetchone()
+            if row is None:
+                break
+            connection.execute('DELETE FROM cache_entries WHERE key = ?', (row[0],))
+            total_bytes -= row[1]
+            removed += 1
+        return removed
+
+    def _decode(self, payload: bytes, compressed: int) -> Any:
+        """Rebuild a stored value."""
+        if compressed:
+            payload = zlib.decompress(payload)
+        return pickle.loads(payload)  # noqa: S301
+
+    def _compact_periodically(self, interval: float) -> None:
+        """Run ``compact`` until the cache is closed."""
+        while not self._closed.wait(interval):
+            try:
+                self.compact()
+            except sqlite3.Error:
+                # Another worker may hold the write lock; retry next round
+                continue
+
+
+class TieredCache(CacheBackend):
+    """Two-tier cache: a per-process memory tier in front of a shared disk tier.
+
+    Disk hits are promoted into memory for their remaining lifetime.
+    """
+
+    def __init__(self, memory: LRUCache, disk: SQLiteCache) -> None:
+        """Combine a memory and a disk backend."""
+        self.memory = memory
+        self.disk = disk
+        self.stats = CacheStats()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value from the fastest tier holding it."""
+        cache_value = self.memory.get(key)
+        if cache_value is not None:
+            self.stats.hits += 1
+            return cache_value
+        return self._promote(key, self.disk.get_entry(key))
+
+    def set(self, key: str, cache_value: Any, ttl: Optional[float] = None, size: int = 0) -> None:
+        """Store a value in both tiers."""
+        self.memory.set(key, cache_value, ttl=ttl, size=size)
+        self.disk.set(key, cache_value, ttl=ttl, size=size)
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """Return the cached value, reading the disk tier from a worker thread on a memory miss."""
+        cache_value = self.memory.get(key)
+        if cache_value is not None:
+            self.stats.hits += 1
+            return cache_value
+        return self._promote(key, await asyncio.to_thread(self.disk.get_entry, key))
+
+    async def aset(self, key: str, cache_value: Any, ttl: Optional[float] = None, size: int = 0) -> None:
+        """Store a value in both tiers, writing the disk tier from a worker thread."""
+        self.memory.set(key, cache_value, ttl=ttl, size=size)
+        await self.disk.aset(key, cache_value, ttl=ttl, size=size)
+
+    def delete(self, key: str) -> None:
+        """Remove a single entry from both tiers."""
+        self.memory.delete(key)
+        self.disk.delete(key)
+
+    def clear(self) -> None:
+        """Remove all entries from both tiers."""
+        self.memory.clear()
+        self.disk.clear()
+
+    def close(self) -> None:
+        """Close the disk tier."""
+        self.disk.close()
+
+    def _promote(self, key: str, entry: Optional[CacheEntry]) -> Optional[Any]:
+        """Copy a disk hit into the memory tier for its remaining lifetime and return its value."""
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        ttl = None if entry.expires_at is None else entry.expires_at - time.time()
+        self.memory.set(key, entry.value, ttl=ttl, size=entry.size)
+        return entry.value
@@ -0,0 +1,226 @@
+"""Command-line interface for the Hunter.io API client."""
+
+import argparse
+import asyncio
+import os
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Optional, get_args
+
+import httpx
+import uvicorn
+from dotenv import load_dotenv
+
+from hunter_client.batch import OPERATIONS, BatchFormat, BatchSummary, run_batch
+from hunter_client.client import create_async_client
+from hunter_client.config import (
+    BATCH_CONCURRENCY,
+    DEFAULT_BACKLOG,
+    DEFAULT_GRACEFUL_TIMEOUT,
+    DEFAULT_HOST,
+    DEFAULT_PORT,
+    DEFAULT_SERVER_KEEPALIVE,
+    SHUTDOWN_DRAIN_TIMEOUT,
+)
+from hunter_client.dependencies import get_cache, get_decode_mode, get_pool_config, read_api_keys
+from hunter_client.response_handler import HunterAPIError
+
+APP_IMPORT_PATH = 'hunter_client.main:app'
+LOOP_CHOICES = ('auto', 'asyncio', 'uvloop')
+HTTP_CHOICES = ('auto', 'h11', 'httptools')
+INTERRUPTED_EXIT_CODE = 130
+
+
+def default_workers() -> int:
+    """Return one worker per CPU core the process may run on."""
+    try:
+        return len(os.sched_getaffinity(0)) or 1
+    except AttributeError:
+        # sched_getaffinity is not available on every platform, e.g. macOS
+        return os.cpu_count() or 1
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the ``hunter-client`` argument parser."""
+    parser = argparse.ArgumentParser(prog='hunter-client', description='Hunter.io API client')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    serve = commands.add_parser(
+        'serve',
+        help='Run the API server with one or more worker processes',
+        description='Run the API server. Workers do not share state: each keeps its own memory cache and '
+        + '/metrics counters, so a scrape through the shared port sees a single worker. The Hunter.io rate '
+        + 'limits are split evenly between workers.',
+    )
+    serve.add_argument('--host', default=DEFAULT_HOST, help='Bind address (default: %(default)s)')
+    serve.add_argument('--port', type=int, default=DEFAULT_PORT, help='Bind port (default: %(default)s)')
+    serve.add_argument(
+        '--workers',
+        type=int,
+        default=default_workers(),
+        help='Worker processes, each with its own /metrics (default: one per CPU core, %(default)s)',
+    )
+    serve.add_argument(
+        '--loop',
+        choices=LOOP_CHOICES,
+        default='auto',
+        help='Event loop; auto picks uvloop when installed (default: %(default)s)',
+    )
+    serve.add_argument(
+        '--http',
+        choices=HTTP_CHOICES,
+        default='auto',
+        help='HTTP parser; auto picks httptools when installed (default: %(default)s)',
+    )
+    serve.add_argument(
+        '--backlog',
+        type=int,
+        default=DEFAULT_BACKLOG,
+        help='Pending connections queued by the listening socket (default: %(default)s)',
+    )
+    serve.add_argument(
+        '--keep-alive',
+        type=int,
+        default=DEFAULT_SERVER_KEEPALIVE,
+        help='Seconds to keep idle client connections open (default: %(default)s)',
+    )
+    serve.add_argument(
+        '--limit-concurrency',
+        type=int,
+        default=None,
+        help='Answer 503 beyond this many concurrent connections per worker',
+    )
+    serve.add_argument(
+        '--graceful-timeout',
+        type=int,
+        default=DEFAULT_GRACEFUL_TIMEOUT,
+        help='Seconds to let open requests finish on shutdown (default: %(default)s)',
+    )
+    serve.add_argument(
+        '--drain-timeout',
+        type=float,
+        default=None,
+        help='Seconds to let in-flight upstream calls finish before closing the client (default: {0})'.format(
+            SHUTDOWN_DRAIN_TIMEOUT,
+        ),
+    )
+    serve.add_argument(
+        '--cache-path',
+        default=None,
+        help='SQLite cache file attached by every worker as a shared tier behind its memory cache',
+    )
+    serve.add_argument('--access-log', action='store_true', help='Log every request')
+    serve.set_defaults(handler=serve_command)
+
+    batch = commands.add_parser(
+        'batch',
+        help='Enrich a CSV or NDJSON file row by row, resuming interrupted runs',
+        description=(
+            'find reads domain plus first_name/last_name or full_name columns; verify reads an email column. '
+            'Rerun the same command to resume after an interruption.'
+        ),
+    )
+    batch.add_argument('operation', choices=sorted(OPERATIONS), help='Lookup to run for every row')
+    batch.add_argument('input', type=Path, help='Input file with a header row (CSV) or one object per line (NDJSON)')
+    batch.add_argument('output', type=Path, help='Output file, written incrementally in input order')
+    batch.add_argument('--input-format', choices=get_args(BatchFormat), help='Default: from the file extension')
+    batch.add_argument('--output-format', choices=get_args(BatchFormat), help='Default: from the file extension')
+    batch.add_argument(
+        '--concurrency',
+        type=int,
+        default=BATCH_CONCURRENCY,
+        help='Lookups in flight at once (default: %(default)s)',
+    )
+    batch.add_argument('--checkpoint', type=Path, help='Progress file (default: OUTPUT.checkpoint)')
+    batch.add_argument(
+        '--cache-path',
+        default=None,
+        help='SQLite cache file, so repeated or resumed lookups do not spend credits again',
+    )
+    batch.set_defaults(handler=batch_command)
+    return parser
+
+
+def serve_command(args: argparse.Namespace) -> int:
+    """Run the API server.
+
+    Workers are started from the app import path, so settings they read at
+    startup are passed through the environment.
+    """
+    if args.cache_path:
+        os.environ['HUNTER_CACHE_PATH'] = args.cache_path
+    if args.drain_timeout is not None:
+        os.environ['HUNTER_DRAIN_TIMEOUT'] = str(args.drain_timeout)
+    os.environ['HUNTER_WORKERS'] = str(args.workers)
+    uvicorn.run(
+        APP_IMPORT_PATH,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        loop=args.loop,
+        http=args.http,
+        backlog=args.backlog,
+        timeout_keep_alive=args.keep_alive,
+        limit_concurrency=args.limit_concurrency,
+        timeout_graceful_shutdown=args.graceful_timeout,
+        access_log=args.access_log,
+    )
+    return 0
+
+
+def batch_command(args: argparse.Namespace) -> int:
+    """Run a batch job, reporting where it stopped if upstream fails."""
+    if args.cache_path:
+        os.environ['HUNTER_CACHE_PATH'] = args.cache_path
+    api_keys = read_api_keys()
+    if not api_keys:
+        print('HUNTER_API_KEY environment variable not set', file=sys.stderr)
+        return 2
+
+    async def run() -> BatchSummary:
+        cache = get_cache()
+        client = create_async_client(api_keys, pool=get_pool_config(), cache=cache, decode_mode=get_decode_mode())
+        try:
+            return await run_batch(
+                client,
+                OPERATIONS[args.operation],
+                args.input,
+                args.output,
+                input_format=args.input_format,
+                output_format=args.output_format,
+                concurrency=args.concurrency,
+                checkpoint_path=args.checkpoint,
+            )
+        finally:
+            await client.aclose()
+            cache.close()
+
+    try:
+        summary = asyncio.run(run())
+    except (HunterAPIError, httpx.HTTPError) as error:
+        print('Stopped: {0}. Rerun the same command to resume.'.format(error), file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        print('Interrupted. Rerun the same command to resume.', file=sys.stderr)
+        return INTERRUPTED_EXIT_CODE
+    print(
+        'Wrote {0} rows ({1} with errors), skipped {2} already completed'.format(
+            summary.written,
+            summary.errors,
+            summary.skipped,
+        ),
+        file=sys.stderr,
+    )
+    return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the ``hunter-client`` command and return its exit status."""
+    load_dotenv()
+    args = build_parser().parse_args(argv)
+    return int(args.handler(args))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,22 +1,153 @@
 """Hunter.io API client."""
 
-from typing import Any
+import logging
+from collections.abc import Sequence
+from typing import Any, Optional, Union
 
-from hunter_client.config import DEFAULT_TIMEOUT
-from hunter_client.http_client import BaseHTTPClient
-from hunter_client.response_handler import HunterAPIError  # noqa: F401
-from hunter_client.services import AccountService, DomainService, EmailService
+import httpx
 
+from hunter_client.cache import CacheBackend
+from hunter_client.config import DEFAULT_TIMEOUT, QUOTA_REFRESH_INTERVAL, REVALIDATE_RATE
+from hunter_client.contacts import ContactStore
+from hunter_client.hedging import HedgePolicy, Hedger
+from hunter_client.http_client import AsyncBaseHTTPClient, BaseHTTPClient, HTTPClientCore, PoolConfig
+from hunter_client.key_pool import APIKeyPool
+from hunter_client.metrics import ClientHooks, ClientMetrics
+from hunter_client.patterns import PatternIndex
+from hunter_client.precheck import PreVerifier
+from hunter_client.rate_limit import AsyncQuotaScheduler, QuotaScheduler, QuotaTracker
+from hunter_client.response_handler import DEFAULT_DECODE_MODE, DecodeMode, HunterAPIError  # noqa: F401
+from hunter_client.retry import RetryPolicy
+from hunter_client.services import (
+    AccountService,
+    AsyncAccountService,
+    AsyncDomainService,
+    AsyncEmailService,
+    DomainService,
+    EmailService,
+)
 
-class HunterClient:
+logger = logging.getLogger(__name__)
+
+
+class _HunterClient:
+    """Client configuration shared by the sync and async Hunter.io clients."""
+
+    _http_client: HTTPClientCore
+
+    @property
+    def cache(self) -> CacheBackend:
+        """Response cache, including its hit/miss/eviction counters."""
+        return self._http_client.cache
+
+    @property
+    def key_pool(self) -> Optional[APIKeyPool]:
+        """API key pool, or None when the client uses a single key."""
+        return self._http_client.key_pool
+
+    @property
+    def hedger(self) -> Optional[Hedger]:
+        """Hedging state with its hedge counters, or None when calls are not hedged."""
+        return self._http_client.hedger
+
+    def add_hook(self, hook: ClientHooks) -> None:
+        """Notify ``hook`` of every upstream call and response validation."""
+        self._http_client.add_hook(hook)
+
+    def instrument(self, metrics: Optional[ClientMetrics] = None) -> ClientMetrics:
+        """Record upstream, validation, cache and credit metrics.
+
+        Pass an existing ``ClientMetrics`` to report into a shared registry.
+        """
+        metrics = metrics if metrics is not None else ClientMetrics()
+        self.add_hook(metrics)
+        metrics.watch_cache(self.cache)
+        return metrics
+
+    def learn_patterns(self, index: Optional[PatternIndex] = None) -> PatternIndex:
+        """Learn domain email patterns from every fresh domain search and finder response.
+
+        Enables ``email.find(..., infer='prefer')``; pass an existing
+        ``PatternIndex`` to share it between clients.
+        """
+        index = index if index is not None else PatternIndex()
+        self._http_client.pattern_index = index
+        self.add_hook(index)
+        return index
+
+    def store_contacts(self, store: Optional[ContactStore] = None) -> ContactStore:
+        """Keep unfiltered domain search pages to answer filtered searches of complete domains locally.
+
+        Pass an existing ``ContactStore`` to share it between clients.
+        """
+        store = store if store is not None else ContactStore()
+        self._http_client.contact_store = store
+        return store
+
+    def pre_verify(self, verifier: Optional[PreVerifier] = None) -> PreVerifier:
+        """Answer verifications certain to fail locally, without spending a credit.
+
+        Covers malformed addresses, disposable domains and domains Hunter.io
+        recently reported without MX records. Pass a configured
+        ``PreVerifier`` to use your own domain lists.
+        """
+        verifier = verifier if verifier is not None else PreVerifier()
+        self._http_client.pre_verifier = verifier
+        self.add_hook(verifier)
+        return verifier
+
+    def _apply_quota_reserve(self, reserve: int) -> Union[QuotaTracker, APIKeyPool]:
+        """Set the reserve on every pooled key, or install a ``QuotaTracker`` for the single key, and return it."""
+        key_pool = self.key_pool
+        if key_pool is not None:
+            key_pool.reserve = reserve
+            return key_pool
+        tracker = QuotaTracker(reserve)
+        self._http_client.quota = tracker
+        return tracker
+
+
+class HunterClient(_HunterClient):
     """Hunter.io API client with service-based architecture."""
 
-    def __init__(self, api_key: str, timeout: float = DEFAULT_TIMEOUT) -> None:
-        """Initialize the Hunter.io client."""
-        self._http_client = BaseHTTPClient(api_key, timeout)
+    _http_client: BaseHTTPClient
+
+    def __init__(
+        self,
+        api_key: Union[str, Sequence[str]],
+        timeout: float = DEFAULT_TIMEOUT,
+        pool: Optional[PoolConfig] = None,
+        cache: Optional[CacheBackend] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+        decode_mode: DecodeMode = DEFAULT_DECODE_MODE,
+        revalidate_rate: float = REVALIDATE_RATE,
+        hedge_policy: Optional[HedgePolicy] = None,
+        workers: int = 1,
+    ) -> None:
+        """Initialize the Hunter.io client.
+
+        Pass several API keys to balance calls across them. ``revalidate_rate``
+        caps background refreshes of stale cache entries per second. A
+        ``hedge_policy`` hedges calls that are slower than usual. ``workers``
+        processes sharing the same keys split the rate limits between them.
+        """
+        self._http_client = BaseHTTPClient(
+            api_key,
+            timeout,
+            pool,
+            cache,
+            retry_policy=retry_policy,
+            transport=transport,
+            decode_mode=decode_mode,
+            revalidate_rate=revalidate_rate,
+            hedge_policy=hedge_policy,
+            workers=workers,
+        )
         self.domain = DomainService(self._http_client)
         self.email = EmailService(self._http_client)
         self.account = AccountService(self._http_client)
+        self._quota_scheduler: Optional[QuotaScheduler] = None
 
     def __enter__(self) -> 'HunterClient':
         """Enter context manager."""
@@ -26,11 +157,172 @@ class HunterClient:
         """Exit context manager."""
         self.close()
 
+    def track_quota(
+        self,
+        reserve: int = 0,
+        interval: float = QUOTA_REFRESH_INTERVAL,
+    ) -> Union[QuotaTracker, APIKeyPool]:
+        """Refresh remaining credits from ``/account`` in the background.
+
+        Billable calls are rejected locally once ``reserve`` credits are left.
+        With several API keys the reserve applies per key: a key reaching it is
+        ejected from the pool until its ``reset_date``, and the pool is returned.
+        """
+        quota = self._apply_quota_reserve(reserve)
+        if isinstance(quota, APIKeyPool):
+            self._quota_scheduler = QuotaScheduler(self.account.refresh_keys, interval)
+        else:
+            tracker = quota
+
+            def refresh_quota() -> None:
+                tracker.update(self.account.refresh_information())
+
+            self._quota_scheduler = QuotaScheduler(refresh_quota, interval)
+        self._quota_scheduler.start()
+        return quota
+
     def close(self) -> None:
         """Close the HTTP client."""
+        if self._quota_scheduler is not None:
+            self._quota_scheduler.stop()
         self._http_client.close()
 
 
-def create_client(api_key: str, timeout: float = DEFAULT_TIMEOUT) -> HunterClient:
+class AsyncHunterClient(_HunterClient):
+    """Asynchronous Hunter.io API client for use inside an event loop."""
+
+    _http_client: AsyncBaseHTTPClient
+
+    def __init__(
+        self,
+        api_key: Union[str, Sequence[str]],
+        timeout: float = DEFAULT_TIMEOUT,
+        pool: Optional[PoolConfig] = None,
+        cache: Optional[CacheBackend] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        decode_mode: DecodeMode = DEFAULT_DECODE_MODE,
+        revalidate_rate: float = REVALIDATE_RATE,
+        hedge_policy: Optional[HedgePolicy] = None,
+        workers: int = 1,
+    ) -> None:
+        """Initialize the async Hunter.io client.
+
+        Pass several API keys to balance calls across them. ``revalidate_rate``
+        caps background refreshes of stale cache entries per second. A
+        ``hedge_policy`` hedges calls that are slower than usual. ``workers``
+        processes sharing the same keys split the rate limits between them.
+        """
+        self._http_client = AsyncBaseHTTPClient(
+            api_key,
+            timeout,
+            pool,
+            cache,
+            retry_policy=retry_policy,
+            transport=transport,
+            decode_mode=decode_mode,
+            revalidate_rate=revalidate_rate,
+            hedge_policy=hedge_policy,
+            workers=workers,
+        )
+        self.domain = AsyncDomainService(self._http_client)
+        self.email = AsyncEmailService(self._http_client)
+        self.account = AsyncAccountService(self._http_client)
+        self._quota_scheduler: Optional[AsyncQuotaScheduler] = None
+
+    async def __aenter__(self) -> 'AsyncHunterClient':
+        """Enter async context manager."""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Exit async context manager."""
+        await self.aclose()
+
+    def track_quota(
+        self,
+        reserve: int = 0,
+        interval: float = QUOTA_REFRESH_INTERVAL,
+    ) -> Union[QuotaTracker, APIKeyPool]:
+        """Refresh remaining credits from ``/account`` in a task on the running loop.
+
+        Billable calls are rejected locally once ``reserve`` credits are left.
+        With several API keys the reserve applies per key: a key reaching it is
+        ejected from the pool until its ``reset_date``, and the pool is returned.
+        """
+        quota = self._apply_quota_reserve(reserve)
+        if isinstance(quota, APIKeyPool):
+            self._quota_scheduler = AsyncQuotaScheduler(self.account.refresh_keys, interval)
+        else:
+            tracker = quota
+
+            async def refresh_quota() -> None:
+                tracker.update(await self.account.refresh_information())
+
+            self._quota_scheduler = AsyncQuotaScheduler(refresh_quota, interval)
+        self._quota_scheduler.start()
+        return quota
+
+    async def aclose(self, drain_timeout: float = 0) -> None:
+        """Close the HTTP client.
+
+        With a ``drain_timeout``, in-flight upstream calls get up to that many
+        seconds to finish first.
+        """
+        if self._quota_scheduler is not None:
+            await self._quota_scheduler.stop()
+        if drain_timeout > 0 and not await self._http_client.drain(drain_timeout):
+            logger.warning(
+                'Closing with %d Hunter.io calls still in flight',
+                self._http_client.active_calls,
+            )
+        await self._http_client.aclose()
+
+
+def create_client(
+    api_key: Union[str, Sequence[str]],
+    timeout: float = DEFAULT_TIMEOUT,
+    pool: Optional[PoolConfig] = None,
+    cache: Optional[CacheBackend] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    decode_mode: DecodeMode = DEFAULT_DECODE_MODE,
+    revalidate_rate: float = REVALIDATE_RATE,
+    hedge_policy: Optional[HedgePolicy] = None,
+    workers: int = 1,
+) -> HunterClient:
     """Create a Hunter client instance."""
-    return HunterClient(api_key=api_key, timeout=timeout)
+    return HunterClient(
+        api_key=api_key,
+        timeout=timeout,
+        pool=pool,
+        cache=cache,
+        retry_policy=retry_policy,
+        decode_mode=decode_mode,
+        revalidate_rate=revalidate_rate,
+        hedge_policy=hedge_policy,
+        workers=workers,
+    )
+
+
+def create_async_client(
+    api_key: Union[str, Sequence[str]],
+    timeout: float = DEFAULT_TIMEOUT,
+    pool: Optional[PoolConfig] = None,
+    cache: Optional[CacheBackend] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    decode_mode: DecodeMode = DEFAULT_DECODE_MODE,
+    revalidate_rate: float = REVALIDATE_RATE,
+    hedge_policy: Optional[HedgePolicy] = None,
+    workers: int = 1,
+) -> AsyncHunterClient:
+    """Create an async Hunter client instance."""
+    return AsyncHunterClient(
+        api_key=api_key,
+        timeout=timeout,
+        pool=pool,
+        cache=cache,
+        retry_policy=retry_policy,
+        decode_mode=decode_mode,
+        revalidate_rate=revalidate_rate,
+        hedge_policy=hedge_policy,
+        workers=workers,
+    )
@@ -2,9 +2,69 @@
 
 HTTP_ERROR_CODE = 500
 HTTP_BAD_REQUEST = 400
+HTTP_NOT_FOUND = 404
+HTTP_TOO_MANY_REQUESTS = 429
+HTTP_SERVICE_UNAVAILABLE = 503
+DEFAULT_HOST = '127.0.0.1'
 DEFAULT_PORT = 8000
+DEFAULT_BACKLOG = 2048
+DEFAULT_SERVER_KEEPALIVE = 5
+DEFAULT_GRACEFUL_TIMEOUT = 30
+SHUTDOWN_DRAIN_TIMEOUT = 10.0
+NDJSON_MEDIA_TYPE = 'application/x-ndjson'
+METRICS_MEDIA_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+TIMING_MAX_SPANS = 1000
+SLOW_REQUEST_DUMP_RATE = 1.0
 DEFAULT_LIMIT = 10
 MAX_LIMIT = 100
 HUNTER_API_BASE_URL = 'https://api.hunter.io/v2'
 DEFAULT_TIMEOUT = 30.0
 CACHE_SIZE = 128
+CACHE_MAX_BYTES = 32 * 1024 * 1024
+SERIALIZED_CACHE_SIZE = 128
+SERIALIZED_CACHE_MAX_BYTES = 16 * 1024 * 1024
+CACHE_COMPRESS_MIN_BYTES = 1024
+DISK_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+DISK_CACHE_COMPACT_INTERVAL = 300.0
+DOMAIN_SEARCH_CACHE_TTL = 24 * 60 * 60.0
+EMAIL_FINDER_CACHE_TTL = 7 * 24 * 60 * 60.0
+EMAIL_VERIFIER_CACHE_TTL = 3 * 24 * 60 * 60.0
+ACCOUNT_CACHE_TTL = 10.0
+DOMAIN_SEARCH_STALE_AFTER = 12 * 60 * 60.0
+EMAIL_VERIFIER_STALE_AFTER = 24 * 60 * 60.0
+REVALIDATE_RATE = 2.0
+REVALIDATE_WORKERS = 2
+DOMAIN_SEARCH_RATE_LIMIT = 15.0
+EMAIL_FINDER_RATE_LIMIT = 15.0
+EMAIL_VERIFIER_RATE_LIMIT = 10.0
+ACCOUNT_RATE_LIMIT = 5.0
+QUOTA_REFRESH_INTERVAL = 60.0
+RATE_LIMIT_PENALTY = 1.0
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+BULK_VERIFY_CONCURRENCY = 10
+BULK_VERIFY_MAX_EMAILS = 50000
+BATCH_CONCURRENCY = 10
+CHECKPOINT_WIDTH = 64
+PATTERN_INDEX_SIZE = 10000
+PATTERN_MIN_CONFIDENCE = 0.8
+PATTERN_MIN_OBSERVATIONS = 2
+CONTACT_STORE_SIZE = 10000
+NO_MX_DOMAIN_TTL = 24 * 60 * 60.0
+NO_MX_CACHE_SIZE = 10000
+GIBBERISH_CONSONANT_RUN = 6
+RETRY_MAX_ATTEMPTS = 3
+RETRY_BACKOFF_BASE = 0.5
+RETRY_BACKOFF_MAX = 8.0
+RETRY_MAX_RETRY_AFTER = 10.0
+RETRY_BUDGET_RATIO = 0.2
+RETRY_BUDGET_MIN_RETRIES = 10
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RESET_TIMEOUT = 30.0
+HEDGE_PERCENTILE = 95.0
+HEDGE_INITIAL_DELAY = 1.0
+HEDGE_MIN_DELAY = 0.05
+HEDGE_BUDGET_RATIO = 0.05
+HEDGE_MIN_SAMPLES = 20
+HEDGE_LATENCY_WINDOW = 1000
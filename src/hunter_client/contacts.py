@@ -0,0 +1,237 @@
+"""Local store of domain search emails for offline filtering."""
+
+import bisect
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Optional
+
+from hunter_client.config import CONTACT_STORE_SIZE, DOMAIN_SEARCH_CACHE_TTL, DOMAIN_SEARCH_STALE_AFTER
+from hunter_client.models.common import Email
+from hunter_client.models.domain import DomainSearchMeta, DomainSearchParams, DomainSearchResponse
+from hunter_client.patterns import normalize_domain
+
+# Email fields that can be filtered on, indexed by lowercase value
+INDEXED_FIELDS = ('type', 'seniority', 'department')
+
+
+def is_unfiltered(search_params: DomainSearchParams) -> bool:
+    """Check whether a search asks for every email of its domain."""
+    return not (search_params.email_type or search_params.seniority or search_params.department)
+
+
+def parse_filter(filter_value: Optional[str]) -> Optional[set[str]]:
+    """Split a comma-separated filter, as Hunter.io accepts it, into lowercase values."""
+    if not filter_value:
+        return None
+    return {part.strip().lower() for part in filter_value.split(',') if part.strip()}
+
+
+class ContactIndex:
+    """Secondary indexes over the complete email list of one domain."""
+
+    def __init__(self, emails: Sequence[Email]) -> None:
+        """Index emails by their filterable fields and by confidence."""
+        self.emails = list(emails)
+        self.by_field: dict[str, dict[str, list[int]]] = {field: {} for field in INDEXED_FIELDS}
+        for position, email in enumerate(self.emails):
+            for field, positions in self.by_field.items():
+                field_value = getattr(email, field)
+                if field_value:
+                    positions.setdefault(field_value.lower(), []).append(position)
+        self.by_confidence = sorted((email.confidence, position) for position, email in enumerate(self.emails))
+
+    def select(
+        self,
+        email_type: Optional[str] = None,
+        seniority: Optional[str] = None,
+        department: Optional[str] = None,
+        min_confidence: int = 0,
+    ) -> list[Email]:
+        """Return the emails matching every given filter, in response order."""
+        selected: Optional[set[int]] = None
+        for field, filter_value in zip(INDEXED_FIELDS, (email_type, seniority, department)):
+            wanted = parse_filter(filter_value)
+            if wanted is None:
+                continue
+            field_index = self.by_field[field]
+            matches = {position for wanted_value in wanted for position in field_index.get(wanted_value, ())}
+            selected = matches if selected is None else selected & matches
+        if min_confidence > 0:
+            first = bisect.bisect_left(self.by_confidence, (min_confidence, -1))
+            confident = {position for _, position in self.by_confidence[first:]}
+            selected = confident if selected is None else selected & confident
+        if selected is None:
+            return list(self.emails)
+        return [self.emails[position] for position in sorted(selected)]
+
+
+@dataclass(frozen=True)
+class StoredPage:
+    """An unfiltered domain search page and when it was recorded."""
+
+    fetched_at: float
+    limit: int
+    page: DomainSearchResponse
+
+
+class DomainContacts:
+    """The unfiltered pages recorded for one domain."""
+
+    def __init__(self) -> None:
+        """Initialize without pages."""
+        self.pages: dict[int, StoredPage] = {}
+        self._index: Optional[ContactIndex] = None
+
+    def record(self, offset: int, limit: int, page: DomainSearchResponse, now: float) -> None:
+        """Replace the page at ``offset``; a short page ends the list, dropping pages past it."""
+        stored = self.pages.get(offset)
+        if stored is not None and stored.page is page:
+            # A repeat served from the response cache is not newer than what is stored
+            return
+        self.pages[offset] = StoredPage(now, limit, page)
+        if len(page.emails) < limit:
+            end = offset + len(page.emails)
+            for later_offset in [known for known in self.pages if known > offset and known >= end]:
+                del self.pages[later_offset]
+        self._index = None
+
+    def oldest(self) -> float:
+        """Return when the least recently recorded page was fetched."""
+        return min(stored.fetched_at for stored in self.pages.values())
+
+    def index(self) -> Optional[ContactIndex]:
+        """Return the indexes over every email, or None until the pages cover the whole list."""
+        if self._index is None:
+            self._index = self._assemble()
+        return self._index
+
+    def _assemble(self) -> Optional[ContactIndex]:
+        """Join contiguous pages from offset 0 up to a known total."""
+        emails: list[Email] = []
+        total = None
+        for offset in sorted(self.pages):
+            if offset > len(emails):
+                return None
+            stored = self.pages[offset]
+            emails.extend(stored.page.emails[len(emails) - offset :])
+            if stored.page.meta is not None:
+                total = stored.page.meta.total_results
+            elif len(stored.page.emails) < stored.limit:
+                total = offset + len(stored.page.emails)
+        if total is None or len(emails) < total:
+            return None
+        return ContactIndex(emails[:total])
+
+
+class ContactStore:
+    """Domain search emails kept per domain to answer filtered searches locally.
+
+    Unfiltered pages are recorded as they are fetched. Once they cover a
+    domain's whole list, any ``email_type``, ``seniority``, ``department``,
+    ``limit`` and ``offset`` combination is answered from secondary indexes
+    instead of a paid call. Answers older than ``stale_after`` seconds are
+    still served while the pages are fetched again; after ``ttl`` seconds
+    the domain is dropped. Only the most recently used ``max_domains`` are
+    kept.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DOMAIN_SEARCH_CACHE_TTL,
+        stale_after: Optional[float] = DOMAIN_SEARCH_STALE_AFTER,
+        max_domains: int = CONTACT_STORE_SIZE,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize an empty store."""
+        self.ttl = ttl
+        self.stale_after = stale_after
+        self.max_domains = max_domains
+        self._clock = clock
+        self._domains: OrderedDict[str, DomainContacts] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of domains with recorded pages."""
+        return len(self._domains)
+
+    def record(self, search_params: DomainSearchParams, page: DomainSearchResponse) -> None:
+        """Record the page answering a search, if it was unfiltered."""
+        if not is_unfiltered(search_params):
+            return
+        domain = normalize_domain(search_params.domain)
+        with self._lock:
+            contacts = self._domains.pop(domain, None) or DomainContacts()
+            contacts.record(search_params.offset, search_params.limit, page, self._clock())
+            self._domains[domain] = contacts
+            while len(self._domains) > self.max_domains:
+                self._domains.popitem(last=False)
+
+    def forget(self, domain: str) -> None:
+        """Drop everything recorded for a domain."""
+        with self._lock:
+            self._domains.pop(normalize_domain(domain), None)
+
+    def page_size(self, domain: str) -> Optional[int]:
+        """Return the limit the domain's first page was fetched with."""
+        with self._lock:
+            contacts = self._domains.get(normalize_domain(domain))
+            first_page = None if contacts is None else contacts.pages.get(0)
+            return None if first_page is None else first_page.limit
+
+    def search(self, search_params: DomainSearchParams) -> tuple[Optional[DomainSearchResponse], bool]:
+        """Answer a search locally, and tell whether the answer is stale.
+
+        Returns ``(None, False)`` unless the domain's list is complete and
+        younger than ``ttl``. The answer carries ``meta`` with the number of
+        matching emails, so callers can paginate it.
+        """
+        lookup = self._lookup(search_params.domain)
+        if lookup is None:
+            return None, False
+        index, info, age = lookup
+        matches = index.select(search_params.email_type, search_params.seniority, search_params.department)
+        answer = info.model_copy(
+            update={
+                'emails': matches[search_params.offset : search_params.offset + search_params.limit],
+                'meta': DomainSearchMeta(
+                    total_results=len(matches),
+                    limit=search_params.limit,
+                    offset=search_params.offset,
+                ),
+            },
+        )
+        return answer, self.stale_after is not None and age >= self.stale_after
+
+    def query(
+        self,
+        domain: str,
+        email_type: Optional[str] = None,
+        seniority: Optional[str] = None,
+        department: Optional[str] = None,
+        min_confidence: int = 0,
+    ) -> Optional[list[Email]]:
+        """Filter a domain's complete email list, or return None if it is not known."""
+        lookup = self._lookup(domain)
+        if lookup is None:
+            return None
+        return lookup[0].select(email_type, seniority, department, min_confidence)
+
+    def _lookup(self, domain: str) -> Optional[tuple[ContactIndex, DomainSearchResponse, float]]:
+        """Return a complete domain's indexes, first page and age, expiring it past ``ttl``."""
+        domain = normalize_domain(domain)
+        with self._lock:
+            contacts = self._domains.get(domain)
+            if contacts is None:
+                return None
+            age = self._clock() - contacts.oldest()
+            if age >= self.ttl:
+                del self._domains[domain]
+                return None
+            index = contacts.index()
+            if index is None:
+                return None
+            self._domains.move_to_end(domain)
+            return index, contacts.pages[0].page, age
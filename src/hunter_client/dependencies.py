@@ -1,19 +1,170 @@
 """Dependency functions for Hunter.io API client."""
 
 import os
+from typing import Optional, cast, get_args
 
-from fastapi import HTTPException
+from fastapi import HTTPException, Request
 
-from hunter_client.client import HunterClient, create_client
-from hunter_client.config import HTTP_ERROR_CODE
+from hunter_client.cache import CacheBackend, LRUCache, SQLiteCache, TieredCache
+from hunter_client.client import AsyncHunterClient, HunterClient, create_async_client, create_client
+from hunter_client.config import (
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    HEDGE_BUDGET_RATIO,
+    HEDGE_PERCENTILE,
+    HTTP_ERROR_CODE,
+    QUOTA_REFRESH_INTERVAL,
+    REVALIDATE_RATE,
+    SHUTDOWN_DRAIN_TIMEOUT,
+    SLOW_REQUEST_DUMP_RATE,
+)
+from hunter_client.hedging import HedgePolicy
+from hunter_client.http_client import PoolConfig
+from hunter_client.metrics import SlowRequestSampler
+from hunter_client.precheck import PreVerifier
+from hunter_client.response_handler import DEFAULT_DECODE_MODE, DecodeMode
+
+TRUTHY_VALUES = frozenset(('1', 'true', 'yes', 'on'))
+
+
+def read_api_keys() -> list[str]:
+    """Read comma-separated ``HUNTER_API_KEYS``, falling back to ``HUNTER_API_KEY``."""
+    api_keys = os.getenv('HUNTER_API_KEYS') or os.getenv('HUNTER_API_KEY') or ''
+    return [api_key.strip() for api_key in api_keys.split(',') if api_key.strip()]
+
+
+def get_api_keys() -> list[str]:
+    """Read the Hunter.io API keys from the environment."""
+    api_keys = read_api_keys()
+    if not api_keys:
+        raise HTTPException(
+            status_code=HTTP_ERROR_CODE,
+            detail='HUNTER_API_KEY environment variable not set',
+        )
+    return api_keys
+
+
+def get_pool_config() -> PoolConfig:
+    """Build connection pool settings from ``HUNTER_*`` environment variables."""
+    return PoolConfig(
+        max_connections=int(os.getenv('HUNTER_MAX_CONNECTIONS', DEFAULT_MAX_CONNECTIONS)),
+        max_keepalive_connections=int(
+            os.getenv('HUNTER_MAX_KEEPALIVE_CONNECTIONS', DEFAULT_MAX_KEEPALIVE_CONNECTIONS),
+        ),
+        keepalive_expiry=float(os.getenv('HUNTER_KEEPALIVE_EXPIRY', DEFAULT_KEEPALIVE_EXPIRY)),
+        http2=os.getenv('HUNTER_HTTP2', '').lower() in TRUTHY_VALUES,
+    )
+
+
+def get_decode_mode() -> DecodeMode:
+    """Read the response decoding mode from ``HUNTER_DECODE_MODE``."""
+    decode_mode = os.getenv('HUNTER_DECODE_MODE', DEFAULT_DECODE_MODE)
+    if decode_mode not in get_args(DecodeMode):
+        raise ValueError(
+            'HUNTER_DECODE_MODE must be one of {0}, got {1!r}'.format(', '.join(get_args(DecodeMode)), decode_mode),
+        )
+    return cast(DecodeMode, decode_mode)
+
+
+def get_workers() -> int:
+    """Read how many server workers share the API keys from ``HUNTER_WORKERS``."""
+    return max(int(os.getenv('HUNTER_WORKERS') or 1), 1)
+
+
+def get_drain_timeout() -> float:
+    """Read how long shutdown waits for in-flight upstream calls from ``HUNTER_DRAIN_TIMEOUT``."""
+    return float(os.getenv('HUNTER_DRAIN_TIMEOUT', SHUTDOWN_DRAIN_TIMEOUT))
+
+
+def get_slow_request_sampler() -> Optional[SlowRequestSampler]:
+    """Build the slow-request trace sampler when ``HUNTER_SLOW_REQUEST_THRESHOLD`` (seconds) is set."""
+    threshold = os.getenv('HUNTER_SLOW_REQUEST_THRESHOLD')
+    if not threshold:
+        return None
+    return SlowRequestSampler(
+        float(threshold),
+        rate=float(os.getenv('HUNTER_SLOW_REQUEST_DUMP_RATE', SLOW_REQUEST_DUMP_RATE)),
+    )
+
+
+def get_hedge_policy() -> Optional[HedgePolicy]:
+    """Build the hedging policy when ``HUNTER_HEDGE`` is enabled.
+
+    Only endpoints that spend no credits are hedged unless
+    ``HUNTER_HEDGE_ENDPOINTS`` lists the paths to hedge, comma-separated.
+    """
+    if os.getenv('HUNTER_HEDGE', '').lower() not in TRUTHY_VALUES:
+        return None
+    endpoints = os.getenv('HUNTER_HEDGE_ENDPOINTS', '')
+    return HedgePolicy(
+        percentile=float(os.getenv('HUNTER_HEDGE_PERCENTILE', HEDGE_PERCENTILE)),
+        budget_ratio=float(os.getenv('HUNTER_HEDGE_BUDGET', HEDGE_BUDGET_RATIO)),
+        endpoints=frozenset(path.strip() for path in endpoints.split(',') if path.strip()) or None,
+    )
+
+
+def get_cache() -> CacheBackend:
+    """Build the response cache, adding a shared disk tier when ``HUNTER_CACHE_PATH`` is set."""
+    cache_path = os.getenv('HUNTER_CACHE_PATH')
+    if not cache_path:
+        return LRUCache()
+    return TieredCache(LRUCache(), SQLiteCache(cache_path))
 
 
 def get_client() -> HunterClient:
     """Get Hunter.io client instance."""
-    api_key = os.getenv('HUNTER_API_KEY')
-    if not api_key:
+    return create_client(
+        get_api_keys(),
+        pool=get_pool_config(),
+        decode_mode=get_decode_mode(),
+        workers=get_workers(),
+    )
+
+
+def open_shared_client() -> Optional[AsyncHunterClient]:
+    """Create the process-wide async client, or None when no API key is configured.
+
+    Must be called from the running event loop when quota tracking is enabled.
+    """
+    api_keys = read_api_keys()
+    if not api_keys:
+        return None
+    client = create_async_client(
+        api_keys,
+        pool=get_pool_config(),
+        cache=get_cache(),
+        decode_mode=get_decode_mode(),
+        revalidate_rate=float(os.getenv('HUNTER_REVALIDATE_RATE', REVALIDATE_RATE)),
+        hedge_policy=get_hedge_policy(),
+        workers=get_workers(),
+    )
+    if os.getenv('HUNTER_LEARN_PATTERNS', '').lower() in TRUTHY_VALUES:
+        client.learn_patterns()
+    if os.getenv('HUNTER_CONTACT_STORE', '').lower() in TRUTHY_VALUES:
+        client.store_contacts()
+    if os.getenv('HUNTER_PRECHECK', '').lower() in TRUTHY_VALUES:
+        client.pre_verify(
+            PreVerifier(
+                disposable_path=os.getenv('HUNTER_DISPOSABLE_DOMAINS_PATH') or None,
+                webmail_path=os.getenv('HUNTER_WEBMAIL_DOMAINS_PATH') or None,
+            ),
+        )
+    quota_reserve = os.getenv('HUNTER_QUOTA_RESERVE')
+    if quota_reserve:
+        client.track_quota(
+            reserve=int(quota_reserve),
+            interval=float(os.getenv('HUNTER_QUOTA_REFRESH_INTERVAL', QUOTA_REFRESH_INTERVAL)),
+        )
+    return client
+
+
+def get_shared_client(request: Request) -> AsyncHunterClient:
+    """Return the app-lifespan client shared by all routes."""
+    client: Optional[AsyncHunterClient] = getattr(request.app.state, 'hunter_client', None)
+    if client is None:
         raise HTTPException(
             status_code=HTTP_ERROR_CODE,
             detail='HUNTER_API_KEY environment variable not set',
         )
-    return create_client(api_key)
+    return client
@@ -0,0 +1,215 @@
+"""Columnar storage of domain search emails."""
+
+import importlib
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import Any, Optional
+
+from hunter_client.models.common import Email
+
+# Free-text fields, kept as plain lists of strings
+EMAIL_TEXT_COLUMNS = ('email_value', 'first_name', 'last_name', 'position', 'linkedin', 'twitter', 'phone_number')
+# Fields with few distinct values, dictionary-encoded
+EMAIL_CATEGORY_COLUMNS = ('type', 'seniority', 'department')
+SOURCE_CATEGORY_COLUMNS = ('domain', 'extracted_on', 'last_seen_on')
+
+
+def _import_optional(module_name: str) -> Any:
+    """Import an export dependency, naming the extra that provides it."""
+    try:
+        return importlib.import_module(module_name)
+    except ImportError as error:
+        raise ImportError(
+            '{0} is required for this export; install hunter-client[analytics]'.format(module_name),
+        ) from error
+
+
+def _text(field_value: Any) -> Optional[str]:
+    """Store URLs and other values by their string form."""
+    return None if field_value is None else str(field_value)
+
+
+class DictionaryColumn:
+    """Strings stored as int32 codes into their distinct values; code 0 is None."""
+
+    def __init__(self) -> None:
+        """Initialize an empty column."""
+        self.codes = array('i')
+        self.values: list[Optional[str]] = [None]
+        self._codes_by_value: dict[Optional[str], int] = {None: 0}
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.codes)
+
+    def __getitem__(self, row: int) -> Optional[str]:
+        """Return the string of a row."""
+        return self.values[self.codes[row]]
+
+    def append(self, column_value: Optional[str]) -> None:
+        """Add a row, reusing the code of a value seen before."""
+        code = self._codes_by_value.get(column_value)
+        if code is None:
+            code = len(self.values)
+            self.values.append(column_value)
+            self._codes_by_value[column_value] = code
+        self.codes.append(code)
+
+
+class EmailTable:
+    """Domain search emails stored column-wise instead of as ``Email`` models.
+
+    Repeated strings (type, seniority, department and source domains and
+    dates) are dictionary-encoded. Numbers, string codes and the offsets of
+    each email's sources live in ``array`` buffers that ``to_numpy`` and
+    ``to_arrow`` wrap without copying; the table cannot grow while such views
+    are alive. ``Email`` models are only built when a row is read.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty table."""
+        self.confidence = array('i')
+        self.text: dict[str, list[Optional[str]]] = {column: [] for column in EMAIL_TEXT_COLUMNS}
+        self.categories = {column: DictionaryColumn() for column in EMAIL_CATEGORY_COLUMNS}
+        self.source_offsets = array('i', [0])
+        self.source_uri: list[str] = []
+        self.source_categories = {column: DictionaryColumn() for column in SOURCE_CATEGORY_COLUMNS}
+        self.source_still_on_page = array('b')
+
+    @classmethod
+    def from_emails(cls, emails: Iterable[Email]) -> 'EmailTable':
+        """Build a table from emails, which can be dropped as they are added."""
+        table = cls()
+        table.extend(emails)
+        return table
+
+    def __len__(self) -> int:
+        """Return the number of emails."""
+        return len(self.confidence)
+
+    def __getitem__(self, row: int) -> Email:
+        """Build the ``Email`` model of a row."""
+        return Email.model_validate(self.row(row))
+
+    def __iter__(self) -> Iterator[Email]:
+        """Build ``Email`` models one row at a time."""
+        for row in range(len(self)):
+            yield self[row]
+
+    def append(self, email: Email) -> None:
+        """Add an email."""
+        self.confidence.append(email.confidence)
+        for text_column, column_values in self.text.items():
+            column_values.append(_text(getattr(email, text_column)))
+        for category_column, category_values in self.categories.items():
+            category_values.append(getattr(email, category_column))
+        for source in email.sources:
+            self.source_uri.append(str(source.uri))
+            for source_column, source_values in self.source_categories.items():
+                source_values.append(getattr(source, source_column))
+            self.source_still_on_page.append(source.still_on_page)
+        self.source_offsets.append(len(self.source_uri))
+
+    def extend(self, emails: Iterable[Email]) -> None:
+        """Add emails in order."""
+        for email in emails:
+            self.append(email)
+
+    def row(self, row: int) -> dict[str, Any]:
+        """Return the fields of a row as plain values, without validating them."""
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError('EmailTable index out of range')
+        fields: dict[str, Any] = {column: column_values[row] for column, column_values in self.text.items()}
+        fields.update((column, category_values[row]) for column, category_values in self.categories.items())
+        fields['confidence'] = self.confidence[row]
+        fields['sources'] = [self._source(index) for index in range(*self.source_offsets[row : row + 2])]
+        return fields
+
+    def _source(self, index: int) -> dict[str, Any]:
+        """Return the fields of one source as plain values."""
+        source: dict[str, Any] = {
+            column: source_values[index] for column, source_values in self.source_categories.items()
+        }
+        source['uri'] = self.source_uri[index]
+        source['still_on_page'] = bool(self.source_still_on_page[index])
+        return source
+
+    def to_numpy(self) -> dict[str, Any]:
+        """Return the columns as NumPy arrays.
+
+        Numbers, category codes (into ``categories[name].values``, or
+        ``source_categories`` for ``source_*`` columns) and source offsets are
+        views of the table's buffers; free text is copied into object arrays.
+        """
+        np = _import_optional('numpy')
+        columns = {'confidence': np.frombuffer(self.confidence, dtype=np.int32)}
+        columns.update((column, np.array(column_values, dtype=object)) for column, column_values in self.text.items())
+        columns.update(
+            (column, np.frombuffer(category_values.codes, dtype=np.int32))
+            for column, category_values in self.categories.items()
+        )
+        columns['source_offsets'] = np.frombuffer(self.source_offsets, dtype=np.int32)
+        columns['source_uri'] = np.array(self.source_uri, dtype=object)
+        columns.update(
+            ('source_{0}'.format(column), np.frombuffer(source_values.codes, dtype=np.int32))
+            for column, source_values in self.source_categories.items()
+        )
+        columns['source_still_on_page'] = np.frombuffer(self.source_still_on_page, dtype=np.bool_)
+        return columns
+
+    def to_records(self) -> Any:
+        """Return one NumPy structured array row per email, with category codes and without sources.
+
+        Rows interleave the columns, so unlike ``to_numpy`` this copies them.
+        """
+        np = _import_optional('numpy')
+        columns = self.to_numpy()
+        names = ['email_value', 'confidence', *EMAIL_CATEGORY_COLUMNS, *EMAIL_TEXT_COLUMNS[1:]]
+        return np.rec.fromarrays([columns[name] for name in names], names=names)
+
+    def to_arrow(self) -> Any:
+        """Return a ``pyarrow.Table`` with one row per email and a list of sources.
+
+        Numbers, category codes and source offsets share the table's buffers;
+        categories become dictionary columns and free text is copied.
+        """
+        pa = _import_optional('pyarrow')
+        pc = _import_optional('pyarrow.compute')
+        sources = pa.StructArray.from_arrays(
+            [
+                *(_dictionary_array(pa, pc, source_values) for source_values in self.source_categories.values()),
+                pa.array(self.source_uri, type=pa.string()),
+                _buffer_array(pa, pa.int8(), self.source_still_on_page).cast(pa.bool_()),
+            ],
+            names=[*SOURCE_CATEGORY_COLUMNS, 'uri', 'still_on_page'],
+        )
+        columns = {
+            'email_value': pa.array(self.text['email_value'], type=pa.string()),
+            'confidence': _buffer_array(pa, pa.int32(), self.confidence),
+            **{
+                column: _dictionary_array(pa, pc, category_values)
+                for column, category_values in self.categories.items()
+            },
+            **{column: pa.array(self.text[column], type=pa.string()) for column in EMAIL_TEXT_COLUMNS[1:]},
+            'sources': pa.ListArray.from_arrays(_buffer_array(pa, pa.int32(), self.source_offsets), sources),
+        }
+        return pa.table(columns)
+
+
+def _buffer_array(pa: Any, arrow_type: Any, column_values: 'array[int]') -> Any:
+    """Wrap an ``array`` buffer as an Arrow array without copying it."""
+    return pa.Array.from_buffers(arrow_type, len(column_values), [None, pa.py_buffer(column_values)])
+
+
+def _dictionary_array(pa: Any, pc: Any, column: DictionaryColumn) -> Any:
+    """Wrap a dictionary column as an Arrow dictionary array sharing its codes.
+
+    Code 0 stands for None, so the validity bitmap is derived from the codes.
+    """
+    codes_buffer = pa.py_buffer(column.codes)
+    codes = pa.Array.from_buffers(pa.int32(), len(column), [None, codes_buffer])
+    validity = pc.not_equal(codes, 0).buffers()[1]
+    indices = pa.Array.from_buffers(pa.int32(), len(column), [validity, codes_buffer])
+    return pa.DictionaryArray.from_arrays(indices, pa.array(column.values, type=pa.string()))
@@ -3,8 +3,23 @@
 from dataclasses import dataclass
 from typing import Any, Optional
 
+from hunter_client.cache import CachePolicy
+from hunter_client.config import (
+    ACCOUNT_CACHE_TTL,
+    ACCOUNT_RATE_LIMIT,
+    DOMAIN_SEARCH_CACHE_TTL,
+    DOMAIN_SEARCH_RATE_LIMIT,
+    DOMAIN_SEARCH_STALE_AFTER,
+    EMAIL_FINDER_CACHE_TTL,
+    EMAIL_FINDER_RATE_LIMIT,
+    EMAIL_VERIFIER_CACHE_TTL,
+    EMAIL_VERIFIER_RATE_LIMIT,
+    EMAIL_VERIFIER_STALE_AFTER,
+)
 from hunter_client.models.domain import DomainSearchParams
 
+DEFAULT_CACHE_POLICY = CachePolicy()
+
 
 @dataclass
 class EndpointConfig:
@@ -12,15 +27,54 @@ class EndpointConfig:
 
     path: str
     method: str = 'GET'
+    cache_policy: CachePolicy = DEFAULT_CACHE_POLICY
+    rate_limit: Optional[float] = None
+    billable: bool = True
 
 
 class HunterEndpoints:
     """Hunter.io API endpoints."""
 
-    domain_search = EndpointConfig('/domain-search')
-    email_finder = EndpointConfig('/email-finder')
-    email_verifier = EndpointConfig('/email-verifier')
-    account = EndpointConfig('/account')
+    domain_search = EndpointConfig(
+        '/domain-search',
+        cache_policy=CachePolicy(ttl=DOMAIN_SEARCH_CACHE_TTL, stale_after=DOMAIN_SEARCH_STALE_AFTER),
+        rate_limit=DOMAIN_SEARCH_RATE_LIMIT,
+    )
+    email_finder = EndpointConfig(
+        '/email-finder',
+        cache_policy=CachePolicy(ttl=EMAIL_FINDER_CACHE_TTL),
+        rate_limit=EMAIL_FINDER_RATE_LIMIT,
+    )
+    email_verifier = EndpointConfig(
+        '/email-verifier',
+        cache_policy=CachePolicy(ttl=EMAIL_VERIFIER_CACHE_TTL, stale_after=EMAIL_VERIFIER_STALE_AFTER),
+        rate_limit=EMAIL_VERIFIER_RATE_LIMIT,
+    )
+    account = EndpointConfig(
+        '/account',
+        cache_policy=CachePolicy(ttl=ACCOUNT_CACHE_TTL),
+        rate_limit=ACCOUNT_RATE_LIMIT,
+        billable=False,
+    )
+
+
+def get_endpoint_config(path: str) -> Optional[EndpointConfig]:
+    """Return the configuration of a known endpoint path."""
+    for endpoint in (
+        HunterEndpoints.domain_search,
+        HunterEndpoints.email_finder,
+        HunterEndpoints.email_verifier,
+        HunterEndpoints.account,
+    ):
+        if endpoint.path == path:
+            return endpoint
+    return None
+
+
+def get_cache_policy(path: str) -> CachePolicy:
+    """Return the cache policy configured for an endpoint path."""
+    endpoint = get_endpoint_config(path)
+    return endpoint.cache_policy if endpoint is not None else DEFAULT_CACHE_POLICY
 
 
 def build_domain_search_params(search_params: DomainSearchParams) -> dict[str, Any]:
@@ -0,0 +1,126 @@
+"""Hedged requests: a second attempt for calls slower than usual."""
+
+import bisect
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+
+from hunter_client.config import (
+    HEDGE_BUDGET_RATIO,
+    HEDGE_INITIAL_DELAY,
+    HEDGE_LATENCY_WINDOW,
+    HEDGE_MIN_DELAY,
+    HEDGE_MIN_SAMPLES,
+    HEDGE_PERCENTILE,
+)
+from hunter_client.rate_limit import is_billable
+from hunter_client.retry import RetryBudget
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    """When a slow GET gets a second, concurrent attempt.
+
+    The hedge is sent once the first attempt has been waiting longer than the
+    ``percentile`` of the endpoint's last ``window`` latencies, or
+    ``initial_delay`` until ``min_samples`` are known, but never sooner than
+    ``min_delay``. Hedges are capped at ``budget_ratio`` of calls. Only the
+    ``endpoints`` paths are hedged; None hedges only endpoints that spend no
+    credits, since a hedge that Hunter.io answers may be billed even when it
+    loses.
+    """
+
+    percentile: float = HEDGE_PERCENTILE
+    initial_delay: float = HEDGE_INITIAL_DELAY
+    min_delay: float = HEDGE_MIN_DELAY
+    budget_ratio: float = HEDGE_BUDGET_RATIO
+    min_samples: int = HEDGE_MIN_SAMPLES
+    window: int = HEDGE_LATENCY_WINDOW
+    endpoints: Optional[frozenset[str]] = None
+
+    def hedges(self, endpoint: str) -> bool:
+        """Check whether calls to an endpoint may be hedged."""
+        if self.endpoints is None:
+            return not is_billable(endpoint)
+        return endpoint in self.endpoints
+
+
+class LatencyWindow:
+    """The most recent latencies of one endpoint, also kept sorted for percentile lookups."""
+
+    def __init__(self, size: int) -> None:
+        """Initialize an empty window of ``size`` latencies."""
+        self.size = size
+        self._recent: deque[float] = deque()
+        self._sorted: list[float] = []
+
+    def __len__(self) -> int:
+        """Return the number of latencies in the window."""
+        return len(self._recent)
+
+    def add(self, seconds: float) -> None:
+        """Add a latency, dropping the oldest once the window is full."""
+        if len(self._recent) >= self.size:
+            oldest = self._recent.popleft()
+            del self._sorted[bisect.bisect_left(self._sorted, oldest)]
+        self._recent.append(seconds)
+        bisect.insort(self._sorted, seconds)
+
+    def percentile(self, percentile: float) -> float:
+        """Return the latency below which ``percentile`` percent of the window falls."""
+        index = int(len(self._sorted) * percentile / 100)
+        return self._sorted[min(index, len(self._sorted) - 1)]
+
+
+class Hedger:
+    """Decides when a client hedges and learns each endpoint's latency.
+
+    ``hedges`` counts hedges sent and ``hedge_wins`` those that answered first.
+    """
+
+    def __init__(self, policy: HedgePolicy) -> None:
+        """Initialize with no latencies known and an empty budget."""
+        self.policy = policy
+        self.hedges = 0
+        self.hedge_wins = 0
+        self._budget = RetryBudget(policy.budget_ratio, 0)
+        self._windows: dict[str, LatencyWindow] = {}
+        self._lock = threading.Lock()
+
+    def delay(self, endpoint: str) -> Optional[float]:
+        """Return how long a call may wait before it is hedged, or None if the endpoint is not hedged.
+
+        Every hedgeable call credits the budget.
+        """
+        policy = self.policy
+        if not policy.hedges(endpoint):
+            return None
+        self._budget.deposit()
+        with self._lock:
+            window = self._windows.get(endpoint)
+            if window is None or len(window) < policy.min_samples:
+                return max(policy.initial_delay, policy.min_delay)
+            return max(window.percentile(policy.percentile), policy.min_delay)
+
+    def observe(self, endpoint: str, seconds: float) -> None:
+        """Record how long an attempt took to answer."""
+        with self._lock:
+            window = self._windows.get(endpoint)
+            if window is None:
+                window = LatencyWindow(self.policy.window)
+                self._windows[endpoint] = window
+            window.add(seconds)
+
+    def try_hedge(self) -> bool:
+        """Spend one hedge if the budget allows it."""
+        if not self._budget.withdraw():
+            return False
+        with self._lock:
+            self.hedges += 1
+        return True
+
+    def hedge_won(self) -> None:
+        """Count a hedge that answered before the attempt it hedged."""
+        with self._lock:
+            self.hedge_wins += 1
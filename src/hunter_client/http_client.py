@@ -1,73 +1,821 @@
-"""Base HTTP client for Hunter.io API."""
+"""Base HTTP clients for Hunter.io API."""
 
-from typing import Any, Optional
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+import warnings
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Optional, Union, cast
+from urllib.parse import urlencode
 
 import httpx
 
-from hunter_client.config import CACHE_SIZE, DEFAULT_TIMEOUT, HUNTER_API_BASE_URL
+from hunter_client.cache import CacheBackend, CachePolicy, LRUCache, StaleableValue
+from hunter_client.config import (
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    DEFAULT_TIMEOUT,
+    HTTP_BAD_REQUEST,
+    HTTP_ERROR_CODE,
+    HTTP_TOO_MANY_REQUESTS,
+    HUNTER_API_BASE_URL,
+    RATE_LIMIT_PENALTY,
+    REVALIDATE_RATE,
+    REVALIDATE_WORKERS,
+)
+from hunter_client.contacts import ContactStore
+from hunter_client.endpoints import get_cache_policy
+from hunter_client.hedging import HedgePolicy, Hedger
+from hunter_client.key_pool import APIKeyPool, PooledKey
+from hunter_client.metrics import CANCELLED_STATUS, TRANSPORT_ERROR_STATUS, ClientHooks
+from hunter_client.patterns import PatternIndex
+from hunter_client.precheck import PreVerifier
+from hunter_client.rate_limit import QuotaExceededError, QuotaTracker, RateLimiter, TokenBucket
+from hunter_client.response_handler import (
+    DEFAULT_DECODE_MODE,
+    DecodeMode,
+    HunterAPIError,
+    ResponseType,
+    check_http_status,
+    parse_json_response,
+    process_api_response,
+    validate_response_json,
+    validate_response_model,
+)
+from hunter_client.retry import RETRYABLE_EXCEPTIONS, CircuitBreakerRegistry, RetryBudget, RetryPolicy
+from hunter_client.singleflight import AsyncSingleFlight, SingleFlight
+from hunter_client.timing import current_timings, measure, measure_wait, start_upstream_trace
 
+logger = logging.getLogger(__name__)
 
-class BaseHTTPClient:
-    """Base HTTP client with common functionality."""
 
-    def __init__(self, api_key: str, timeout: float = DEFAULT_TIMEOUT) -> None:
-        """Initialize the HTTP client."""
-        self.api_key = api_key
+@dataclass(frozen=True)
+class PoolConfig:
+    """Connection pool settings for the underlying httpx client.
+
+    HTTP/2 requires the optional ``h2`` package (``pip install hunter-client[http2]``).
+    """
+
+    max_connections: int = DEFAULT_MAX_CONNECTIONS
+    max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+    keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY
+    http2: bool = False
+
+    def to_limits(self) -> httpx.Limits:
+        """Convert to ``httpx.Limits``."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+class HTTPClientCore(ABC):
+    """Transport-independent state and helpers shared by sync and async clients."""
+
+    def __init__(
+        self,
+        api_key: Union[str, Sequence[str]],
+        timeout: float = DEFAULT_TIMEOUT,
+        pool: Optional[PoolConfig] = None,
+        cache: Optional[CacheBackend] = None,
+        cache_policies: Optional[dict[str, CachePolicy]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        quota: Optional[QuotaTracker] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+        transport: Optional[Union[httpx.BaseTransport, httpx.AsyncBaseTransport]] = None,
+        hooks: Optional[list[ClientHooks]] = None,
+        decode_mode: DecodeMode = DEFAULT_DECODE_MODE,
+        revalidate_rate: float = REVALIDATE_RATE,
+        hedge_policy: Optional[HedgePolicy] = None,
+        workers: int = 1,
+    ) -> None:
+        """Initialize shared client state and open the underlying httpx client.
+
+        ``cache_policies`` overrides the per-endpoint defaults from
+        ``HunterEndpoints``, keyed by endpoint path. A default ``RateLimiter``
+        using the documented Hunter.io rates is installed unless one is given;
+        quota is only enforced when a ``QuotaTracker`` is supplied. Pass
+        ``RetryPolicy(max_attempts=1)`` to disable retries. ``transport``
+        replaces the network layer, e.g. with ``httpx.MockTransport`` in tests.
+        ``hooks`` are notified of every upstream attempt and validation.
+        ``decode_mode='fast'`` validates response bytes in one pydantic-core
+        pass instead of decoding them to a dict first. Several API keys form an
+        ``APIKeyPool`` that routes each call, with its own rate limits, to the
+        key with the most credits left or the least load. Stale cache entries
+        are refreshed in the background at most ``revalidate_rate`` times per
+        second; ``0`` disables background refreshes. A ``hedge_policy`` sends
+        a second attempt for calls slower than the endpoint usually is and
+        takes whichever answers first. ``workers`` processes sharing the same
+        keys split the default rate limits between them.
+        """
+        api_keys = [api_key] if isinstance(api_key, str) else list(dict.fromkeys(api_key))
+        if not api_keys:
+            raise ValueError('At least one Hunter.io API key is required')
+        self.api_key = api_keys[0]
+        self.key_pool = APIKeyPool(api_keys, workers=workers) if len(api_keys) > 1 else None
         self.timeout = timeout
-        self._client = httpx.Client(
-            base_url=HUNTER_API_BASE_URL,
-            timeout=timeout,
-            params={'api_key': api_key},
+        self.pool = pool or PoolConfig()
+        self.cache = cache if cache is not None else LRUCache()
+        self.cache_policies = cache_policies or {}
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter(workers=workers)
+        self.quota = quota
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breakers = circuit_breakers if circuit_breakers is not None else CircuitBreakerRegistry()
+        self.transport = transport
+        self.hooks = list(hooks or [])
+        self.decode_mode = decode_mode
+        self.pattern_index: Optional[PatternIndex] = None
+        self.contact_store: Optional[ContactStore] = None
+        self.pre_verifier: Optional[PreVerifier] = None
+        self.revalidation_bucket = TokenBucket(revalidate_rate) if revalidate_rate > 0 else None
+        self._revalidating: set[str] = set()
+        self._revalidating_lock = threading.Lock()
+        self._retry_budget = RetryBudget(self.retry_policy.budget_ratio, self.retry_policy.budget_min_retries)
+        self.hedger = Hedger(hedge_policy) if hedge_policy is not None else None
+        self._open()
+
+    @abstractmethod
+    def _open(self) -> None:
+        """Create the underlying httpx client and request coalescer."""
+
+    def _client_options(self) -> dict[str, Any]:
+        """Build keyword arguments for the underlying httpx client."""
+        return {
+            'base_url': HUNTER_API_BASE_URL,
+            'timeout': self.timeout,
+            # Pooled keys are added per request instead
+            'params': {'api_key': self.api_key} if self.key_pool is None else {},
+            'limits': self.pool.to_limits(),
+            'http2': self.pool.http2,
+            'transport': self.transport,
+        }
+
+    def _clean_params(self, request_params: dict[str, Any]) -> dict[str, Any]:
+        """Remove None values from parameters."""
+        return {key: params_value for key, params_value in request_params.items() if params_value is not None}
+
+    def create_cache_key(self, endpoint: str, request_params: dict[str, Any]) -> str:
+        """Create a normalized cache key from endpoint and params."""
+        sorted_params = sorted(self._clean_params(request_params).items())
+        return '{0}?{1}'.format(endpoint, urlencode(sorted_params))
+
+    def get_cache_policy(self, endpoint: str) -> CachePolicy:
+        """Return the effective cache policy for an endpoint path."""
+        policy = self.cache_policies.get(endpoint)
+        return policy if policy is not None else get_cache_policy(endpoint)
+
+    def lookup_result(self, endpoint: str, cache_key: str) -> Optional[Any]:
+        """Return a cached parsed result if caching applies to this endpoint."""
+        return self.lookup_entry(endpoint, cache_key)[0]
+
+    def lookup_entry(self, endpoint: str, cache_key: str) -> tuple[Optional[Any], bool]:
+        """Return a cached parsed result and whether it is past its soft TTL."""
+        if not self.get_cache_policy(endpoint).enabled:
+            return None, False
+        return unwrap_staleable(self.cache.get(cache_key))
+
+    def store_result(self, endpoint: str, cache_key: str, cache_value: Any, response: httpx.Response) -> None:
+        """Store a parsed result according to the endpoint cache policy.
+
+        The entry is accounted at the size of the upstream body it was built from.
+        """
+        cache_write = self._cache_write(endpoint, cache_value, response)
+        if cache_write is not None:
+            self.cache.set(cache_key, cache_write[0], ttl=cache_write[1], size=len(response.content))
+
+    def _cache_write(
+        self,
+        endpoint: str,
+        cache_value: Any,
+        response: httpx.Response,
+    ) -> Optional[tuple[Any, Optional[float]]]:
+        """Return the value to cache for a parsed result and its TTL, or None if the policy does not cache it."""
+        policy = self.get_cache_policy(endpoint)
+        if not policy.enabled or not is_cacheable_status(response.status_code, policy):
+            return None
+        if policy.stale_after is not None:
+            cache_value = StaleableValue(cache_value, time.time() + policy.stale_after)
+        return cache_value, policy.ttl
+
+    def _begin_revalidation(self, cache_key: str) -> bool:
+        """Claim a background refresh unless one is running for the key or the refresh rate is spent."""
+        if self.revalidation_bucket is None:
+            return False
+        with self._revalidating_lock:
+            if cache_key in self._revalidating or not self.revalidation_bucket.try_acquire():
+                return False
+            self._revalidating.add(cache_key)
+            return True
+
+    def _end_revalidation(self, cache_key: str) -> None:
+        """Release a background refresh claimed with ``_begin_revalidation``."""
+        with self._revalidating_lock:
+            self._revalidating.discard(cache_key)
+
+    def add_hook(self, hook: ClientHooks) -> None:
+        """Notify ``hook`` of subsequent upstream calls and validations."""
+        self.hooks.append(hook)
+
+    def parse_response(
+        self,
+        endpoint: str,
+        response: httpx.Response,
+        response_model: type[ResponseType],
+    ) -> ResponseType:
+        """Process an API response, reporting validation time to the hooks."""
+        if not self.hooks:
+            return process_api_response(response, response_model, self.decode_mode)
+        check_http_status(response)
+        # The fast path parses while validating, so its timing includes decoding
+        json_data = None if self.decode_mode == 'fast' else parse_json_response(response)
+        started_at = time.perf_counter()
+        try:
+            if json_data is None:
+                parsed = validate_response_json(response.content, response_model)
+            else:
+                parsed = validate_response_model(json_data, response_model)
+        except HunterAPIError:
+            self._validation_finished(endpoint, None, started_at)
+            raise
+        self._validation_finished(endpoint, parsed, started_at)
+        return parsed
+
+    def _validation_finished(self, endpoint: str, model: Optional[Any], started_at: float) -> None:
+        """Notify hooks of a validation and its duration."""
+        elapsed = time.perf_counter() - started_at
+        for hook in self.hooks:
+            hook.response_validated(endpoint, model, elapsed)
+
+    def _attempt_started(self, endpoint: str) -> float:
+        """Notify hooks of an upstream attempt and return its start time."""
+        for hook in self.hooks:
+            hook.request_started(endpoint)
+        return time.perf_counter()
+
+    def _attempt_finished(
+        self,
+        endpoint: str,
+        response: Optional[httpx.Response],
+        started_at: float,
+        cancelled: bool = False,
+    ) -> None:
+        """Notify hooks of an attempt's outcome; ``response`` is None on transport failure or cancellation."""
+        if cancelled:
+            status = CANCELLED_STATUS
+        else:
+            status = TRANSPORT_ERROR_STATUS if response is None else str(response.status_code)
+        elapsed = time.perf_counter() - started_at
+        for hook in self.hooks:
+            hook.request_finished(endpoint, status, elapsed)
+
+    @contextmanager
+    def _guard_attempt(self, endpoint: str) -> Iterator[None]:
+        """Reject an attempt locally if the quota is spent or the circuit is open.
+
+        A half-open probe that ends without an outcome, e.g. on a
+        non-retryable error or cancellation, is released so the next call can
+        probe instead of the circuit staying open.
+        """
+        if self.quota is not None:
+            self.quota.check(endpoint)
+        breaker = self.circuit_breakers.get(endpoint)
+        probing = breaker.before_request()
+        try:
+            yield
+        finally:
+            if probing:
+                breaker.release_probe()
+
+    @contextmanager
+    def _lease(self, endpoint: str, api_key: Optional[str] = None) -> Iterator[Optional[PooledKey]]:
+        """Hold a pooled key for one attempt; yields None without a pool."""
+        if self.key_pool is None:
+            yield None
+            return
+        pooled_key = self.key_pool.acquire(endpoint, api_key)
+        try:
+            yield pooled_key
+        finally:
+            self.key_pool.release(pooled_key)
+
+    def _may_hedge(self, endpoint: str, rate_limiter: RateLimiter) -> bool:
+        """Check whether a hedge may be sent now, spending a hedge and a rate limit token if so.
+
+        Hedges are only sent while the circuit is closed, the quota allows the
+        call and the rate limiter has a token to spare, so they never delay
+        other calls.
+        """
+        if self.hedger is None or self.circuit_breakers.get(endpoint).state != 'closed':
+            return False
+        if self.quota is not None:
+            try:
+                self.quota.check(endpoint)
+            except QuotaExceededError:
+                return False
+        endpoint_bucket = rate_limiter.bucket(endpoint)
+        if endpoint_bucket is not None and not endpoint_bucket.try_acquire():
+            return False
+        # The hedge is only charged to the budget once it is certain to be sent
+        if self.hedger.try_hedge():
+            return True
+        if endpoint_bucket is not None:
+            endpoint_bucket.release()
+        return False
+
+    def _attempt_rate_limiter(self, pooled_key: Optional[PooledKey]) -> RateLimiter:
+        """Return the rate limiter governing an attempt."""
+        return self.rate_limiter if pooled_key is None else pooled_key.rate_limiter
+
+    def _attempt_params(self, clean_params: dict[str, Any], pooled_key: Optional[PooledKey]) -> dict[str, Any]:
+        """Add the pooled key, if any, to an attempt's query parameters."""
+        if pooled_key is None:
+            return clean_params
+        return {**clean_params, 'api_key': pooled_key.api_key}
+
+    def _record_response(
+        self,
+        endpoint: str,
+        response: httpx.Response,
+        pooled_key: Optional[PooledKey] = None,
+    ) -> None:
+        """Update circuit, rate limiting and quota state from an upstream response."""
+        breaker = self.circuit_breakers.get(endpoint)
+        if response.status_code >= HTTP_ERROR_CODE:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        if response.status_code == HTTP_TOO_MANY_REQUESTS:
+            penalty = parse_retry_after(response)
+            penalty = RATE_LIMIT_PENALTY if penalty is None else penalty
+            if pooled_key is not None and self.key_pool is not None:
+                self.key_pool.throttle(pooled_key, endpoint, penalty)
+            else:
+                self.rate_limiter.penalize(endpoint, penalty)
+        elif response.status_code < HTTP_BAD_REQUEST:
+            quota = self.quota if pooled_key is None else pooled_key.quota
+            if quota is not None:
+                quota.consume(endpoint)
+
+    def _retry_delay(self, attempt: int, response: Optional[httpx.Response] = None) -> Optional[float]:
+        """Return how long to wait before retrying, or None to stop.
+
+        ``response`` is None when the attempt failed with a transport error.
+        """
+        policy = self.retry_policy
+        if attempt + 1 >= policy.max_attempts:
+            return None
+        if response is not None and response.status_code not in policy.retry_statuses:
+            return None
+        delay = policy.backoff(attempt)
+        retry_after = None if response is None else parse_retry_after(response)
+        if self.key_pool is not None and response is not None and response.status_code == HTTP_TOO_MANY_REQUESTS:
+            # The throttled key was ejected, so the retry goes to another key without waiting
+            retry_after = None
+        if retry_after is not None:
+            if retry_after > policy.max_retry_after:
+                return None
+            delay = max(delay, retry_after)
+        if not self._retry_budget.withdraw():
+            return None
+        return delay
+
+
+def parse_retry_after(response: httpx.Response) -> Optional[float]:
+    """Return the ``Retry-After`` delay in seconds, if the header is present and valid."""
+    header_value = response.headers.get('Retry-After')
+    if header_value is None:
+        return None
+    try:
+        return max(float(header_value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(header_value)
+    except (TypeError, ValueError):
+        return None
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def warn_use_cache(use_cache: Optional[bool]) -> None:
+    """Warn that ``get`` ignores the deprecated ``use_cache`` argument."""
+    if use_cache is not None:
+        warnings.warn(
+            'use_cache is deprecated and ignored: responses are cached by the services, see cache_policies',
+            DeprecationWarning,
+            stacklevel=3,
+        )
+
+
+def unwrap_staleable(cached: Optional[Any]) -> tuple[Optional[Any], bool]:
+    """Split a cached value into the parsed result and whether it is past its soft TTL."""
+    if isinstance(cached, StaleableValue):
+        return cached.value, cached.is_stale()
+    return cached, False
+
+
+def observe_hedged(hedger: Hedger, endpoint: str, started_at: float, hedge_started_at: float, hedge_won: bool) -> None:
+    """Teach the hedger the latencies of a hedged call once one attempt has answered.
+
+    A slow first attempt that lost is abandoned, so the time it had taken so
+    far is recorded as a lower bound; leaving it out would pull the
+    percentile, and so the hedge delay, down towards the fast answers only.
+    """
+    answered_at = time.perf_counter()
+    hedger.observe(endpoint, answered_at - started_at)
+    if hedge_won:
+        hedger.observe(endpoint, answered_at - hedge_started_at)
+        hedger.hedge_won()
+
+
+def close_abandoned(attempt: Future[httpx.Response]) -> None:
+    """Close the response of an attempt whose answer was not used."""
+    if not attempt.cancelled() and attempt.exception() is None:
+        attempt.result().close()
+
+
+async def cancel_losers(
+    attempts: list['asyncio.Task[httpx.Response]'],
+    winner: Optional['asyncio.Task[httpx.Response]'],
+) -> None:
+    """Cancel the attempts whose answer is not used, closing any response they already got."""
+    losers = [attempt for attempt in attempts if attempt is not winner]
+    for loser in losers:
+        loser.cancel()
+    for outcome in await asyncio.gather(*losers, return_exceptions=True):
+        if isinstance(outcome, httpx.Response):
+            await outcome.aclose()
+
+
+def is_cacheable_status(status_code: int, policy: CachePolicy) -> bool:
+    """Check whether a response status may be cached under a policy.
+
+    Successful responses are always cacheable. Client errors are cached only
+    when the policy opts in, and never for rate limiting; server errors are
+    transient and never cached.
+    """
+    if status_code < HTTP_BAD_REQUEST:
+        return True
+    if status_code >= HTTP_ERROR_CODE or status_code == HTTP_TOO_MANY_REQUESTS:
+        return False
+    return policy.cache_errors
+
+
+class BaseHTTPClient(HTTPClientCore):
+    """Synchronous HTTP client with common functionality."""
+
+    _client: httpx.Client
+    in_flight: SingleFlight
+
+    def _open(self) -> None:
+        """Create the underlying httpx client and request coalescer."""
+        self._client = httpx.Client(**self._client_options())
+        self.in_flight = SingleFlight()
+        self._revalidator = ThreadPoolExecutor(REVALIDATE_WORKERS, thread_name_prefix='hunter-revalidate')
+        # No more attempts can be in flight than the pool has connections
+        self._hedge_executor = (
+            ThreadPoolExecutor(self.pool.max_connections, thread_name_prefix='hunter-hedge')
+            if self.hedger is not None
+            else None
         )
-        self._cache: dict[str, httpx.Response] = {}
 
     def close(self) -> None:
-        """Close the HTTP client."""
+        """Close the HTTP client once running background refreshes and hedged attempts finish."""
+        self._revalidator.shutdown(cancel_futures=True)
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown()
         self._client.close()
-        self._cache.clear()
+
+    def revalidate(self, cache_key: str, refresh: Callable[[], Any]) -> None:
+        """Run ``refresh`` for a stale entry on a worker thread, at most once at a time per key."""
+        if self._begin_revalidation(cache_key):
+            self._revalidator.submit(self._run_revalidation, cache_key, refresh)
+
+    def _run_revalidation(self, cache_key: str, refresh: Callable[[], Any]) -> None:
+        """Refresh an entry, keeping the stale one if upstream fails."""
+        try:
+            refresh()
+        except Exception:
+            logger.warning('Background refresh of %s failed', cache_key, exc_info=True)
+        finally:
+            self._end_revalidation(cache_key)
 
     def get(
         self,
         endpoint: str,
         request_params: Optional[dict[str, Any]] = None,
-        use_cache: bool = True,
+        use_cache: Optional[bool] = None,
+        api_key: Optional[str] = None,
+        stream: bool = False,
     ) -> httpx.Response:
-        """Make a GET request."""
-        request_params = request_params or {}
+        """Make a GET request with rate limiting, retries and circuit breaking.
 
-        # Create cache key from sorted params
-        cache_key = self._create_cache_key(endpoint, request_params)
+        ``api_key`` pins the call to one key of the pool. With ``stream`` a
+        successful response is returned before its body is read; the caller
+        must close it. ``use_cache`` is deprecated and ignored.
+        """
+        warn_use_cache(use_cache)
+        clean_params = self._clean_params(request_params or {})
+        self._retry_budget.deposit()
+        attempt = 0
+        while True:
+            with self._guard_attempt(endpoint), self._lease(endpoint, api_key) as pooled_key:
+                rate_limiter = self._attempt_rate_limiter(pooled_key)
+                rate_limiter.acquire(endpoint)
+                try:
+                    response = self._hedged_send(
+                        endpoint,
+                        self._attempt_params(clean_params, pooled_key),
+                        stream,
+                        rate_limiter,
+                    )
+                except RETRYABLE_EXCEPTIONS:
+                    self.circuit_breakers.get(endpoint).record_failure()
+                    delay = self._retry_delay(attempt)
+                    if delay is None:
+                        raise
+                else:
+                    self._record_response(endpoint, response, pooled_key)
+                    delay = self._retry_delay(attempt, response)
+                    if delay is None:
+                        return response
+            attempt += 1
+            time.sleep(delay)
 
-        # Check cache if enabled
-        if use_cache and cache_key in self._cache:
-            return self._cache[cache_key]
+    def _hedged_send(
+        self,
+        endpoint: str,
+        clean_params: dict[str, Any],
+        stream: bool,
+        rate_limiter: RateLimiter,
+    ) -> httpx.Response:
+        """Make an attempt, adding a hedge if it is slower than usual; the first answer wins.
 
-        # Make request
-        clean_params = self._clean_params(request_params)
-        response = self._client.get(endpoint, params=clean_params)
+        Worker threads cannot interrupt a request, so the losing attempt runs
+        to completion and its response is closed.
+        """
+        hedger = self.hedger
+        delay = None if hedger is None else hedger.delay(endpoint)
+        if hedger is None or delay is None:
+            return self._send(endpoint, clean_params, stream)
+        started_at = time.perf_counter()
+        primary = self._submit_attempt(endpoint, clean_params, stream)
+        if wait((primary,), timeout=delay).done or not self._may_hedge(endpoint, rate_limiter):
+            response = primary.result()
+            hedger.observe(endpoint, time.perf_counter() - started_at)
+            return response
+        hedge_started_at = time.perf_counter()
+        hedge = self._submit_attempt(endpoint, clean_params, stream)
+        done, _ = wait((primary, hedge), return_when=FIRST_COMPLETED)
+        winner, loser = (primary, hedge) if primary in done else (hedge, primary)
+        if winner.exception() is not None:
+            # A failure is not an answer while the other attempt may still succeed
+            winner, loser = loser, winner
+        loser.add_done_callback(close_abandoned)
+        if winner.exception() is None:
+            observe_hedged(hedger, endpoint, started_at, hedge_started_at, hedge_won=winner is hedge)
+        return winner.result()
 
-        # Cache response if enabled
-        if use_cache:
-            self._manage_cache(cache_key, response)
+    def _submit_attempt(self, endpoint: str, clean_params: dict[str, Any], stream: bool) -> Future[httpx.Response]:
+        """Run an attempt on a hedging worker, in the caller's context so it is timed with its request."""
+        executor = cast(ThreadPoolExecutor, self._hedge_executor)
+        return executor.submit(contextvars.copy_context().run, self._send, endpoint, clean_params, stream)
 
+    def _send(self, endpoint: str, clean_params: dict[str, Any], stream: bool = False) -> httpx.Response:
+        """Make one upstream attempt, reporting it to the hooks."""
+        if not self.hooks:
+            return self._request(endpoint, clean_params, stream)
+        started_at = self._attempt_started(endpoint)
+        response = None
+        try:
+            response = self._request(endpoint, clean_params, stream)
+        finally:
+            self._attempt_finished(endpoint, response, started_at)
         return response
 
-    def _clean_params(self, request_params: dict[str, Any]) -> dict[str, Any]:
-        """Remove None values from parameters."""
-        return {key: params_value for key, params_value in request_params.items() if params_value is not None}
+    def _request(self, endpoint: str, clean_params: dict[str, Any], stream: bool) -> httpx.Response:
+        """Send one GET; a streamed response keeps its body unread only if it succeeded.
 
-    def _create_cache_key(self, endpoint: str, request_params: dict[str, Any]) -> str:
-        """Create a cache key from endpoint and params."""
-        sorted_params = sorted(request_params.items())
-        params_str = '&'.join(
-            '{0}={1}'.format(key, param_value) for key, param_value in sorted_params if param_value is not None
-        )
-        return '{0}?{1}'.format(endpoint, params_str)
-
-    def _manage_cache(self, key: str, response: httpx.Response) -> None:
-        """Manage cache size and add new entry."""
-        if len(self._cache) >= CACHE_SIZE:
-            # Remove oldest entry (simple FIFO)
-            oldest_key = next(iter(self._cache))
-            self._cache.pop(oldest_key)
-        self._cache[key] = response
+        Within ``collect_timings`` the connection setup, wait for the headers
+        and body download are timed separately.
+        """
+        upstream_trace = start_upstream_trace()
+        extensions = {} if upstream_trace is None else {'trace': upstream_trace}
+        request = self._client.build_request('GET', endpoint, params=clean_params, extensions=extensions)
+        with measure_wait(upstream_trace):
+            response = self._client.send(request, stream=True)
+        if stream and not response.is_error:
+            return response
+        try:
+            with measure('download'):
+                response.read()
+        except BaseException:
+            response.close()
+            raise
+        return response
+
+
+class AsyncBaseHTTPClient(HTTPClientCore):
+    """Asynchronous HTTP client built on ``httpx.AsyncClient``."""
+
+    _client: httpx.AsyncClient
+    in_flight: AsyncSingleFlight
+
+    def _open(self) -> None:
+        """Create the underlying httpx client and request coalescer."""
+        self._client = httpx.AsyncClient(**self._client_options())
+        self.in_flight = AsyncSingleFlight()
+        self.active_calls = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._revalidations: set[asyncio.Task[None]] = set()
+
+    async def aclose(self) -> None:
+        """Cancel pending background refreshes and close the HTTP client."""
+        for task in self._revalidations:
+            task.cancel()
+        await asyncio.gather(*self._revalidations, return_exceptions=True)
+        await self._client.aclose()
+
+    def revalidate(self, cache_key: str, refresh: Callable[[], Awaitable[Any]]) -> None:
+        """Run ``refresh`` for a stale entry in a task on the running loop, at most once at a time per key."""
+        if not self._begin_revalidation(cache_key):
+            return
+        task = asyncio.create_task(self._run_revalidation(cache_key, refresh))
+        self._revalidations.add(task)
+        task.add_done_callback(self._revalidations.discard)
+
+    async def _run_revalidation(self, cache_key: str, refresh: Callable[[], Awaitable[Any]]) -> None:
+        """Refresh an entry, keeping the stale one if upstream fails."""
+        # The task copied the triggering request's context; its calls are not part of that request
+        current_timings.set(None)
+        try:
+            await refresh()
+        except Exception:
+            logger.warning('Background refresh of %s failed', cache_key, exc_info=True)
+        finally:
+            self._end_revalidation(cache_key)
+
+    async def alookup_result(self, endpoint: str, cache_key: str) -> Optional[Any]:
+        """Async variant of ``lookup_result``."""
+        return (await self.alookup_entry(endpoint, cache_key))[0]
+
+    async def alookup_entry(self, endpoint: str, cache_key: str) -> tuple[Optional[Any], bool]:
+        """Async variant of ``lookup_entry``; disk cache tiers are read off the event loop."""
+        if not self.get_cache_policy(endpoint).enabled:
+            return None, False
+        return unwrap_staleable(await self.cache.aget(cache_key))
+
+    async def astore_result(self, endpoint: str, cache_key: str, cache_value: Any, response: httpx.Response) -> None:
+        """Async variant of ``store_result``; disk cache tiers are written off the event loop."""
+        cache_write = self._cache_write(endpoint, cache_value, response)
+        if cache_write is not None:
+            await self.cache.aset(cache_key, cache_write[0], ttl=cache_write[1], size=len(response.content))
+
+    async def drain(self, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for in-flight calls; return whether all finished."""
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+        except TimeoutError:
+            return False
+        return True
+
+    async def get(
+        self,
+        endpoint: str,
+        request_params: Optional[dict[str, Any]] = None,
+        use_cache: Optional[bool] = None,
+        api_key: Optional[str] = None,
+        stream: bool = False,
+    ) -> httpx.Response:
+        """Make a GET request without blocking the event loop.
+
+        Applies the same rate limiting, retries, circuit breaking and key
+        routing as the sync client, and streams the same way.
+        ``use_cache`` is deprecated and ignored.
+        """
+        warn_use_cache(use_cache)
+        self.active_calls += 1
+        self._idle.clear()
+        try:
+            return await self._get(endpoint, request_params, api_key, stream)
+        finally:
+            self.active_calls -= 1
+            if not self.active_calls:
+                self._idle.set()
+
+    async def _get(
+        self,
+        endpoint: str,
+        request_params: Optional[dict[str, Any]],
+        api_key: Optional[str],
+        stream: bool = False,
+    ) -> httpx.Response:
+        """Run the attempts of one ``get`` call."""
+        clean_params = self._clean_params(request_params or {})
+        self._retry_budget.deposit()
+        attempt = 0
+        while True:
+            with self._guard_attempt(endpoint), self._lease(endpoint, api_key) as pooled_key:
+                rate_limiter = self._attempt_rate_limiter(pooled_key)
+                await rate_limiter.acquire_async(endpoint)
+                try:
+                    response = await self._hedged_send(
+                        endpoint,
+                        self._attempt_params(clean_params, pooled_key),
+                        stream,
+                        rate_limiter,
+                    )
+                except RETRYABLE_EXCEPTIONS:
+                    self.circuit_breakers.get(endpoint).record_failure()
+                    delay = self._retry_delay(attempt)
+                    if delay is None:
+                        raise
+                else:
+                    self._record_response(endpoint, response, pooled_key)
+                    delay = self._retry_delay(attempt, response)
+                    if delay is None:
+                        return response
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def _hedged_send(
+        self,
+        endpoint: str,
+        clean_params: dict[str, Any],
+        stream: bool,
+        rate_limiter: RateLimiter,
+    ) -> httpx.Response:
+        """Make an attempt, adding a hedge if it is slower than usual; the first answer wins and the other is cancelled."""
+        hedger = self.hedger
+        delay = None if hedger is None else hedger.delay(endpoint)
+        if hedger is None or delay is None:
+            return await self._send(endpoint, clean_params, stream)
+        started_at = time.perf_counter()
+        primary = asyncio.create_task(self._send(endpoint, clean_params, stream))
+        attempts = [primary]
+        winner: Optional[asyncio.Task[httpx.Response]] = None
+        try:
+            done, _ = await asyncio.wait(attempts, timeout=delay)
+            if done or not self._may_hedge(endpoint, rate_limiter):
+                winner = primary
+                response = await primary
+                hedger.observe(endpoint, time.perf_counter() - started_at)
+                return response
+            hedge_started_at = time.perf_counter()
+            hedge = asyncio.create_task(self._send(endpoint, clean_params, stream))
+            attempts.append(hedge)
+            done, _ = await asyncio.wait(attempts, return_when=asyncio.FIRST_COMPLETED)
+            winner = primary if primary in done else hedge
+            if winner.exception() is not None:
+                # A failure is not an answer while the other attempt may still succeed
+                winner = hedge if winner is primary else primary
+                await asyncio.wait((winner,))
+            if winner.exception() is None:
+                observe_hedged(hedger, endpoint, started_at, hedge_started_at, hedge_won=winner is hedge)
+            return winner.result()
+        finally:
+            await cancel_losers(attempts, winner)
+
+    async def _send(self, endpoint: str, clean_params: dict[str, Any], stream: bool = False) -> httpx.Response:
+        """Make one upstream attempt, reporting it to the hooks."""
+        if not self.hooks:
+            return await self._request(endpoint, clean_params, stream)
+        started_at = self._attempt_started(endpoint)
+        response = None
+        cancelled = False
+        try:
+            response = await self._request(endpoint, clean_params, stream)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        finally:
+            self._attempt_finished(endpoint, response, started_at, cancelled)
+        return response
+
+    async def _request(self, endpoint: str, clean_params: dict[str, Any], stream: bool) -> httpx.Response:
+        """Send one GET, timed like the sync client; a streamed response keeps its body unread only if it succeeded."""
+        upstream_trace = start_upstream_trace()
+        extensions = {} if upstream_trace is None else {'trace': upstream_trace.atrace}
+        request = self._client.build_request('GET', endpoint, params=clean_params, extensions=extensions)
+        with measure_wait(upstream_trace):
+            response = await self._client.send(request, stream=True)
+        if stream and not response.is_error:
+            return response
+        try:
+            with measure('download'):
+                await response.aread()
+        except BaseException:
+            await response.aclose()
+            raise
+        return response
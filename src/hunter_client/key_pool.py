@@ -0,0 +1,222 @@
+"""Load balancing across several Hunter.io API keys."""
+
+import math
+import threading
+import time
+from collections.abc import Callable, Sequence
+from datetime import datetime, timezone
+from typing import Optional
+
+from hunter_client.config import QUOTA_REFRESH_INTERVAL
+from hunter_client.models.account import AccountInformationResponse, AccountPoolResponse, PooledKeyInformation
+from hunter_client.rate_limit import QuotaExceededError, QuotaTracker, RateLimiter, is_billable
+
+KEY_SUFFIX_LENGTH = 4
+
+
+class PooledKey:
+    """One API key with its own rate limiter, quota and load."""
+
+    def __init__(self, api_key: str, rate_limiter: RateLimiter, reserve: int = 0) -> None:
+        """Initialize an active key with unknown quota."""
+        self.api_key = api_key
+        self.rate_limiter = rate_limiter
+        self.quota = QuotaTracker(reserve)
+        self.in_flight = 0
+        self.ejected_until: Optional[float] = None
+        self.reset_at: Optional[float] = None
+        self.account: Optional[AccountInformationResponse] = None
+
+    @property
+    def label(self) -> str:
+        """Return the key with all but its last characters masked."""
+        return mask_api_key(self.api_key)
+
+    def routing_score(self) -> tuple[float, int]:
+        """Rank keys by credits left after in-flight calls, then by lightest load."""
+        remaining = self.quota.remaining
+        credits_left = math.inf if remaining is None else remaining - self.in_flight
+        return credits_left, -self.in_flight
+
+    def is_exhausted(self) -> bool:
+        """Check whether the key is down to its quota reserve."""
+        remaining = self.quota.remaining
+        return remaining is not None and remaining <= self.quota.reserve
+
+
+class APIKeyPool:
+    """Routes each call to the key with the most credits left or the least load.
+
+    Every key gets its own ``RateLimiter``, so throughput grows with the pool;
+    ``workers`` processes sharing the pool split each key's rates.
+    Keys answering ``429`` are ejected for the ``Retry-After`` delay; keys down
+    to their quota reserve are ejected until their plan's ``reset_date`` (or
+    the next quota refresh when it is unknown).
+    """
+
+    def __init__(
+        self,
+        api_keys: Sequence[str],
+        rates: Optional[dict[str, float]] = None,
+        reserve: int = 0,
+        clock: Callable[[], float] = time.time,
+        workers: int = 1,
+    ) -> None:
+        """Initialize with every key active."""
+        if not api_keys:
+            raise ValueError('APIKeyPool needs at least one API key')
+        self.keys = [PooledKey(api_key, RateLimiter(rates, workers), reserve) for api_key in dict.fromkeys(api_keys)]
+        self._by_key = {pooled_key.api_key: pooled_key for pooled_key in self.keys}
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of keys."""
+        return len(self.keys)
+
+    @property
+    def api_keys(self) -> list[str]:
+        """Return the pooled API keys in configuration order."""
+        return [pooled_key.api_key for pooled_key in self.keys]
+
+    @property
+    def reserve(self) -> int:
+        """Return the credits each key keeps in reserve."""
+        return self.keys[0].quota.reserve
+
+    @reserve.setter
+    def reserve(self, reserve: int) -> None:
+        """Set the credits each key keeps in reserve."""
+        for pooled_key in self.keys:
+            pooled_key.quota.reserve = reserve
+
+    def acquire(self, endpoint: str, api_key: Optional[str] = None) -> PooledKey:
+        """Pick a key for one call and count it as in flight.
+
+        ``api_key`` forces a specific key, even an ejected one. Raises
+        ``QuotaExceededError`` when every key is ejected.
+        """
+        with self._lock:
+            if api_key is None:
+                pooled_key = self._choose(endpoint)
+            else:
+                pooled_key = self._by_key[api_key]
+            pooled_key.in_flight += 1
+            return pooled_key
+
+    def release(self, pooled_key: PooledKey) -> None:
+        """Mark a call made with ``acquire`` as finished."""
+        with self._lock:
+            pooled_key.in_flight -= 1
+
+    def throttle(self, pooled_key: PooledKey, endpoint: str, seconds: float) -> None:
+        """Pause an endpoint on a key and eject the key after upstream throttled it."""
+        pooled_key.rate_limiter.penalize(endpoint, seconds)
+        with self._lock:
+            self._eject(pooled_key, self._clock() + seconds)
+
+    def update(self, api_key: str, account: AccountInformationResponse) -> None:
+        """Record a key's account information and quota."""
+        pooled_key = self._by_key[api_key]
+        pooled_key.quota.update(account)
+        with self._lock:
+            pooled_key.account = account
+            pooled_key.reset_at = parse_reset_date(account.reset_date)
+
+    def summary(self, errors: Optional[dict[str, str]] = None) -> AccountPoolResponse:
+        """Aggregate account information and state of every key."""
+        errors = errors or {}
+        now = self._clock()
+        accounts = []
+        used = 0
+        available = 0
+        reset_dates = []
+        with self._lock:
+            for pooled_key in self.keys:
+                ejected = self._is_ejected(pooled_key, now)
+                account = pooled_key.account
+                if account is not None:
+                    used += _int_or_zero(account.calls.get('used'))
+                    available += _int_or_zero(account.calls.get('available'))
+                    reset_dates.append(account.reset_date)
+                accounts.append(
+                    PooledKeyInformation(
+                        key=pooled_key.label,
+                        status='ejected' if ejected else 'active',
+                        available_at=_as_datetime(pooled_key.ejected_until) if ejected else None,
+                        remaining=pooled_key.quota.remaining,
+                        in_flight=pooled_key.in_flight,
+                        account=account,
+                        error=errors.get(pooled_key.api_key),
+                    ),
+                )
+        return AccountPoolResponse(
+            keys=len(accounts),
+            active_keys=sum(account_state.status == 'active' for account_state in accounts),
+            calls={'used': used, 'available': available},
+            reset_date=min(reset_dates) if reset_dates else None,
+            accounts=accounts,
+        )
+
+    def _choose(self, endpoint: str) -> PooledKey:
+        """Return the best available key for an endpoint."""
+        now = self._clock()
+        billable = is_billable(endpoint)
+        candidates = []
+        for pooled_key in self.keys:
+            if self._is_ejected(pooled_key, now):
+                continue
+            if billable and pooled_key.is_exhausted():
+                self._eject(pooled_key, pooled_key.reset_at or now + QUOTA_REFRESH_INTERVAL)
+                continue
+            candidates.append(pooled_key)
+        if not candidates:
+            next_available = min(ejected_key.ejected_until or now for ejected_key in self.keys)
+            raise QuotaExceededError(
+                'All {0} Hunter.io API keys are exhausted or throttled, next one available in {1:.0f}s'.format(
+                    len(self.keys),
+                    max(next_available - now, 0),
+                ),
+            )
+        return max(candidates, key=PooledKey.routing_score)
+
+    def _is_ejected(self, pooled_key: PooledKey, now: float) -> bool:
+        """Check whether a key is ejected, restoring it once its time is up."""
+        if pooled_key.ejected_until is None:
+            return False
+        if now < pooled_key.ejected_until:
+            return True
+        pooled_key.ejected_until = None
+        if pooled_key.reset_at is not None and now >= pooled_key.reset_at:
+            # Credits were reset; the next refresh reports the new quota
+            pooled_key.quota.remaining = None
+            pooled_key.reset_at = None
+        return False
+
+    def _eject(self, pooled_key: PooledKey, until: float) -> None:
+        """Take a key out of rotation until ``until``."""
+        pooled_key.ejected_until = max(until, pooled_key.ejected_until or until)
+
+
+def mask_api_key(api_key: str) -> str:
+    """Hide all but the last characters of an API key."""
+    return '...{0}'.format(api_key[-KEY_SUFFIX_LENGTH:])
+
+
+def parse_reset_date(reset_date: str) -> Optional[float]:
+    """Return the UTC timestamp at which a ``YYYY-MM-DD`` reset date begins."""
+    try:
+        reset_day = datetime.strptime(reset_date, '%Y-%m-%d')
+    except ValueError:
+        return None
+    return reset_day.replace(tzinfo=timezone.utc).timestamp()
+
+
+def _as_datetime(timestamp: Optional[float]) -> Optional[datetime]:
+    """Convert a timestamp to an aware datetime."""
+    return None if timestamp is None else datetime.fromtimestamp(timestamp, timezone.utc)
+
+
+def _int_or_zero(call_count: object) -> int:
+    """Return call counts reported as integers, ignoring anything else."""
+    return call_count if isinstance(call_count, int) else 0
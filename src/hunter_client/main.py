@@ -1,36 +1,85 @@
 """FastAPI application for Hunter.io API client."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Union
+
 import uvicorn
 from dotenv import load_dotenv
 from fastapi import Depends, FastAPI, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 
+from hunter_client.client import AsyncHunterClient
 from hunter_client.config import (
     DEFAULT_PORT,
     HTTP_BAD_REQUEST,
     HTTP_ERROR_CODE,
+    METRICS_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE,
+)
+from hunter_client.dependencies import (
+    get_drain_timeout,
+    get_shared_client,
+    get_slow_request_sampler,
+    open_shared_client,
 )
-from hunter_client.dependencies import get_client
-from hunter_client.models.account import AccountInformationResponse
-from hunter_client.models.domain import DomainSearchParams, DomainSearchResponse
+from hunter_client.metrics import (
+    ClientMetrics,
+    MetricsMiddleware,
+    MetricsRegistry,
+    RouteMetrics,
+    ServerTimingMiddleware,
+)
+from hunter_client.models.account import AccountInformationResponse, AccountPoolResponse
+from hunter_client.models.domain import DomainEmailStreamParams, DomainSearchParams, DomainSearchResponse
 from hunter_client.models.email_finder import (
     EmailFinderRequest,
     EmailFinderResponse,
 )
-from hunter_client.models.verifier import EmailVerifierRequest, EmailVerifierResponse
+from hunter_client.models.verifier import (
+    BulkEmailVerifierRequest,
+    EmailVerifierRequest,
+    EmailVerifierResponse,
+)
 from hunter_client.response_handler import HunterAPIError
+from hunter_client.responses import ModelResponse
 
 load_dotenv()
 
+metrics_registry = MetricsRegistry()
+client_metrics = ClientMetrics(metrics_registry)
+route_metrics = RouteMetrics(metrics_registry)
+
+
+@asynccontextmanager
+async def lifespan(fastapi_app: FastAPI) -> AsyncIterator[None]:
+    """Open one pooled Hunter client for the app and close it once in-flight calls drain on shutdown."""
+    client = open_shared_client()
+    if client is not None:
+        client.instrument(client_metrics)
+    fastapi_app.state.hunter_client = client
+    try:
+        yield
+    finally:
+        if client is not None:
+            await client.aclose(drain_timeout=get_drain_timeout())
+            client.cache.close()
+
+
 app = FastAPI(
     title='Hunter.io API Client',
     description='Hunter.io API client with FastAPI',
     version='1.0.0',
+    lifespan=lifespan,
 )
+app.add_middleware(MetricsMiddleware, route_metrics=route_metrics)
+app.add_middleware(ServerTimingMiddleware, sampler=get_slow_request_sampler())
 
 
-# Module-level variable for dependency injection
+# Module-level variables for dependency injection
 domain_search_depends = Depends(DomainSearchParams)
+domain_stream_depends = Depends(DomainEmailStreamParams)
+client_depends = Depends(get_shared_client)
 
 
 @app.get('/', response_model=dict[str, str])
@@ -46,18 +95,48 @@ async def root() -> dict[str, str]:
 @app.get('/domain-search', response_model=DomainSearchResponse)
 async def domain_search(
     search_params: DomainSearchParams = domain_search_depends,
-) -> DomainSearchResponse:
+    client: AsyncHunterClient = client_depends,
+) -> ModelResponse:
     """Search for emails by domain."""
     try:
-        with get_client() as client:
-            return client.domain.search(
-                domain=search_params.domain,
-                email_type=search_params.email_type,
-                seniority=search_params.seniority,
-                department=search_params.department,
-                limit=search_params.limit,
-                offset=search_params.offset,
-            )
+        search_results = await client.domain.search(
+            domain=search_params.domain,
+            email_type=search_params.email_type,
+            seniority=search_params.seniority,
+            department=search_params.department,
+            limit=search_params.limit,
+            offset=search_params.offset,
+        )
+        return ModelResponse(search_results)
+    except HunterAPIError as exc:
+        raise HTTPException(
+            status_code=exc.status_code or HTTP_ERROR_CODE,
+            detail=str(exc),
+        ) from exc
+    except Exception as exc:
+        error_msg = 'Internal server error: {0}'.format(exc)
+        raise HTTPException(
+            status_code=HTTP_ERROR_CODE,
+            detail=error_msg,
+        ) from exc
+
+
+@app.get('/domain-search/stream', response_class=StreamingResponse)
+async def domain_search_stream(
+    stream_params: DomainEmailStreamParams = domain_stream_depends,
+    client: AsyncHunterClient = client_depends,
+) -> StreamingResponse:
+    """Stream every email of a domain as NDJSON, one page fetched at a time."""
+    emails = client.domain.iter_emails(
+        domain=stream_params.domain,
+        email_type=stream_params.email_type,
+        seniority=stream_params.seniority,
+        department=stream_params.department,
+        page_size=stream_params.page_size,
+    )
+    # Fetch the first page before responding so upstream errors keep their status code
+    try:
+        first_email = await anext(emails, None)
     except HunterAPIError as exc:
         raise HTTPException(
             status_code=exc.status_code or HTTP_ERROR_CODE,
@@ -70,18 +149,31 @@ async def domain_search(
             detail=error_msg,
         ) from exc
 
+    async def stream_emails() -> AsyncIterator[str]:
+        if first_email is None:
+            return
+        yield '{0}\n'.format(first_email.model_dump_json(by_alias=True))
+        async for email in emails:
+            yield '{0}\n'.format(email.model_dump_json(by_alias=True))
+
+    return StreamingResponse(stream_emails(), media_type=NDJSON_MEDIA_TYPE)
+
 
 @app.post('/email-finder', response_model=EmailFinderResponse)
-async def email_finder(request: EmailFinderRequest) -> EmailFinderResponse:
+async def email_finder(
+    request: EmailFinderRequest,
+    client: AsyncHunterClient = client_depends,
+) -> ModelResponse:
     """Find email address."""
     try:
-        with get_client() as client:
-            return client.email.find(
-                domain=request.domain,
-                first_name=request.first_name,
-                last_name=request.last_name,
-                full_name=request.full_name,
-            )
+        email_result = await client.email.find(
+            domain=request.domain,
+            first_name=request.first_name,
+            last_name=request.last_name,
+            full_name=request.full_name,
+            infer=request.infer,
+        )
+        return ModelResponse(email_result)
     except ValueError as exc:
         raise HTTPException(
             status_code=HTTP_BAD_REQUEST,
@@ -101,11 +193,13 @@ async def email_finder(request: EmailFinderRequest) -> EmailFinderResponse:
 
 
 @app.post('/email-verifier', response_model=EmailVerifierResponse)
-async def email_verifier(request: EmailVerifierRequest) -> EmailVerifierResponse:
+async def email_verifier(
+    request: EmailVerifierRequest,
+    client: AsyncHunterClient = client_depends,
+) -> ModelResponse:
     """Verify an email address."""
     try:
-        with get_client() as client:
-            return client.email.verify(str(request.email))
+        return ModelResponse(await client.email.verify(str(request.email)))
     except HunterAPIError as exc:
         raise HTTPException(
             status_code=exc.status_code or HTTP_ERROR_CODE,
@@ -119,12 +213,29 @@ async def email_verifier(request: EmailVerifierRequest) -> EmailVerifierResponse
         ) from exc
 
 
-@app.get('/account', response_model=AccountInformationResponse)
-async def account_information() -> AccountInformationResponse:
-    """Get account information."""
+@app.post('/email-verifier/bulk', response_class=StreamingResponse)
+async def email_verifier_bulk(
+    request: BulkEmailVerifierRequest,
+    client: AsyncHunterClient = client_depends,
+) -> StreamingResponse:
+    """Verify many addresses, streaming one NDJSON line per address as it completes."""
+
+    async def stream_results() -> AsyncIterator[str]:
+        async for verification in client.email.verify_many(request.emails, request.concurrency):
+            yield '{0}\n'.format(verification.model_dump_json(by_alias=True))
+
+    return StreamingResponse(stream_results(), media_type=NDJSON_MEDIA_TYPE)
+
+
+@app.get('/account', response_model=Union[AccountInformationResponse, AccountPoolResponse])
+async def account_information(
+    client: AsyncHunterClient = client_depends,
+) -> ModelResponse:
+    """Get account information, aggregated across keys when several are configured."""
     try:
-        with get_client() as client:
-            return client.account.get_information()
+        if client.key_pool is not None:
+            return ModelResponse(await client.account.refresh_keys())
+        return ModelResponse(await client.account.get_information())
     except HunterAPIError as exc:
         raise HTTPException(
             status_code=exc.status_code or HTTP_ERROR_CODE,
@@ -138,6 +249,12 @@ async def account_information() -> AccountInformationResponse:
         ) from exc
 
 
+@app.get('/metrics', include_in_schema=False)
+async def metrics() -> Response:
+    """Expose this worker's metrics in the Prometheus text format."""
+    return Response(metrics_registry.render(), media_type=METRICS_MEDIA_TYPE)
+
+
 @app.exception_handler(HunterAPIError)
 async def hunter_api_exception_handler(
     request: object,
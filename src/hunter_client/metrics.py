@@ -0,0 +1,427 @@
+"""Prometheus metrics for Hunter.io API calls, caching and routes."""
+
+import bisect
+import json
+import logging
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterator, MutableMapping
+from typing import Any, Optional, TypeVar
+
+from hunter_client.cache import CacheBackend, LRUCache, TieredCache
+from hunter_client.config import HTTP_ERROR_CODE, SLOW_REQUEST_DUMP_RATE
+from hunter_client.models.account import AccountInformationResponse
+from hunter_client.rate_limit import TokenBucket
+from hunter_client.timing import collect_timings
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+VALIDATION_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05)
+TRANSPORT_ERROR_STATUS = 'error'
+CANCELLED_STATUS = 'cancelled'
+
+ASGIScope = MutableMapping[str, Any]
+ASGIReceive = Callable[[], Awaitable[MutableMapping[str, Any]]]
+ASGISend = Callable[[MutableMapping[str, Any]], Awaitable[None]]
+ASGIApp = Callable[[ASGIScope, ASGIReceive, ASGISend], Awaitable[None]]
+Sample = tuple[str, tuple[tuple[str, str], ...], float]
+MetricType = TypeVar('MetricType', bound='Metric')
+
+logger = logging.getLogger(__name__)
+
+
+class ClientHooks:
+    """Callbacks invoked by the HTTP client; override the ones you need.
+
+    Hooks run inline on every upstream call, so they must be fast and must
+    not raise.
+    """
+
+    def request_started(self, endpoint: str) -> None:
+        """Called before each upstream attempt, including retries."""
+
+    def request_finished(self, endpoint: str, status: str, seconds: float) -> None:
+        """Called after each attempt with the status code, ``error`` on transport failure or ``cancelled``.
+
+        Attempts are cancelled when a hedged request is answered by another attempt.
+        """
+
+    def response_validated(self, endpoint: str, model: Optional[Any], seconds: float) -> None:
+        """Called after validating a response body; ``model`` is None when validation failed."""
+
+
+class Metric:
+    """A named metric family holding one value per label combination."""
+
+    metric_type = 'untyped'
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> None:
+        """Initialize with no samples."""
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def set(self, metric_value: float, *label_values: str) -> None:
+        """Set the value for a label combination."""
+        with self._lock:
+            self._values[label_values] = metric_value
+
+    def value(self, *label_values: str) -> float:
+        """Return the current value for a label combination."""
+        return self._values.get(label_values, 0.0)
+
+    def samples(self) -> Iterator[Sample]:
+        """Yield ``(name, labels, value)`` for every label combination."""
+        with self._lock:
+            values = list(self._values.items())
+        for label_values, metric_value in values:
+            yield self.name, tuple(zip(self.label_names, label_values)), metric_value
+
+    def render(self) -> list[str]:
+        """Return the metric in the Prometheus text exposition format."""
+        lines = [
+            '# HELP {0} {1}'.format(self.name, self.documentation),
+            '# TYPE {0} {1}'.format(self.name, self.metric_type),
+        ]
+        lines.extend(_format_sample(*sample) for sample in self.samples())
+        return lines
+
+
+class Counter(Metric):
+    """Monotonically increasing total."""
+
+    metric_type = 'counter'
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        """Add ``amount`` to the total for a label combination."""
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+
+class Gauge(Metric):
+    """Value that can go up and down."""
+
+    metric_type = 'gauge'
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        """Add ``amount`` to the value for a label combination."""
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def dec(self, *label_values: str, amount: float = 1.0) -> None:
+        """Subtract ``amount`` from the value for a label combination."""
+        self.inc(*label_values, amount=-amount)
+
+
+class Histogram(Metric):
+    """Distribution of observations over fixed buckets."""
+
+    metric_type = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> None:
+        """Initialize with upper bucket bounds in ascending order."""
+        super().__init__(name, documentation, label_names)
+        self.buckets = buckets
+        self._counts: dict[tuple[str, ...], list[int]] = {}
+
+    def observe(self, observed: float, *label_values: str) -> None:
+        """Record one observation for a label combination."""
+        bucket_index = bisect.bisect_left(self.buckets, observed)
+        with self._lock:
+            counts = self._counts.get(label_values)
+            if counts is None:
+                counts = [0] * (len(self.buckets) + 1)
+                self._counts[label_values] = counts
+            counts[bucket_index] += 1
+            self._values[label_values] = self._values.get(label_values, 0.0) + observed
+
+    def count(self, *label_values: str) -> int:
+        """Return the number of observations for a label combination."""
+        return sum(self._counts.get(label_values, ()))
+
+    def samples(self) -> Iterator[Sample]:
+        """Yield cumulative bucket, sum and count samples."""
+        with self._lock:
+            snapshot = [
+                (label_values, list(counts), self._values[label_values])
+                for label_values, counts in self._counts.items()
+            ]
+        bounds = [*(repr(bound) for bound in self.buckets), '+Inf']
+        for label_values, counts, total in snapshot:
+            labels = tuple(zip(self.label_names, label_values))
+            cumulative = 0
+            for bound, bucket_count in zip(bounds, counts):
+                cumulative += bucket_count
+                yield '{0}_bucket'.format(self.name), (*labels, ('le', bound)), cumulative
+            yield '{0}_sum'.format(self.name), labels, total
+            yield '{0}_count'.format(self.name), labels, cumulative
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together for one scrape."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self.metrics: list[Metric] = []
+        self._collectors: list[Callable[[], None]] = []
+
+    def register(self, metric: MetricType) -> MetricType:
+        """Add a metric to the registry."""
+        self.metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """Run ``collector`` before each render to refresh sampled values."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Return every metric in the Prometheus text exposition format."""
+        for collector in self._collectors:
+            collector()
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        return '{0}\n'.format('\n'.join(lines))
+
+
+class ClientMetrics(ClientHooks):
+    """Upstream, validation, cache and credit metrics for a Hunter client.
+
+    Register it with ``HunterClient.instrument`` (or ``add_hook``) and render
+    ``registry`` from any scrape endpoint.
+    """
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None) -> None:
+        """Create the metric families in ``registry`` or a new one."""
+        self.registry = registry if registry is not None else MetricsRegistry()
+        register = self.registry.register
+        self.upstream_requests = register(
+            Counter('hunter_upstream_requests_total', 'Upstream Hunter.io calls.', ('endpoint', 'status')),
+        )
+        self.upstream_latency = register(
+            Histogram('hunter_upstream_request_duration_seconds', 'Upstream call latency.', ('endpoint',)),
+        )
+        self.upstream_in_flight = register(
+            Gauge('hunter_upstream_requests_in_flight', 'Upstream calls awaiting a response.', ('endpoint',)),
+        )
+        self.validation_latency = register(
+            Histogram(
+                'hunter_response_validation_duration_seconds',
+                'Time spent validating response bodies.',
+                ('endpoint', 'outcome'),
+                buckets=VALIDATION_BUCKETS,
+            ),
+        )
+        self.cache_hits = register(Counter('hunter_cache_hits_total', 'Cache lookups served from cache.'))
+        self.cache_misses = register(Counter('hunter_cache_misses_total', 'Cache lookups that missed.'))
+        self.cache_evictions = register(Counter('hunter_cache_evictions_total', 'Entries evicted for space.'))
+        self.cache_expirations = register(Counter('hunter_cache_expirations_total', 'Entries dropped on expiry.'))
+        self.cache_entries = register(Gauge('hunter_cache_entries', 'Entries in the memory cache.'))
+        self.cache_bytes = register(Gauge('hunter_cache_bytes', 'Accounted size of the memory cache.'))
+        self.credits_used = register(Gauge('hunter_account_credits_used', 'Credits used, from /account.'))
+        self.credits_available = register(Gauge('hunter_account_credits_available', 'Credits in the plan.'))
+        self._cache: Optional[CacheBackend] = None
+        self.registry.add_collector(self._collect_cache)
+
+    def watch_cache(self, cache: CacheBackend) -> None:
+        """Sample ``cache`` statistics on every render, replacing any cache watched before."""
+        self._cache = cache
+
+    def request_started(self, endpoint: str) -> None:
+        """Count the call as in flight."""
+        self.upstream_in_flight.inc(endpoint)
+
+    def request_finished(self, endpoint: str, status: str, seconds: float) -> None:
+        """Record the call's status and latency."""
+        self.upstream_in_flight.dec(endpoint)
+        self.upstream_requests.inc(endpoint, status)
+        self.upstream_latency.observe(seconds, endpoint)
+
+    def response_validated(self, endpoint: str, model: Optional[Any], seconds: float) -> None:
+        """Record validation time and credit usage from account responses."""
+        self.validation_latency.observe(seconds, endpoint, 'error' if model is None else 'ok')
+        if isinstance(model, AccountInformationResponse):
+            used = model.calls.get('used')
+            available = model.calls.get('available')
+            if isinstance(used, int) and isinstance(available, int):
+                self.credits_used.set(used)
+                self.credits_available.set(available)
+
+    def _collect_cache(self) -> None:
+        """Copy cache counters and memory tier size into the metrics."""
+        cache = self._cache
+        if cache is None:
+            return
+        self.cache_hits.set(cache.stats.hits)
+        self.cache_misses.set(cache.stats.misses)
+        self.cache_evictions.set(cache.stats.evictions)
+        self.cache_expirations.set(cache.stats.expirations)
+        memory = cache.memory if isinstance(cache, TieredCache) else cache
+        if isinstance(memory, LRUCache):
+            self.cache_entries.set(len(memory))
+            self.cache_bytes.set(memory.total_bytes)
+
+
+class RouteMetrics:
+    """Request counts, latency and concurrency of the FastAPI routes."""
+
+    def __init__(self, registry: MetricsRegistry) -> None:
+        """Create the metric families in ``registry``."""
+        self.requests = registry.register(
+            Counter('hunter_http_requests_total', 'Requests served.', ('method', 'route', 'status')),
+        )
+        self.latency = registry.register(
+            Histogram('hunter_http_request_duration_seconds', 'Time to the first response byte.', ('route',)),
+        )
+        self.in_flight = registry.register(Gauge('hunter_http_requests_in_flight', 'Requests being served.'))
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording ``RouteMetrics`` by route template."""
+
+    def __init__(self, app: ASGIApp, route_metrics: RouteMetrics) -> None:
+        """Wrap ``app``."""
+        self.app = app
+        self.route_metrics = route_metrics
+
+    async def __call__(self, scope: ASGIScope, receive: ASGIReceive, send: ASGISend) -> None:
+        """Serve the request, timing it until the response starts."""
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        started_at = time.perf_counter()
+        status_code = HTTP_ERROR_CODE
+        route_metrics = self.route_metrics
+
+        async def send_with_status(message: MutableMapping[str, Any]) -> None:
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+                route_metrics.latency.observe(time.perf_counter() - started_at, _route_name(scope))
+            await send(message)
+
+        route_metrics.in_flight.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route_metrics.in_flight.dec()
+            route_metrics.requests.inc(scope['method'], _route_name(scope), str(status_code))
+
+
+def log_slow_request(trace: dict[str, Any]) -> None:
+    """Log a slow request's trace as one JSON line."""
+    logger.warning('Slow request: %s', json.dumps(trace))
+
+
+class SlowRequestSampler:
+    """Dumps the full timing trace of requests slower than ``threshold`` seconds.
+
+    At most ``rate`` traces are dumped per second, so a slow upstream does
+    not flood the log; ``suppressed`` counts the slow requests skipped.
+    ``dump`` replaces logging the trace as JSON.
+    """
+
+    def __init__(
+        self,
+        threshold: float,
+        rate: float = SLOW_REQUEST_DUMP_RATE,
+        dump: Optional[Callable[[dict[str, Any]], None]] = None,
+    ) -> None:
+        """Initialize with no requests seen."""
+        self.threshold = threshold
+        self.dump = dump if dump is not None else log_slow_request
+        self.dumped = 0
+        self.suppressed = 0
+        self._bucket = TokenBucket(rate)
+
+    def observe(self, seconds: float, trace: Callable[[], dict[str, Any]]) -> bool:
+        """Dump the trace built by ``trace`` if the request was slow; return whether it was dumped."""
+        if seconds < self.threshold:
+            return False
+        if not self._bucket.try_acquire():
+            self.suppressed += 1
+            return False
+        self.dumped += 1
+        self.dump(trace())
+        return True
+
+
+class ServerTimingMiddleware:
+    """ASGI middleware timing the phases of each request into a ``Server-Timing`` header.
+
+    Upstream connection setup, waiting, download, parsing, validation and
+    serialization are reported in milliseconds along with ``total``, the time
+    until the response starts. Work done after that, such as streaming a
+    body, only shows up in the traces ``sampler`` dumps.
+    """
+
+    def __init__(self, app: ASGIApp, sampler: Optional[SlowRequestSampler] = None) -> None:
+        """Wrap ``app``."""
+        self.app = app
+        self.sampler = sampler
+
+    async def __call__(self, scope: ASGIScope, receive: ASGIReceive, send: ASGISend) -> None:
+        """Serve the request within a timing context."""
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        status_code = HTTP_ERROR_CODE
+        with collect_timings() as timings:
+
+            async def send_with_timing(message: MutableMapping[str, Any]) -> None:
+                nonlocal status_code
+                if message['type'] == 'http.response.start':
+                    status_code = message['status']
+                    server_timing = timings.server_timing(timings.elapsed())
+                    headers = [*message.get('headers', ()), (b'server-timing', server_timing.encode('latin-1'))]
+                    message = {**message, 'headers': headers}
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                if self.sampler is not None:
+                    elapsed = timings.elapsed()
+                    self.sampler.observe(
+                        elapsed,
+                        lambda: {
+                            'method': scope['method'],
+                            'route': _route_name(scope),
+                            'status': status_code,
+                            'total': round(elapsed * 1000, 3),
+                            **timings.to_dict(),
+                        },
+                    )
+
+
+def _route_name(scope: ASGIScope) -> str:
+    """Return the matched route template, keeping label cardinality bounded."""
+    route = scope.get('route')
+    return getattr(route, 'path', 'unmatched')
+
+
+def _format_sample(name: str, labels: tuple[tuple[str, str], ...], sample_value: float) -> str:
+    """Format one sample line."""
+    if not labels:
+        return '{0} {1}'.format(name, _format_value(sample_value))
+    label_text = ','.join('{0}="{1}"'.format(label, _escape(label_value)) for label, label_value in labels)
+    return '{0}{{{1}}} {2}'.format(name, label_text, _format_value(sample_value))
+
+
+def _format_value(sample_value: float) -> str:
+    """Format a sample value, dropping the fraction of whole numbers."""
+    if float(sample_value).is_integer():
+        return str(int(sample_value))
+    return repr(float(sample_value))
+
+
+def _escape(label_value: str) -> str:
+    """Escape a label value for the exposition format."""
+    return label_value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
@@ -1,16 +1,45 @@
 """Account information related models."""
 
-from typing import Any, Optional
+from datetime import datetime
+from typing import Any, Literal, Optional
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 
 
 class AccountInformationResponse(BaseModel):
     """Response model for account information endpoint."""
 
+    model_config = ConfigDict(frozen=True)
+
     email: EmailStr
     plan_name: str
     plan_level: int
     reset_date: str
     team_id: Optional[int] = None
     calls: dict[str, Any]
+
+
+class PooledKeyInformation(BaseModel):
+    """State and account information of one key in an API key pool."""
+
+    model_config = ConfigDict(frozen=True)
+
+    key: str
+    status: Literal['active', 'ejected']
+    available_at: Optional[datetime] = None
+    remaining: Optional[int] = None
+    in_flight: int = 0
+    account: Optional[AccountInformationResponse] = None
+    error: Optional[str] = None
+
+
+class AccountPoolResponse(BaseModel):
+    """Aggregate account information across an API key pool."""
+
+    model_config = ConfigDict(frozen=True)
+
+    keys: int
+    active_keys: int
+    calls: dict[str, int]
+    reset_date: Optional[str] = None
+    accounts: list[PooledKeyInformation]
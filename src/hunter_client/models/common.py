@@ -2,12 +2,14 @@
 
 from typing import Optional
 
-from pydantic import BaseModel, HttpUrl
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, HttpUrl
 
 
 class EmailSource(BaseModel):
     """Model for email source information."""
 
+    model_config = ConfigDict(frozen=True)
+
     domain: str
     uri: HttpUrl
     extracted_on: str
@@ -18,7 +20,10 @@ class EmailSource(BaseModel):
 class Email(BaseModel):
     """Model for email data."""
 
-    email_value: str
+    model_config = ConfigDict(frozen=True)
+
+    # Hunter.io sends the address as ``value``; ``email_value`` is kept for existing callers
+    email_value: str = Field(validation_alias=AliasChoices('value', 'email_value'))
     type: str
     confidence: int
     sources: list[EmailSource]
@@ -2,8 +2,9 @@
 
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field
 
+from hunter_client.config import DEFAULT_LIMIT, MAX_LIMIT
 from hunter_client.models.common import Email
 
 
@@ -14,22 +15,40 @@ class DomainSearchParams(BaseModel):
     email_type: Optional[str] = None
     seniority: Optional[str] = None
     department: Optional[str] = None
-    limit: int = 10
-    offset: int = 0
+    limit: int = Field(default=DEFAULT_LIMIT, ge=1, le=MAX_LIMIT)
+    offset: int = Field(default=0, ge=0)
+
+
+class DomainEmailStreamParams(BaseModel):
+    """Query parameters for streaming every email of a domain."""
+
+    domain: str
+    email_type: Optional[str] = None
+    seniority: Optional[str] = None
+    department: Optional[str] = None
+    page_size: int = Field(default=MAX_LIMIT, ge=1, le=MAX_LIMIT)
 
 
 class DomainSearchMeta(BaseModel):
     """Metadata for domain search results."""
 
-    total_results: int
+    model_config = ConfigDict(frozen=True)
+
+    # Hunter.io sends ``results`` and ``params``; the field names are kept for existing callers
+    total_results: int = Field(validation_alias=AliasChoices('results', 'total_results'))
     limit: int
     offset: int
-    search_params: Optional[dict[str, str | int]] = None
+    search_params: Optional[dict[str, Optional[str | int]]] = Field(
+        default=None,
+        validation_alias=AliasChoices('params', 'search_params'),
+    )
 
 
 class DomainSearchResponse(BaseModel):
     """Response model for domain search endpoint."""
 
+    model_config = ConfigDict(frozen=True)
+
     domain: str
     disposable: bool
     webmail: bool
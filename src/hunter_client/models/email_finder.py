@@ -1,11 +1,16 @@
 """Email finder related models."""
 
-from typing import Optional
+from typing import Literal, Optional
 
-from pydantic import BaseModel, EmailStr, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, HttpUrl
 
 from hunter_client.models.common import EmailSource
 
+# ``off`` always asks Hunter.io; ``prefer`` answers from a learned domain
+# pattern when one is trusted and asks Hunter.io otherwise; ``only`` never
+# calls upstream
+InferMode = Literal['off', 'prefer', 'only']
+
 
 class EmailFinderRequest(BaseModel):
     """Request model for email finder endpoint."""
@@ -14,11 +19,14 @@ class EmailFinderRequest(BaseModel):
     first_name: Optional[str] = None
     last_name: Optional[str] = None
     full_name: Optional[str] = None
+    infer: InferMode = 'off'
 
 
 class EmailFinderResponse(BaseModel):
     """Response model for email finder endpoint."""
 
+    model_config = ConfigDict(frozen=True)
+
     email: Optional[EmailStr] = None
     score: Optional[int] = None
     domain: str
@@ -34,3 +42,5 @@ class EmailFinderResponse(BaseModel):
     phone_number: Optional[str] = None
     company: Optional[str] = None
     sources: list[EmailSource] = Field(default_factory=list)
+    # Synthesized locally from the domain's email pattern rather than returned by Hunter.io
+    inferred: bool = False
@@ -1,7 +1,10 @@
 """Email verifier related models."""
 
-from pydantic import BaseModel, EmailStr, Field
+from typing import Optional
 
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
+
+from hunter_client.config import BULK_VERIFY_CONCURRENCY, BULK_VERIFY_MAX_EMAILS
 from hunter_client.models.common import EmailSource
 
 
@@ -14,6 +17,8 @@ class EmailVerifierRequest(BaseModel):
 class EmailVerifierResponse(BaseModel):
     """Response model for email verifier endpoint."""
 
+    model_config = ConfigDict(frozen=True)
+
     status: str
     verification_result: str = Field(alias='result')
     score: int
@@ -28,3 +33,21 @@ class EmailVerifierResponse(BaseModel):
     accept_all: bool
     block: bool
     sources: list[EmailSource] = Field(default_factory=list)
+
+
+class BulkEmailVerifierRequest(BaseModel):
+    """Request model for bulk email verification."""
+
+    emails: list[str] = Field(min_length=1, max_length=BULK_VERIFY_MAX_EMAILS)
+    concurrency: int = Field(default=BULK_VERIFY_CONCURRENCY, ge=1, le=BULK_VERIFY_CONCURRENCY * 5)
+
+
+class BulkVerificationResult(BaseModel):
+    """One line of bulk verification output: a result or an error."""
+
+    model_config = ConfigDict(frozen=True)
+
+    email: str
+    result: Optional[EmailVerifierResponse] = None
+    error: Optional[str] = None
+    status_code: Optional[int] = None
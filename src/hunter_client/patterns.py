@@ -0,0 +1,213 @@
+"""Email pattern inference from Hunter.io responses."""
+
+import threading
+import unicodedata
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from hunter_client.config import (
+    HTTP_NOT_FOUND,
+    PATTERN_INDEX_SIZE,
+    PATTERN_MIN_CONFIDENCE,
+    PATTERN_MIN_OBSERVATIONS,
+)
+from hunter_client.metrics import ClientHooks
+from hunter_client.models.common import Email
+from hunter_client.models.domain import DomainSearchResponse
+from hunter_client.models.email_finder import EmailFinderResponse
+from hunter_client.response_handler import HunterAPIError
+
+# Patterns recognized in observed addresses, in Hunter.io's ``{token}`` notation
+KNOWN_PATTERNS = (
+    '{first}',
+    '{last}',
+    '{first}.{last}',
+    '{first}{last}',
+    '{first}_{last}',
+    '{first}-{last}',
+    '{f}{last}',
+    '{f}.{last}',
+    '{f}_{last}',
+    '{first}{l}',
+    '{first}.{l}',
+    '{f}{l}',
+    '{last}.{first}',
+    '{last}{first}',
+    '{last}_{first}',
+    '{last}{f}',
+    '{last}.{f}',
+)
+
+
+class PatternNotFoundError(HunterAPIError):
+    """Raised when ``infer='only'`` finds no confident pattern for a domain."""
+
+    def __init__(self, domain: str) -> None:
+        """Initialize with a 404 status."""
+        super().__init__('No confident email pattern known for {0}'.format(domain), HTTP_NOT_FOUND)
+
+
+@dataclass(frozen=True)
+class PatternMatch:
+    """The dominant pattern of a domain and how consistently it was observed."""
+
+    pattern: str
+    confidence: float
+    observations: int
+
+
+def normalize_name(name: Optional[str]) -> str:
+    """Reduce a name to the lowercase ASCII letters and digits used in addresses."""
+    if not name:
+        return ''
+    ascii_name = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode()
+    return ''.join(char for char in ascii_name.lower() if char.isalnum())
+
+
+def split_full_name(full_name: str) -> tuple[str, str]:
+    """Split a full name into its first and last words."""
+    name_parts = full_name.split()
+    if len(name_parts) < 2:
+        return full_name.strip(), ''
+    return name_parts[0], name_parts[-1]
+
+
+def render_pattern(pattern: str, first_name: str, last_name: str) -> Optional[str]:
+    """Fill a pattern with normalized names, or None if a name it needs is missing."""
+    first = normalize_name(first_name)
+    last = normalize_name(last_name)
+    if ('{first}' in pattern or '{f}' in pattern) and not first:
+        return None
+    if ('{last}' in pattern or '{l}' in pattern) and not last:
+        return None
+    try:
+        local_part = pattern.format(first=first, last=last, f=first[:1], l=last[:1])
+    except (KeyError, IndexError, ValueError):
+        return None
+    return local_part or None
+
+
+def derive_pattern(email: str, first_name: Optional[str], last_name: Optional[str]) -> Optional[str]:
+    """Return the single known pattern producing ``email`` from the names, if unambiguous."""
+    local_part = email.partition('@')[0].lower()
+    matches = [
+        pattern
+        for pattern in KNOWN_PATTERNS
+        if render_pattern(pattern, first_name or '', last_name or '') == local_part
+    ]
+    return matches[0] if len(matches) == 1 else None
+
+
+def normalize_domain(domain: str) -> str:
+    """Lowercase a domain and drop a leading ``www.``."""
+    domain = domain.strip().lower()
+    return domain[len('www.') :] if domain.startswith('www.') else domain
+
+
+class PatternIndex(ClientHooks):
+    """Per-domain counts of the address patterns seen in Hunter.io responses.
+
+    Register with ``client.learn_patterns()`` to learn from every validated
+    domain search and finder response. A domain's dominant pattern is trusted
+    once it accounts for ``min_confidence`` of at least ``min_observations``
+    observations; only the most recently updated ``max_domains`` are kept.
+    """
+
+    def __init__(
+        self,
+        max_domains: int = PATTERN_INDEX_SIZE,
+        min_confidence: float = PATTERN_MIN_CONFIDENCE,
+        min_observations: int = PATTERN_MIN_OBSERVATIONS,
+    ) -> None:
+        """Initialize an empty index."""
+        self.max_domains = max_domains
+        self.min_confidence = min_confidence
+        self.min_observations = min_observations
+        self._domains: OrderedDict[str, Counter[str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of domains with observations."""
+        return len(self._domains)
+
+    def observe(self, domain: str, pattern: str) -> None:
+        """Count one occurrence of a pattern on a domain."""
+        domain = normalize_domain(domain)
+        with self._lock:
+            counts = self._domains.pop(domain, None) or Counter()
+            counts[pattern] += 1
+            self._domains[domain] = counts
+            while len(self._domains) > self.max_domains:
+                self._domains.popitem(last=False)
+
+    def observe_email(self, email: str, first_name: Optional[str], last_name: Optional[str]) -> None:
+        """Count the pattern behind a named address, if it can be derived."""
+        pattern = derive_pattern(email, first_name, last_name)
+        if pattern is not None:
+            self.observe(email.rpartition('@')[2], pattern)
+
+    def learn(self, model: Any) -> None:
+        """Count the patterns in a domain search or email finder response, or one of their emails."""
+        if isinstance(model, Email):
+            if model.first_name and model.last_name:
+                self.observe_email(model.email_value, model.first_name, model.last_name)
+        elif isinstance(model, DomainSearchResponse):
+            if model.pattern:
+                self.observe(model.domain, model.pattern)
+            for email in model.emails:
+                if email.first_name and email.last_name:
+                    self.observe_email(email.email_value, email.first_name, email.last_name)
+        elif isinstance(model, EmailFinderResponse) and not model.inferred:
+            if model.email and model.first_name and model.last_name:
+                self.observe_email(model.email, model.first_name, model.last_name)
+            elif model.format:
+                self.observe(model.domain, model.format)
+
+    def response_validated(self, endpoint: str, model: Optional[Any], seconds: float) -> None:
+        """Learn from every freshly validated upstream response."""
+        if model is not None:
+            self.learn(model)
+
+    def best(self, domain: str) -> Optional[PatternMatch]:
+        """Return the domain's dominant pattern if it is trusted."""
+        with self._lock:
+            counts = self._domains.get(normalize_domain(domain))
+            if not counts:
+                return None
+            pattern, hits = counts.most_common(1)[0]
+            observations = counts.total()
+        confidence = hits / observations
+        if observations < self.min_observations or confidence < self.min_confidence:
+            return None
+        return PatternMatch(pattern, confidence, observations)
+
+    def infer(
+        self,
+        domain: str,
+        first_name: Optional[str] = None,
+        last_name: Optional[str] = None,
+        full_name: Optional[str] = None,
+    ) -> Optional[EmailFinderResponse]:
+        """Synthesize a finder result from the domain's trusted pattern.
+
+        The result is marked ``inferred`` and scored by the pattern's confidence.
+        """
+        match = self.best(domain)
+        if match is None:
+            return None
+        if full_name and not (first_name and last_name):
+            first_name, last_name = split_full_name(full_name)
+        local_part = render_pattern(match.pattern, first_name or '', last_name or '')
+        if local_part is None:
+            return None
+        domain = normalize_domain(domain)
+        return EmailFinderResponse(
+            email='{0}@{1}'.format(local_part, domain),
+            score=round(match.confidence * 100),
+            domain=domain,
+            first_name=first_name,
+            last_name=last_name,
+            full_name=full_name,
+            inferred=True,
+        )
@@ -0,0 +1,222 @@
+"""Local checks answering verifications of obviously bad addresses without Hunter.io."""
+
+import re
+import threading
+from collections import Counter
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, Optional, Union, cast
+
+from hunter_client.cache import LRUCache
+from hunter_client.config import GIBBERISH_CONSONANT_RUN, NO_MX_CACHE_SIZE, NO_MX_DOMAIN_TTL
+from hunter_client.endpoints import HunterEndpoints
+from hunter_client.metrics import ClientHooks
+from hunter_client.models.verifier import EmailVerifierResponse
+
+# Dot-atom local part, which may be UTF-8 (RFC 6531), and an IDNA-encoded
+# dotted hostname ending in an alphabetic or punycode (``xn--``) TLD
+EMAIL_SYNTAX = re.compile(
+    r"[a-z0-9!#$%&'*+/=?^_`{|}~\u0080-\U0010ffff-]+(?:\.[a-z0-9!#$%&'*+/=?^_`{|}~\u0080-\U0010ffff-]+)*"
+    r'@(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+(?:[a-z]{2,63}|xn--[a-z0-9-]{1,59})',
+    re.IGNORECASE,
+)
+MAX_LOCAL_PART_LENGTH = 64
+MAX_EMAIL_LENGTH = 254
+CONSONANT_RUN = re.compile('[bcdfghjklmnpqrstvwxz]{{{0},}}'.format(GIBBERISH_CONSONANT_RUN))
+
+# A starter set; extend it with ``disposable_path`` / ``webmail_path`` lists
+DISPOSABLE_DOMAINS = frozenset(
+    (
+        '10minutemail.com',
+        'dispostable.com',
+        'fakeinbox.com',
+        'getnada.com',
+        'guerrillamail.com',
+        'guerrillamail.net',
+        'mailinator.com',
+        'maildrop.cc',
+        'mohmal.com',
+        'sharklasers.com',
+        'temp-mail.org',
+        'throwawaymail.com',
+        'trashmail.com',
+        'yopmail.com',
+    ),
+)
+WEBMAIL_DOMAINS = frozenset(
+    (
+        'aol.com',
+        'gmail.com',
+        'gmx.com',
+        'gmx.de',
+        'googlemail.com',
+        'hotmail.com',
+        'icloud.com',
+        'live.com',
+        'mail.ru',
+        'me.com',
+        'outlook.com',
+        'proton.me',
+        'protonmail.com',
+        'yahoo.com',
+        'yandex.ru',
+        'zoho.com',
+    ),
+)
+
+
+def read_domain_list(path: Union[str, Path]) -> frozenset[str]:
+    """Read one domain per line, skipping blank lines and ``#`` comments."""
+    domains = set()
+    with Path(path).open(encoding='utf-8') as domain_file:
+        for line in domain_file:
+            domain = line.split('#', 1)[0].strip().lower()
+            if domain:
+                domains.add(domain)
+    return frozenset(domains)
+
+
+def domain_suffixes(domain: str) -> Iterable[str]:
+    """Yield a domain and each parent domain, so ``a.mailinator.com`` matches ``mailinator.com``."""
+    labels = domain.split('.')
+    for start in range(len(labels) - 1):
+        yield '.'.join(labels[start:])
+
+
+def idna_domain(domain: str) -> Optional[str]:
+    """Return a domain in lowercase ASCII (IDNA) form, or None if it cannot be encoded.
+
+    ``EmailStr`` turns punycode back into Unicode, so ``example.xn--p1ai``
+    and ``example.рф`` both come out as ``example.xn--p1ai``.
+    """
+    try:
+        return domain.lower().encode('idna').decode('ascii')
+    except UnicodeError:
+        return None
+
+
+def is_valid_syntax(email: str) -> bool:
+    """Check an address against the syntax Hunter.io's ``regexp`` flag reports.
+
+    Lengths are counted in octets, on the IDNA form of the domain.
+    """
+    local_part, at_sign, domain = email.rpartition('@')
+    ascii_domain = idna_domain(domain)
+    if not at_sign or ascii_domain is None:
+        return False
+    address = '{0}@{1}'.format(local_part, ascii_domain)
+    if len(address.encode('utf-8')) > MAX_EMAIL_LENGTH or EMAIL_SYNTAX.fullmatch(address) is None:
+        return False
+    return len(local_part.encode('utf-8')) <= MAX_LOCAL_PART_LENGTH
+
+
+def is_gibberish(local_part: str) -> bool:
+    """Check whether a local part looks machine-generated, by its runs of consonants."""
+    return CONSONANT_RUN.search(local_part.lower()) is not None
+
+
+def local_result(email: str, status: str, verification_result: str, **flags: bool) -> EmailVerifierResponse:
+    """Build a verification answered locally; checks that were not run report False."""
+    checks: dict[str, Any] = {
+        'regexp': True,
+        'gibberish': False,
+        'disposable': False,
+        'webmail': False,
+        'mx_records': False,
+        'smtp_server': False,
+        'smtp_check': False,
+        'accept_all': False,
+        'block': False,
+        **flags,
+    }
+    # Not validated, since malformed addresses are exactly what is reported
+    return EmailVerifierResponse.model_construct(
+        status=status,
+        verification_result=verification_result,
+        score=0,
+        email=email,
+        sources=[],
+        **checks,
+    )
+
+
+class PreVerifier(ClientHooks):
+    """Answers verifications that are certain to fail without an upstream call.
+
+    Malformed addresses, domains on the disposable list and domains Hunter.io
+    recently reported without MX records are answered locally. Webmail
+    domains and gibberish local parts are only risky, so they are answered
+    locally only when ``reject_webmail`` or ``reject_gibberish`` is set.
+    Domain lists given by path are merged into the built-in ones and re-read
+    by ``reload()``. Register with ``client.pre_verify()`` to learn domains
+    without MX records from verifier responses.
+    """
+
+    def __init__(
+        self,
+        disposable_path: Optional[Union[str, Path]] = None,
+        webmail_path: Optional[Union[str, Path]] = None,
+        reject_webmail: bool = False,
+        reject_gibberish: bool = False,
+        no_mx_ttl: float = NO_MX_DOMAIN_TTL,
+    ) -> None:
+        """Load the domain lists."""
+        self.disposable_path = disposable_path
+        self.webmail_path = webmail_path
+        self.reject_webmail = reject_webmail
+        self.reject_gibberish = reject_gibberish
+        self.no_mx_ttl = no_mx_ttl
+        self.rejections: Counter[str] = Counter()
+        self.disposable_domains = DISPOSABLE_DOMAINS
+        self.webmail_domains = WEBMAIL_DOMAINS
+        self._no_mx_domains = LRUCache(max_entries=NO_MX_CACHE_SIZE)
+        self._lock = threading.Lock()
+        self.reload()
+
+    def reload(self) -> None:
+        """Re-read the domain list files, replacing the lists only once both are read."""
+        disposable_domains = DISPOSABLE_DOMAINS
+        if self.disposable_path is not None:
+            disposable_domains = disposable_domains | read_domain_list(self.disposable_path)
+        webmail_domains = WEBMAIL_DOMAINS
+        if self.webmail_path is not None:
+            webmail_domains = webmail_domains | read_domain_list(self.webmail_path)
+        self.disposable_domains = disposable_domains
+        self.webmail_domains = webmail_domains
+
+    def check(self, email: str) -> Optional[EmailVerifierResponse]:
+        """Return a local verification if the address certainly fails, or None to ask Hunter.io."""
+        email = email.strip()
+        if not is_valid_syntax(email):
+            return self._reject('regexp', local_result(email, 'invalid', 'undeliverable', regexp=False))
+        local_part, _, unicode_domain = email.lower().rpartition('@')
+        domain = cast(str, idna_domain(unicode_domain))
+        suffixes = list(domain_suffixes(domain))
+        if any(suffix in self.disposable_domains for suffix in suffixes):
+            return self._reject('disposable', local_result(email, 'disposable', 'risky', disposable=True))
+        if self._no_mx_domains.get(domain) is not None:
+            return self._reject('no_mx', local_result(email, 'invalid', 'undeliverable'))
+        webmail = any(suffix in self.webmail_domains for suffix in suffixes)
+        if webmail and self.reject_webmail:
+            return self._reject('webmail', local_result(email, 'webmail', 'risky', webmail=True))
+        if self.reject_gibberish and is_gibberish(local_part):
+            return self._reject('gibberish', local_result(email, 'invalid', 'risky', gibberish=True, webmail=webmail))
+        return None
+
+    def forget_domain(self, domain: str) -> None:
+        """Stop answering a domain locally after it was learned to have no MX records."""
+        self._no_mx_domains.delete(idna_domain(domain) or domain.lower())
+
+    def response_validated(self, endpoint: str, model: Optional[Any], seconds: float) -> None:
+        """Remember domains Hunter.io reported without MX records."""
+        if endpoint != HunterEndpoints.email_verifier.path or not isinstance(model, EmailVerifierResponse):
+            return
+        if not model.mx_records and not model.smtp_server:
+            domain = str(model.email).rpartition('@')[2]
+            self._no_mx_domains.set(idna_domain(domain) or domain.lower(), True, ttl=self.no_mx_ttl)
+
+    def _reject(self, reason: str, verification: EmailVerifierResponse) -> EmailVerifierResponse:
+        """Count a local answer by reason."""
+        with self._lock:
+            self.rejections[reason] += 1
+        return verification
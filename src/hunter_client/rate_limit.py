@@ -0,0 +1,264 @@
+"""Client-side rate limiting and quota tracking for Hunter.io API."""
+
+import asyncio
+import contextlib
+import logging
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from typing import Optional
+
+from hunter_client.config import HTTP_TOO_MANY_REQUESTS, QUOTA_REFRESH_INTERVAL
+from hunter_client.endpoints import get_endpoint_config
+from hunter_client.models.account import AccountInformationResponse
+from hunter_client.response_handler import HunterAPIError
+
+logger = logging.getLogger(__name__)
+
+
+class QuotaExceededError(HunterAPIError):
+    """Raised locally when a call would dip into the reserved quota."""
+
+    def __init__(self, message: str) -> None:
+        """Initialize with a 429 status so callers treat it like upstream throttling."""
+        super().__init__(message, HTTP_TOO_MANY_REQUESTS)
+
+
+class TokenBucket:
+    """Thread-safe token bucket that hands out reservations instead of rejections.
+
+    ``reserve`` always takes a token and returns how long the caller must wait
+    before using it, so concurrent callers queue up fairly instead of retrying.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a full bucket refilling at ``rate`` tokens per second."""
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return the delay in seconds before it is valid."""
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def try_acquire(self) -> bool:
+        """Take a token only if one is available now."""
+        with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def release(self) -> None:
+        """Give back a token taken with ``try_acquire`` that ended up unused."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens + 1)
+
+    def pause(self, seconds: float) -> None:
+        """Drain the bucket so no token becomes available for ``seconds``."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+    def acquire(self) -> None:
+        """Block until a token is available."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait without blocking the event loop until a token is available."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _refill(self) -> None:
+        """Add tokens for the time elapsed since the last update."""
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+
+class RateLimiter:
+    """Per-endpoint token buckets using the rates declared in ``HunterEndpoints``.
+
+    Limits apply per process, so ``workers`` processes sharing one API key
+    each get an equal share of every rate.
+    """
+
+    def __init__(self, rates: Optional[dict[str, float]] = None, workers: int = 1) -> None:
+        """Initialize, optionally overriding rates (requests/second) by endpoint path.
+
+        A rate of ``0`` disables limiting for that endpoint.
+        """
+        if workers < 1:
+            raise ValueError('RateLimiter needs at least one worker')
+        self._rates = rates or {}
+        self.workers = workers
+        self._buckets: dict[str, Optional[TokenBucket]] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, endpoint: str) -> Optional[TokenBucket]:
+        """Return the bucket for an endpoint, or None if it is unlimited."""
+        with self._lock:
+            if endpoint not in self._buckets:
+                rate = self._rates.get(endpoint)
+                if rate is None:
+                    endpoint_config = get_endpoint_config(endpoint)
+                    rate = endpoint_config.rate_limit if endpoint_config else None
+                self._buckets[endpoint] = TokenBucket(rate / self.workers) if rate else None
+            return self._buckets[endpoint]
+
+    def acquire(self, endpoint: str) -> None:
+        """Block until the endpoint may be called."""
+        endpoint_bucket = self.bucket(endpoint)
+        if endpoint_bucket is not None:
+            endpoint_bucket.acquire()
+
+    async def acquire_async(self, endpoint: str) -> None:
+        """Wait until the endpoint may be called."""
+        endpoint_bucket = self.bucket(endpoint)
+        if endpoint_bucket is not None:
+            await endpoint_bucket.acquire_async()
+
+    def penalize(self, endpoint: str, seconds: float) -> None:
+        """Hold back all calls to an endpoint after upstream throttled us."""
+        endpoint_bucket = self.bucket(endpoint)
+        if endpoint_bucket is not None:
+            endpoint_bucket.pause(seconds)
+
+
+class QuotaTracker:
+    """Tracks remaining credits between ``/account`` refreshes.
+
+    Billable calls are rejected with ``QuotaExceededError`` once the remaining
+    credits drop to ``reserve``. Until the first refresh nothing is enforced.
+    """
+
+    def __init__(self, reserve: int = 0) -> None:
+        """Initialize with an unknown quota."""
+        self.reserve = reserve
+        self.remaining: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def update(self, account: AccountInformationResponse) -> None:
+        """Reset the remaining credits from an account response."""
+        used = account.calls.get('used')
+        available = account.calls.get('available')
+        if not isinstance(used, int) or not isinstance(available, int):
+            return
+        with self._lock:
+            self.remaining = available - used
+
+    def check(self, endpoint: str) -> None:
+        """Raise if a billable call to ``endpoint`` would exceed the quota."""
+        if not is_billable(endpoint) or self.remaining is None:
+            return
+        if self.remaining <= self.reserve:
+            raise QuotaExceededError(
+                'Hunter.io quota reserve reached ({0} credits left)'.format(self.remaining),
+            )
+
+    def consume(self, endpoint: str) -> None:
+        """Account one successful billable call."""
+        if not is_billable(endpoint):
+            return
+        with self._lock:
+            if self.remaining is not None:
+                self.remaining -= 1
+
+
+class QuotaScheduler:
+    """Runs a quota refresh, e.g. updating a ``QuotaTracker`` from ``/account``, on a background thread."""
+
+    def __init__(self, refresh_quota: Callable[[], object], interval: float = QUOTA_REFRESH_INTERVAL) -> None:
+        """Initialize without starting the thread."""
+        self.interval = interval
+        self._refresh_quota = refresh_quota
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def refresh(self) -> None:
+        """Refresh the quota once, logging failures."""
+        try:
+            self._refresh_quota()
+        except Exception:
+            logger.warning('Failed to refresh Hunter.io quota', exc_info=True)
+
+    def start(self) -> None:
+        """Refresh now and then every ``interval`` seconds."""
+        self._thread = threading.Thread(target=self._run, name='hunter-quota-refresh', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop refreshing."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        """Refresh until stopped."""
+        self.refresh()
+        while not self._stopped.wait(self.interval):
+            self.refresh()
+
+
+class AsyncQuotaScheduler:
+    """Runs a quota refresh, e.g. updating a ``QuotaTracker`` from ``/account``, in an asyncio task."""
+
+    def __init__(
+        self,
+        refresh_quota: Callable[[], Awaitable[object]],
+        interval: float = QUOTA_REFRESH_INTERVAL,
+    ) -> None:
+        """Initialize without starting the task."""
+        self.interval = interval
+        self._refresh_quota = refresh_quota
+        self._task: Optional[asyncio.Task[None]] = None
+
+    async def refresh(self) -> None:
+        """Refresh the quota once, logging failures."""
+        try:
+            await self._refresh_quota()
+        except Exception:
+            logger.warning('Failed to refresh Hunter.io quota', exc_info=True)
+
+    def start(self) -> None:
+        """Refresh now and then every ``interval`` seconds."""
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the refresh task."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        """Refresh until cancelled."""
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self.interval)
+
+
+def is_billable(endpoint: str) -> bool:
+    """Check whether calls to an endpoint spend credits."""
+    endpoint_config = get_endpoint_config(endpoint)
+    return endpoint_config is not None and endpoint_config.billable
@@ -1,12 +1,22 @@
 """Response handling for Hunter.io API."""
 
-from typing import Any, TypeVar, cast
+from typing import Any, Literal, TypeVar, cast
 
 import httpx
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError, create_model
+
+from hunter_client.timing import measure
 
 ResponseType = TypeVar('ResponseType')
 
+# ``validate`` decodes with ``response.json()`` and validates the resulting
+# dict; ``fast`` hands the raw bytes to pydantic-core, which parses and
+# validates in a single pass
+DecodeMode = Literal['validate', 'fast']
+DEFAULT_DECODE_MODE: DecodeMode = 'validate'
+
+_envelopes: dict[type[Any], type[BaseModel]] = {}
+
 
 class HunterAPIError(Exception):
     """Custom exception for Hunter API errors."""
@@ -20,16 +30,27 @@ class HunterAPIError(Exception):
 def parse_json_response(response: httpx.Response) -> dict[str, Any]:
     """Parse JSON from response."""
     try:
-        return cast(dict[str, Any], response.json())
+        with measure('parse'):
+            return cast(dict[str, Any], response.json())
     except Exception as error:
         error_msg = 'Failed to parse JSON: {0}'.format(error)
         raise HunterAPIError(error_msg) from error
 
 
 def extract_model_data(json_data: dict[str, Any]) -> dict[str, Any]:
-    """Extract model data from JSON response."""
+    """Extract model data from JSON response.
+
+    Hunter.io sends pagination ``meta`` next to ``data``; it is added to the
+    model data so models with a ``meta`` field keep it.
+    """
     data_value = json_data.get('data')
-    return cast(dict[str, Any], data_value) if data_value is not None else json_data
+    if data_value is None:
+        return json_data
+    model_data = cast(dict[str, Any], data_value)
+    meta = json_data.get('meta')
+    if meta is not None and 'meta' not in model_data:
+        return {**model_data, 'meta': meta}
+    return model_data
 
 
 def validate_response_model(
@@ -39,12 +60,31 @@ def validate_response_model(
     """Validate and create response model."""
     model_data = extract_model_data(json_data)
     try:
-        return response_model(**model_data)
+        with measure('validate'):
+            return response_model(**model_data)
     except ValidationError as error:
         error_msg = 'Validation error: {0}'.format(error)
         raise HunterAPIError(error_msg) from error
 
 
+def validate_response_json(content: bytes, response_model: type[ResponseType]) -> ResponseType:
+    """Parse and validate a ``{"data": ..., "meta": ...}`` body straight from its bytes.
+
+    Parsing is not a separate step here, so its time counts as ``validate``.
+    """
+    try:
+        with measure('validate'):
+            envelope = _envelope_model(response_model).model_validate_json(content)
+    except ValidationError as error:
+        error_msg = 'Validation error: {0}'.format(error)
+        raise HunterAPIError(error_msg) from error
+    model_data = getattr(envelope, 'data')
+    meta = getattr(envelope, 'meta', None)
+    if meta is not None and model_data.meta is None:
+        model_data = model_data.model_copy(update={'meta': meta})
+    return cast(ResponseType, model_data)
+
+
 def check_http_status(response: httpx.Response) -> None:
     """Check HTTP status and raise error if needed."""
     try:
@@ -57,8 +97,27 @@ def check_http_status(response: httpx.Response) -> None:
 def process_api_response(
     response: httpx.Response,
     response_model: type[ResponseType],
+    decode_mode: DecodeMode = DEFAULT_DECODE_MODE,
 ) -> ResponseType:
     """Process API response and return model instance."""
     check_http_status(response)
+    if decode_mode == 'fast':
+        return validate_response_json(response.content, response_model)
     json_data = parse_json_response(response)
     return validate_response_model(json_data, response_model)
+
+
+def _envelope_model(response_model: type[Any]) -> type[BaseModel]:
+    """Return a model matching Hunter.io's ``{"data": <response_model>}`` body.
+
+    Models with a ``meta`` field also read the top-level ``meta``.
+    """
+    envelope = _envelopes.get(response_model)
+    if envelope is None:
+        fields: dict[str, Any] = {'data': (response_model, ...)}
+        meta_field = getattr(response_model, 'model_fields', {}).get('meta')
+        if meta_field is not None:
+            fields['meta'] = (meta_field.annotation, None)
+        envelope = create_model('{0}Envelope'.format(response_model.__name__), **fields)
+        _envelopes[response_model] = envelope
+    return envelope
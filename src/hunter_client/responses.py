@@ -0,0 +1,56 @@
+"""Fast JSON responses for validated Hunter.io models."""
+
+from typing import Any, Optional
+
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+from hunter_client.cache import LRUCache
+from hunter_client.config import SERIALIZED_CACHE_MAX_BYTES, SERIALIZED_CACHE_SIZE
+from hunter_client.timing import measure
+
+
+class ModelSerializer:
+    """Serializes frozen models to JSON, remembering the bytes of recent ones.
+
+    Cache hits hand out the same model instance, so repeat responses reuse
+    its encoded body instead of serializing it again.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = SERIALIZED_CACHE_SIZE,
+        max_bytes: int = SERIALIZED_CACHE_MAX_BYTES,
+    ) -> None:
+        """Initialize with an empty memo."""
+        self.memo = LRUCache(max_entries, max_bytes)
+
+    def dumps(self, model: BaseModel) -> bytes:
+        """Return the JSON body FastAPI would produce for ``model``."""
+        memo_key = str(id(model))
+        # Entries keep their model alive, so a matching id is the same object
+        memoized: Optional[tuple[BaseModel, bytes]] = self.memo.get(memo_key)
+        if memoized is not None and memoized[0] is model:
+            return memoized[1]
+        body = model.model_dump_json(by_alias=True).encode()
+        self.memo.set(memo_key, (model, body), size=len(body))
+        return body
+
+
+model_serializer = ModelSerializer()
+
+
+class ModelResponse(Response):
+    """JSON response for an already validated model.
+
+    Returning it from a route skips FastAPI's ``response_model`` validation
+    and serialization; the route's ``response_model`` still documents the
+    schema.
+    """
+
+    media_type = 'application/json'
+
+    def render(self, content: Any) -> bytes:
+        """Serialize the model once, reusing memoized bytes for repeats."""
+        with measure('serialize'):
+            return model_serializer.dumps(content)
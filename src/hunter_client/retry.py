@@ -0,0 +1,183 @@
+"""Retry policy and circuit breaker for Hunter.io API calls."""
+
+import random
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Optional
+
+import httpx
+
+from hunter_client.config import (
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_RESET_TIMEOUT,
+    HTTP_SERVICE_UNAVAILABLE,
+    RETRY_BACKOFF_BASE,
+    RETRY_BACKOFF_MAX,
+    RETRY_BUDGET_MIN_RETRIES,
+    RETRY_BUDGET_RATIO,
+    RETRY_MAX_ATTEMPTS,
+    RETRY_MAX_RETRY_AFTER,
+)
+from hunter_client.response_handler import HunterAPIError
+
+RETRYABLE_STATUSES = frozenset((429, 500, 502, 503, 504))
+RETRYABLE_EXCEPTIONS = (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+
+
+class CircuitOpenError(HunterAPIError):
+    """Raised without calling upstream while an endpoint's circuit is open."""
+
+    def __init__(self, endpoint: str, retry_in: float) -> None:
+        """Initialize with a 503 status."""
+        super().__init__(
+            'Circuit open for {0}: upstream is failing, retry in {1:.1f}s'.format(endpoint, retry_in),
+            HTTP_SERVICE_UNAVAILABLE,
+        )
+        self.retry_in = retry_in
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How GET requests are retried.
+
+    Retries use exponential backoff with full jitter, honour ``Retry-After``
+    up to ``max_retry_after`` seconds (longer waits fail immediately) and are
+    capped by a budget of ``budget_ratio`` retries per request, with
+    ``budget_min_retries`` always available.
+    """
+
+    max_attempts: int = RETRY_MAX_ATTEMPTS
+    backoff_base: float = RETRY_BACKOFF_BASE
+    backoff_max: float = RETRY_BACKOFF_MAX
+    max_retry_after: float = RETRY_MAX_RETRY_AFTER
+    retry_statuses: frozenset[int] = RETRYABLE_STATUSES
+    budget_ratio: float = RETRY_BUDGET_RATIO
+    budget_min_retries: int = RETRY_BUDGET_MIN_RETRIES
+
+    def backoff(self, attempt: int) -> float:
+        """Return a jittered delay before retry number ``attempt`` (0-based)."""
+        ceiling = min(self.backoff_max, self.backoff_base * (2**attempt))
+        return random.uniform(0, ceiling)  # noqa: S311
+
+
+class RetryBudget:
+    """Limits retries to a fraction of recent traffic to avoid retry storms."""
+
+    def __init__(self, ratio: float, min_retries: int) -> None:
+        """Initialize with ``min_retries`` tokens available."""
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self._tokens = float(min_retries)
+        self._max_tokens = float(min_retries) + 1 / ratio if ratio else float(min_retries)
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        """Credit the budget for one original request."""
+        with self._lock:
+            self._tokens = min(self._max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Spend one retry if the budget allows it."""
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one endpoint.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    calls fail fast for ``reset_timeout`` seconds. Then a single probe is let
+    through; its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = CIRCUIT_RESET_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a closed circuit."""
+        self.endpoint = endpoint
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Return ``closed``, ``open`` or ``half_open``."""
+        if self._opened_at is None:
+            return 'closed'
+        if self._clock() - self._opened_at < self.reset_timeout:
+            return 'open'
+        return 'half_open'
+
+    def before_request(self) -> bool:
+        """Raise ``CircuitOpenError`` unless a call may go upstream now.
+
+        Return whether the call is the half-open probe; a probe that ends
+        without a recorded outcome must be handed back with ``release_probe``.
+        """
+        with self._lock:
+            current_state = self.state
+            if current_state == 'closed':
+                return False
+            if current_state == 'half_open' and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            opened_at = self._opened_at or 0.0
+            retry_in = max(self.reset_timeout - (self._clock() - opened_at), 0.0)
+        raise CircuitOpenError(self.endpoint, retry_in)
+
+    def record_success(self) -> None:
+        """Close the circuit after a healthy response."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the circuit at the threshold."""
+        with self._lock:
+            self._failures += 1
+            if self._probe_in_flight or self._failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+            self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """Let the next call probe again after a probe that ended without an outcome."""
+        with self._lock:
+            self._probe_in_flight = False
+
+
+class CircuitBreakerRegistry:
+    """Creates one ``CircuitBreaker`` per endpoint on first use."""
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = CIRCUIT_RESET_TIMEOUT,
+    ) -> None:
+        """Initialize with the settings shared by every breaker."""
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, endpoint: str) -> CircuitBreaker:
+        """Return the breaker guarding ``endpoint``."""
+        with self._lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None:
+                breaker = CircuitBreaker(endpoint, self.failure_threshold, self.reset_timeout)
+                self._breakers[endpoint] = breaker
+            return breaker
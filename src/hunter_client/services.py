@@ -1,18 +1,310 @@
 """Service classes for Hunter.io API operations."""
 
-from typing import Any, Optional
+import asyncio
+from collections.abc import AsyncIterator, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Optional, cast
 
+import httpx
+
+from hunter_client.config import BULK_VERIFY_CONCURRENCY, MAX_LIMIT
+from hunter_client.contacts import ContactStore
+from hunter_client.email_table import EmailTable
 from hunter_client.endpoints import (
     HunterEndpoints,
     build_domain_search_params,
     build_email_finder_params,
 )
-from hunter_client.http_client import BaseHTTPClient
-from hunter_client.models.account import AccountInformationResponse
+from hunter_client.http_client import AsyncBaseHTTPClient, BaseHTTPClient, HTTPClientCore
+from hunter_client.key_pool import APIKeyPool, mask_api_key
+from hunter_client.models.account import AccountInformationResponse, AccountPoolResponse
+from hunter_client.models.common import Email
 from hunter_client.models.domain import DomainSearchParams, DomainSearchResponse
-from hunter_client.models.email_finder import EmailFinderResponse
-from hunter_client.models.verifier import EmailVerifierResponse
-from hunter_client.response_handler import process_api_response
+from hunter_client.models.email_finder import EmailFinderResponse, InferMode
+from hunter_client.models.verifier import BulkVerificationResult, EmailVerifierResponse
+from hunter_client.patterns import PatternIndex, PatternNotFoundError, normalize_domain
+from hunter_client.response_handler import HunterAPIError, ResponseType, check_http_status
+from hunter_client.streaming import AsyncDomainSearchStream, DomainSearchStream
+
+
+def fetch_model(
+    client: BaseHTTPClient,
+    endpoint: str,
+    response_model: type[ResponseType],
+    request_params: Optional[dict[str, Any]] = None,
+) -> ResponseType:
+    """Fetch an endpoint and return its validated model, serving repeats from cache.
+
+    Entries past their soft TTL are served as is and refreshed in the background.
+    """
+    request_params = request_params or {}
+    cache_key = client.create_cache_key(endpoint, request_params)
+    cached, stale = client.lookup_entry(endpoint, cache_key)
+    if cached is not None:
+        if stale:
+            client.revalidate(cache_key, lambda: refresh_model(client, endpoint, response_model, request_params))
+        return _unwrap_cached(cached, response_model)
+    return refresh_model(client, endpoint, response_model, request_params)
+
+
+def refresh_model(
+    client: BaseHTTPClient,
+    endpoint: str,
+    response_model: type[ResponseType],
+    request_params: Optional[dict[str, Any]] = None,
+) -> ResponseType:
+    """Fetch an endpoint without consulting the cache, then store the result.
+
+    Concurrent calls with the same cache key are coalesced into one request.
+    """
+    request_params = request_params or {}
+    cache_key = client.create_cache_key(endpoint, request_params)
+
+    def fetch_and_store() -> ResponseType:
+        response = client.get(endpoint, request_params)
+        return _parse_and_store(client, endpoint, cache_key, response, response_model)
+
+    # Identical concurrent lookups share one upstream call and parsed result
+    return client.in_flight.do(cache_key, fetch_and_store)
+
+
+def fetch_uncached_model(
+    client: BaseHTTPClient,
+    endpoint: str,
+    response_model: type[ResponseType],
+    request_params: Optional[dict[str, Any]] = None,
+) -> ResponseType:
+    """Fetch an endpoint and return its validated model without reading or filling the cache."""
+    response = client.get(endpoint, request_params or {})
+    return client.parse_response(endpoint, response, response_model)
+
+
+async def afetch_model(
+    client: AsyncBaseHTTPClient,
+    endpoint: str,
+    response_model: type[ResponseType],
+    request_params: Optional[dict[str, Any]] = None,
+) -> ResponseType:
+    """Async variant of ``fetch_model``."""
+    request_params = request_params or {}
+    cache_key = client.create_cache_key(endpoint, request_params)
+    cached, stale = await client.alookup_entry(endpoint, cache_key)
+    if cached is not None:
+        if stale:
+            client.revalidate(cache_key, lambda: arefresh_model(client, endpoint, response_model, request_params))
+        return _unwrap_cached(cached, response_model)
+    return await arefresh_model(client, endpoint, response_model, request_params)
+
+
+async def arefresh_model(
+    client: AsyncBaseHTTPClient,
+    endpoint: str,
+    response_model: type[ResponseType],
+    request_params: Optional[dict[str, Any]] = None,
+) -> ResponseType:
+    """Async variant of ``refresh_model``."""
+    request_params = request_params or {}
+    cache_key = client.create_cache_key(endpoint, request_params)
+
+    async def fetch_and_store() -> ResponseType:
+        response = await client.get(endpoint, request_params)
+        return await _aparse_and_store(client, endpoint, cache_key, response, response_model)
+
+    return await client.in_flight.do(cache_key, fetch_and_store)
+
+
+async def afetch_uncached_model(
+    client: AsyncBaseHTTPClient,
+    endpoint: str,
+    response_model: type[ResponseType],
+    request_params: Optional[dict[str, Any]] = None,
+) -> ResponseType:
+    """Async variant of ``fetch_uncached_model``."""
+    response = await client.get(endpoint, request_params or {})
+    return client.parse_response(endpoint, response, response_model)
+
+
+def next_page_offset(page: DomainSearchResponse, search_params: DomainSearchParams) -> Optional[int]:
+    """Return the offset of the page after ``page``, or None when it was the last."""
+    if not page.emails:
+        return None
+    next_offset = search_params.offset + search_params.limit
+    if page.meta is None:
+        return next_offset if len(page.emails) >= search_params.limit else None
+    return next_offset if next_offset < page.meta.total_results else None
+
+
+def contacts_key(domain: str) -> str:
+    """Return the revalidation key of a domain's contact store entry."""
+    return 'contacts:{0}'.format(normalize_domain(domain))
+
+
+def refresh_contacts(client: BaseHTTPClient, store: ContactStore, domain: str) -> None:
+    """Fetch every unfiltered page of a domain from upstream again and record it."""
+    search_params: Optional[DomainSearchParams] = DomainSearchParams(
+        domain=domain,
+        limit=store.page_size(domain) or MAX_LIMIT,
+    )
+    while search_params is not None:
+        request_params = build_domain_search_params(search_params)
+        page = refresh_model(client, HunterEndpoints.domain_search.path, DomainSearchResponse, request_params)
+        store.record(search_params, page)
+        next_offset = next_page_offset(page, search_params)
+        search_params = None if next_offset is None else search_params.model_copy(update={'offset': next_offset})
+
+
+async def arefresh_contacts(client: AsyncBaseHTTPClient, store: ContactStore, domain: str) -> None:
+    """Async variant of ``refresh_contacts``."""
+    search_params: Optional[DomainSearchParams] = DomainSearchParams(
+        domain=domain,
+        limit=store.page_size(domain) or MAX_LIMIT,
+    )
+    while search_params is not None:
+        request_params = build_domain_search_params(search_params)
+        page = await arefresh_model(client, HunterEndpoints.domain_search.path, DomainSearchResponse, request_params)
+        store.record(search_params, page)
+        next_offset = next_page_offset(page, search_params)
+        search_params = None if next_offset is None else search_params.model_copy(update={'offset': next_offset})
+
+
+def normalize_email(email: str) -> str:
+    """Strip an address and lowercase its domain; the local part is case-sensitive."""
+    local_part, at, domain = email.strip().rpartition('@')
+    return '{0}{1}{2}'.format(local_part, at, domain.lower())
+
+
+def unique_emails(emails: Iterable[str]) -> Iterator[tuple[str, str]]:
+    """Yield each address once as the caller's first spelling and its normalized form, in input order.
+
+    Blank entries are skipped.
+    """
+    seen: set[str] = set()
+    for raw_email in emails:
+        email = normalize_email(raw_email)
+        if email and email not in seen:
+            seen.add(email)
+            yield raw_email.strip(), email
+
+
+def bulk_result(email: str, outcome: Any) -> BulkVerificationResult:
+    """Wrap a verification outcome, successful or not, for bulk output."""
+    if isinstance(outcome, HunterAPIError):
+        return BulkVerificationResult(email=email, error=str(outcome), status_code=outcome.status_code)
+    if isinstance(outcome, Exception):
+        return BulkVerificationResult(email=email, error=str(outcome))
+    return BulkVerificationResult(email=email, result=outcome)
+
+
+def _unwrap_cached(cached: Any, response_model: type[ResponseType]) -> ResponseType:
+    """Return a cached model, re-raising cached negative results."""
+    if isinstance(cached, HunterAPIError):
+        # Raise a fresh instance so tracebacks do not pile up on the cached one
+        raise HunterAPIError(str(cached), cached.status_code)
+    return cast(ResponseType, cached)
+
+
+def infer_email(
+    client: BaseHTTPClient,
+    infer: InferMode,
+    request_params: dict[str, Any],
+) -> Optional[EmailFinderResponse]:
+    """Answer a find locally, or return None to ask upstream.
+
+    A cached upstream answer wins over one synthesized from the domain's
+    learned pattern. Raises ``PatternNotFoundError`` instead of returning None
+    when ``infer='only'``.
+    """
+    _require_pattern_index(client)
+    endpoint = HunterEndpoints.email_finder.path
+    cached = client.lookup_result(endpoint, client.create_cache_key(endpoint, request_params))
+    return _infer_uncached(client, infer, request_params, cached)
+
+
+async def ainfer_email(
+    client: AsyncBaseHTTPClient,
+    infer: InferMode,
+    request_params: dict[str, Any],
+) -> Optional[EmailFinderResponse]:
+    """Async variant of ``infer_email``."""
+    _require_pattern_index(client)
+    endpoint = HunterEndpoints.email_finder.path
+    cached = await client.alookup_result(endpoint, client.create_cache_key(endpoint, request_params))
+    return _infer_uncached(client, infer, request_params, cached)
+
+
+def _require_pattern_index(client: HTTPClientCore) -> None:
+    """Raise unless the client learns patterns."""
+    if client.pattern_index is None:
+        raise ValueError('Pattern inference needs learn_patterns() on the client')
+
+
+def _infer_uncached(
+    client: HTTPClientCore,
+    infer: InferMode,
+    request_params: dict[str, Any],
+    cached: Optional[Any],
+) -> Optional[EmailFinderResponse]:
+    """Return the cached answer of a find, or one synthesized from the domain's pattern."""
+    if isinstance(cached, EmailFinderResponse):
+        return cached
+    inferred = cast(PatternIndex, client.pattern_index).infer(
+        request_params['domain'],
+        request_params['first_name'],
+        request_params['last_name'],
+        request_params['full_name'],
+    )
+    if inferred is None and infer == 'only':
+        raise PatternNotFoundError(request_params['domain'])
+    return inferred
+
+
+def pre_verify(client: HTTPClientCore, email: str) -> Optional[EmailVerifierResponse]:
+    """Return a local verification for an address certain to fail, if pre-verification is on."""
+    if client.pre_verifier is None:
+        return None
+    return client.pre_verifier.check(email)
+
+
+def require_key_pool(client: HTTPClientCore) -> APIKeyPool:
+    """Return the client's API key pool, raising if it was given a single key."""
+    if client.key_pool is None:
+        raise ValueError('The client was created with a single API key')
+    return client.key_pool
+
+
+def _parse_and_store(
+    client: HTTPClientCore,
+    endpoint: str,
+    cache_key: str,
+    response: httpx.Response,
+    response_model: type[ResponseType],
+) -> ResponseType:
+    """Validate a response once and cache the resulting model or error."""
+    try:
+        parsed = client.parse_response(endpoint, response, response_model)
+    except HunterAPIError as error:
+        client.store_result(endpoint, cache_key, error, response)
+        raise
+    client.store_result(endpoint, cache_key, parsed, response)
+    return parsed
+
+
+async def _aparse_and_store(
+    client: AsyncBaseHTTPClient,
+    endpoint: str,
+    cache_key: str,
+    response: httpx.Response,
+    response_model: type[ResponseType],
+) -> ResponseType:
+    """Async variant of ``_parse_and_store``."""
+    try:
+        parsed = client.parse_response(endpoint, response, response_model)
+    except HunterAPIError as error:
+        await client.astore_result(endpoint, cache_key, error, response)
+        raise
+    await client.astore_result(endpoint, cache_key, parsed, response)
+    return parsed
 
 
 class DomainService:
@@ -22,11 +314,29 @@ class DomainService:
         """Initialize domain service."""
         self._client = client
 
-    def search_with_params(self, search_params: DomainSearchParams) -> DomainSearchResponse:
-        """Search for emails by domain using params object."""
+    def search_with_params(self, search_params: DomainSearchParams, cache_page: bool = True) -> DomainSearchResponse:
+        """Search for emails by domain using params object.
+
+        With a contact store, searches of domains whose whole list is known
+        are answered locally, refreshing the list in the background once stale.
+        With ``cache_page=False`` the response cache is neither read nor filled.
+        """
+        store = self._client.contact_store
+        if store is not None:
+            local_page, stale = store.search(search_params)
+            if local_page is not None:
+                if stale:
+                    self._client.revalidate(
+                        contacts_key(search_params.domain),
+                        lambda: refresh_contacts(self._client, store, search_params.domain),
+                    )
+                return local_page
         request_params = build_domain_search_params(search_params)
-        response = self._client.get(HunterEndpoints.domain_search.path, request_params)
-        return process_api_response(response, DomainSearchResponse)
+        fetch = fetch_model if cache_page else fetch_uncached_model
+        page = fetch(self._client, HunterEndpoints.domain_search.path, DomainSearchResponse, request_params)
+        if store is not None:
+            store.record(search_params, page)
+        return page
 
     def search(self, **kwargs: Any) -> DomainSearchResponse:
         """Search for emails by domain.
@@ -37,6 +347,78 @@ class DomainService:
         search_params = DomainSearchParams(**kwargs)
         return self.search_with_params(search_params)
 
+    @contextmanager
+    def stream(self, **kwargs: Any) -> Iterator[DomainSearchStream]:
+        """Search for emails by domain, decoding each email as it arrives.
+
+        Accepts the same keyword arguments as ``search``. Iterating the
+        yielded stream returns validated emails before the page has finished
+        downloading. Cached pages are replayed, but streamed pages are not
+        cached since that would hold them in memory whole.
+        """
+        request_params = build_domain_search_params(DomainSearchParams(**kwargs))
+        endpoint = HunterEndpoints.domain_search.path
+        cached = self._client.lookup_result(endpoint, self._client.create_cache_key(endpoint, request_params))
+        if cached is not None:
+            yield DomainSearchStream(self._client, endpoint, cached=_unwrap_cached(cached, DomainSearchResponse))
+            return
+        response = self._client.get(endpoint, request_params, stream=True)
+        try:
+            check_http_status(response)
+            yield DomainSearchStream(self._client, endpoint, response)
+        finally:
+            response.close()
+
+    def iter_emails(
+        self,
+        domain: str,
+        email_type: Optional[str] = None,
+        seniority: Optional[str] = None,
+        department: Optional[str] = None,
+        page_size: int = MAX_LIMIT,
+    ) -> Iterator[Email]:
+        """Yield every email for a domain, fetching pages lazily.
+
+        The next page is requested in the background while the current one is
+        consumed, so memory stays bounded to two pages. Only the first page
+        goes through the response cache, so long listings do not evict it.
+        """
+        search_params = DomainSearchParams(
+            domain=domain,
+            email_type=email_type,
+            seniority=seniority,
+            department=department,
+            limit=page_size,
+        )
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            page_future: Optional[Future[DomainSearchResponse]] = executor.submit(
+                self.search_with_params,
+                search_params,
+            )
+            while page_future is not None:
+                page = page_future.result()
+                next_offset = next_page_offset(page, search_params)
+                page_future = None
+                if next_offset is not None:
+                    search_params = search_params.model_copy(update={'offset': next_offset})
+                    page_future = executor.submit(self.search_with_params, search_params, cache_page=False)
+                yield from page.emails
+
+    def email_table(
+        self,
+        domain: str,
+        email_type: Optional[str] = None,
+        seniority: Optional[str] = None,
+        department: Optional[str] = None,
+        page_size: int = MAX_LIMIT,
+    ) -> EmailTable:
+        """Collect every email for a domain into a columnar ``EmailTable``.
+
+        Takes the same arguments as ``iter_emails``; each page's models are
+        released once copied into the table.
+        """
+        return EmailTable.from_emails(self.iter_emails(domain, email_type, seniority, department, page_size))
+
 
 class EmailService:
     """Service for email-related operations."""
@@ -51,17 +433,73 @@ class EmailService:
         first_name: Optional[str] = None,
         last_name: Optional[str] = None,
         full_name: Optional[str] = None,
+        infer: InferMode = 'off',
     ) -> EmailFinderResponse:
-        """Find email address."""
+        """Find email address.
+
+        With ``infer`` other than ``'off'``, the address may be synthesized from
+        the domain's learned pattern and marked ``inferred``.
+        """
         request_params = build_email_finder_params(domain, first_name, last_name, full_name)
-        response = self._client.get(HunterEndpoints.email_finder.path, request_params)
-        return process_api_response(response, EmailFinderResponse)
+        if infer != 'off':
+            inferred = infer_email(self._client, infer, request_params)
+            if inferred is not None:
+                return inferred
+        return fetch_model(self._client, HunterEndpoints.email_finder.path, EmailFinderResponse, request_params)
 
     def verify(self, email: str) -> EmailVerifierResponse:
-        """Verify an email address."""
+        """Verify an email address, answering certain failures locally when pre-verification is on."""
+        local_verification = pre_verify(self._client, email)
+        if local_verification is not None:
+            return local_verification
         request_params = {'email': email}
-        response = self._client.get(HunterEndpoints.email_verifier.path, request_params)
-        return process_api_response(response, EmailVerifierResponse)
+        return fetch_model(self._client, HunterEndpoints.email_verifier.path, EmailVerifierResponse, request_params)
+
+    def verify_many(
+        self,
+        emails: Iterable[str],
+        concurrency: int = BULK_VERIFY_CONCURRENCY,
+    ) -> Iterator[BulkVerificationResult]:
+        """Verify many addresses, yielding results as they complete.
+
+        Input is deduplicated ignoring the case of domains, cache hits are
+        yielded immediately and at most ``concurrency`` upstream calls run at
+        once. Results carry each address as first spelled in ``emails``.
+        Failures are reported per address instead of aborting the batch.
+        """
+        endpoint = HunterEndpoints.email_verifier.path
+        in_flight: set[Future[BulkVerificationResult]] = set()
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            for original, email in unique_emails(emails):
+                cached = pre_verify(self._client, email) or self._client.lookup_result(
+                    endpoint,
+                    self._client.create_cache_key(endpoint, {'email': email}),
+                )
+                if cached is not None:
+                    yield bulk_result(original, cached)
+                    continue
+                in_flight.add(executor.submit(self._verify_uncached, original, email))
+                if len(in_flight) >= concurrency:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    yield from (future.result() for future in done)
+            for future in as_completed(in_flight):
+                yield future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _verify_uncached(self, original: str, email: str) -> BulkVerificationResult:
+        """Verify one normalized address upstream, capturing failures in a result for ``original``."""
+        try:
+            verification = refresh_model(
+                self._client,
+                HunterEndpoints.email_verifier.path,
+                EmailVerifierResponse,
+                {'email': email},
+            )
+        except (HunterAPIError, httpx.HTTPError) as error:
+            return bulk_result(original, error)
+        return bulk_result(original, verification)
 
 
 class AccountService:
@@ -73,5 +511,274 @@ class AccountService:
 
     def get_information(self) -> AccountInformationResponse:
         """Get account information."""
-        response = self._client.get(HunterEndpoints.account.path)
-        return process_api_response(response, AccountInformationResponse)
+        return fetch_model(self._client, HunterEndpoints.account.path, AccountInformationResponse)
+
+    def refresh_information(self) -> AccountInformationResponse:
+        """Get account information from upstream, bypassing the cache."""
+        return refresh_model(self._client, HunterEndpoints.account.path, AccountInformationResponse)
+
+    def refresh_keys(self) -> AccountPoolResponse:
+        """Refresh every pooled key from ``/account`` and aggregate the results.
+
+        Keys that fail to refresh keep their last known state and report the error.
+        """
+        key_pool = require_key_pool(self._client)
+        errors = {}
+        for api_key in key_pool.api_keys:
+            try:
+                key_pool.update(api_key, self._refresh_key(api_key))
+            except (HunterAPIError, httpx.HTTPError) as error:
+                errors[api_key] = str(error).replace(api_key, mask_api_key(api_key))
+        return key_pool.summary(errors)
+
+    def _refresh_key(self, api_key: str) -> AccountInformationResponse:
+        """Fetch account information for one pooled key."""
+        endpoint = HunterEndpoints.account.path
+        response = self._client.get(endpoint, api_key=api_key)
+        return self._client.parse_response(endpoint, response, AccountInformationResponse)
+
+
+class AsyncDomainService:
+    """Asynchronous service for domain-related operations."""
+
+    def __init__(self, client: AsyncBaseHTTPClient) -> None:
+        """Initialize domain service."""
+        self._client = client
+
+    async def search_with_params(
+        self, search_params: DomainSearchParams, cache_page: bool = True
+    ) -> DomainSearchResponse:
+        """Search for emails by domain using params object.
+
+        Answers from the contact store like ``DomainService.search_with_params``.
+        """
+        store = self._client.contact_store
+        if store is not None:
+            local_page, stale = store.search(search_params)
+            if local_page is not None:
+                if stale:
+                    self._client.revalidate(
+                        contacts_key(search_params.domain),
+                        lambda: arefresh_contacts(self._client, store, search_params.domain),
+                    )
+                return local_page
+        request_params = build_domain_search_params(search_params)
+        fetch = afetch_model if cache_page else afetch_uncached_model
+        page = await fetch(
+            self._client,
+            HunterEndpoints.domain_search.path,
+            DomainSearchResponse,
+            request_params,
+        )
+        if store is not None:
+            store.record(search_params, page)
+        return page
+
+    async def search(self, **kwargs: Any) -> DomainSearchResponse:
+        """Search for emails by domain.
+
+        Accepts the same keyword arguments as ``DomainService.search``.
+        """
+        search_params = DomainSearchParams(**kwargs)
+        return await self.search_with_params(search_params)
+
+    @asynccontextmanager
+    async def stream(self, **kwargs: Any) -> AsyncIterator[AsyncDomainSearchStream]:
+        """Search for emails by domain, decoding each email as it arrives.
+
+        See ``DomainService.stream``.
+        """
+        request_params = build_domain_search_params(DomainSearchParams(**kwargs))
+        endpoint = HunterEndpoints.domain_search.path
+        cached = await self._client.alookup_result(endpoint, self._client.create_cache_key(endpoint, request_params))
+        if cached is not None:
+            yield AsyncDomainSearchStream(
+                self._client,
+                endpoint,
+                cached=_unwrap_cached(cached, DomainSearchResponse),
+            )
+            return
+        response = await self._client.get(endpoint, request_params, stream=True)
+        try:
+            check_http_status(response)
+            yield AsyncDomainSearchStream(self._client, endpoint, response)
+        finally:
+            await response.aclose()
+
+    async def iter_emails(
+        self,
+        domain: str,
+        email_type: Optional[str] = None,
+        seniority: Optional[str] = None,
+        department: Optional[str] = None,
+        page_size: int = MAX_LIMIT,
+    ) -> AsyncIterator[Email]:
+        """Yield every email for a domain, prefetching the next page concurrently.
+
+        Like ``DomainService.iter_emails``, only the first page is cached.
+        """
+        search_params = DomainSearchParams(
+            domain=domain,
+            email_type=email_type,
+            seniority=seniority,
+            department=department,
+            limit=page_size,
+        )
+        page_task: Optional[asyncio.Task[DomainSearchResponse]] = asyncio.create_task(
+            self.search_with_params(search_params),
+        )
+        try:
+            while page_task is not None:
+                page = await page_task
+                next_offset = next_page_offset(page, search_params)
+                page_task = None
+                if next_offset is not None:
+                    search_params = search_params.model_copy(update={'offset': next_offset})
+                    page_task = asyncio.create_task(self.search_with_params(search_params, cache_page=False))
+                for email in page.emails:
+                    yield email
+        finally:
+            if page_task is not None:
+                page_task.cancel()
+
+    async def email_table(
+        self,
+        domain: str,
+        email_type: Optional[str] = None,
+        seniority: Optional[str] = None,
+        department: Optional[str] = None,
+        page_size: int = MAX_LIMIT,
+    ) -> EmailTable:
+        """Collect every email for a domain into a columnar ``EmailTable``."""
+        table = EmailTable()
+        async for email in self.iter_emails(domain, email_type, seniority, department, page_size):
+            table.append(email)
+        return table
+
+
+class AsyncEmailService:
+    """Asynchronous service for email-related operations."""
+
+    def __init__(self, client: AsyncBaseHTTPClient) -> None:
+        """Initialize email service."""
+        self._client = client
+
+    async def find(
+        self,
+        domain: str,
+        first_name: Optional[str] = None,
+        last_name: Optional[str] = None,
+        full_name: Optional[str] = None,
+        infer: InferMode = 'off',
+    ) -> EmailFinderResponse:
+        """Find email address, optionally from a learned pattern (see ``EmailService.find``)."""
+        request_params = build_email_finder_params(domain, first_name, last_name, full_name)
+        if infer != 'off':
+            inferred = await ainfer_email(self._client, infer, request_params)
+            if inferred is not None:
+                return inferred
+        return await afetch_model(self._client, HunterEndpoints.email_finder.path, EmailFinderResponse, request_params)
+
+    async def verify(self, email: str) -> EmailVerifierResponse:
+        """Verify an email address, answering certain failures locally when pre-verification is on."""
+        local_verification = pre_verify(self._client, email)
+        if local_verification is not None:
+            return local_verification
+        request_params = {'email': email}
+        return await afetch_model(
+            self._client,
+            HunterEndpoints.email_verifier.path,
+            EmailVerifierResponse,
+            request_params,
+        )
+
+    async def verify_many(
+        self,
+        emails: Iterable[str],
+        concurrency: int = BULK_VERIFY_CONCURRENCY,
+    ) -> AsyncIterator[BulkVerificationResult]:
+        """Verify many addresses, yielding results as they complete.
+
+        Same semantics as ``EmailService.verify_many``; outstanding calls are
+        cancelled if the consumer stops iterating.
+        """
+        endpoint = HunterEndpoints.email_verifier.path
+        in_flight: set[asyncio.Task[BulkVerificationResult]] = set()
+        try:
+            for original, email in unique_emails(emails):
+                cached = pre_verify(self._client, email) or await self._client.alookup_result(
+                    endpoint,
+                    self._client.create_cache_key(endpoint, {'email': email}),
+                )
+                if cached is not None:
+                    yield bulk_result(original, cached)
+                    continue
+                in_flight.add(asyncio.create_task(self._verify_uncached(original, email)))
+                if len(in_flight) >= concurrency:
+                    done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        yield task.result()
+            while in_flight:
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for pending_task in in_flight:
+                pending_task.cancel()
+            # Wait for the cancellations so no task outlives the iterator
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+    async def _verify_uncached(self, original: str, email: str) -> BulkVerificationResult:
+        """Async variant of ``EmailService._verify_uncached``."""
+        try:
+            verification = await arefresh_model(
+                self._client,
+                HunterEndpoints.email_verifier.path,
+                EmailVerifierResponse,
+                {'email': email},
+            )
+        except (HunterAPIError, httpx.HTTPError) as error:
+            return bulk_result(original, error)
+        return bulk_result(original, verification)
+
+
+class AsyncAccountService:
+    """Asynchronous service for account-related operations."""
+
+    def __init__(self, client: AsyncBaseHTTPClient) -> None:
+        """Initialize account service."""
+        self._client = client
+
+    async def get_information(self) -> AccountInformationResponse:
+        """Get account information."""
+        return await afetch_model(self._client, HunterEndpoints.account.path, AccountInformationResponse)
+
+    async def refresh_information(self) -> AccountInformationResponse:
+        """Get account information from upstream, bypassing the cache."""
+        return await arefresh_model(self._client, HunterEndpoints.account.path, AccountInformationResponse)
+
+    async def refresh_keys(self) -> AccountPoolResponse:
+        """Refresh every pooled key from ``/account`` concurrently and aggregate the results.
+
+        Keys that fail to refresh keep their last known state and report the error.
+        """
+        key_pool = require_key_pool(self._client)
+        outcomes = await asyncio.gather(
+            *(self._refresh_key(api_key) for api_key in key_pool.api_keys),
+            return_exceptions=True,
+        )
+        errors = {}
+        for api_key, outcome in zip(key_pool.api_keys, outcomes):
+            if isinstance(outcome, AccountInformationResponse):
+                key_pool.update(api_key, outcome)
+            elif isinstance(outcome, (HunterAPIError, httpx.HTTPError)):
+                errors[api_key] = str(outcome).replace(api_key, mask_api_key(api_key))
+            else:
+                raise outcome
+        return key_pool.summary(errors)
+
+    async def _refresh_key(self, api_key: str) -> AccountInformationResponse:
+        """Fetch account information for one pooled key."""
+        endpoint = HunterEndpoints.account.path
+        response = await self._client.get(endpoint, api_key=api_key)
+        return self._client.parse_response(endpoint, response, AccountInformationResponse)
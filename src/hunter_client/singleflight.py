@@ -0,0 +1,81 @@
+"""Request coalescing for identical concurrent Hunter.io lookups."""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from typing import Any, TypeVar
+
+ResultType = TypeVar('ResultType')
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time across threads.
+
+    Callers arriving while a call for the same key is running wait for it and
+    receive its result or exception instead of starting their own.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._calls: dict[str, Future[Any]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of calls in flight."""
+        return len(self._calls)
+
+    def do(self, key: str, call: Callable[[], ResultType]) -> ResultType:
+        """Run ``call`` for ``key`` or join the call already running."""
+        with self._lock:
+            in_flight = self._calls.get(key)
+            is_leader = in_flight is None
+            if in_flight is None:
+                in_flight = Future()
+                self._calls[key] = in_flight
+        if not is_leader:
+            shared_result: ResultType = in_flight.result()
+            return shared_result
+        leader_future = in_flight
+        try:
+            call_result = call()
+        except BaseException as error:
+            leader_future.set_exception(error)
+            raise
+        else:
+            leader_future.set_result(call_result)
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+        return call_result
+
+
+class AsyncSingleFlight:
+    """Runs at most one coroutine per key at a time on an event loop.
+
+    The shared call runs as its own task, so a cancelled caller does not
+    cancel the lookup for everyone else waiting on it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._calls: dict[str, asyncio.Task[Any]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of calls in flight."""
+        return len(self._calls)
+
+    async def do(self, key: str, call: Callable[[], Awaitable[ResultType]]) -> ResultType:
+        """Await ``call`` for ``key`` or join the call already running."""
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._calls[key] = task
+            task.add_done_callback(lambda done_task: self._forget(key, done_task))
+        shared_result: ResultType = await asyncio.shield(task)
+        return shared_result
+
+    def _forget(self, key: str, task: asyncio.Task[Any]) -> None:
+        """Drop a finished call unless a newer one already replaced it."""
+        if self._calls.get(key) is task:
+            self._calls.pop(key)
@@ -0,0 +1,289 @@
+"""Incremental decoding of domain search responses."""
+
+import codecs
+import json
+import re
+import time
+from collections.abc import AsyncIterator, Iterator
+from typing import Any, Optional
+
+import httpx
+from pydantic import ValidationError
+
+from hunter_client.http_client import HTTPClientCore
+from hunter_client.models.common import Email
+from hunter_client.models.domain import DomainSearchResponse
+from hunter_client.response_handler import HunterAPIError, validate_response_model
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_INCOMPLETE = object()
+
+# Parser states: what the next significant character may be
+_OBJECT = 'object'
+_KEY = 'key'
+_COLON = 'colon'
+_VALUE = 'value'
+_MEMBER_END = 'member_end'
+_ITEM = 'item'
+_ITEM_END = 'item_end'
+_DONE = 'done'
+
+
+class DomainSearchParser:
+    """Push parser returning the emails of a domain search body as they complete.
+
+    The ``data`` object is entered and its ``emails`` array split into items;
+    every other value is decoded whole into ``envelope``. Only the unparsed
+    tail of the last chunk is buffered, so memory holds about one email.
+    """
+
+    def __init__(self) -> None:
+        """Initialize before the first byte."""
+        self.envelope: dict[str, Any] = {}
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._pos = 0
+        self._objects: list[dict[str, Any]] = []
+        self._key = ''
+        self._state = _OBJECT
+        self._finished = False
+
+    @property
+    def done(self) -> bool:
+        """Whether the whole body has been parsed."""
+        return self._state == _DONE
+
+    def feed(self, chunk: bytes) -> list[dict[str, Any]]:
+        """Add body bytes and return the emails completed by them."""
+        try:
+            self._buffer += self._text.decode(chunk)
+        except ValueError as error:
+            raise HunterAPIError('Failed to parse JSON: {0}'.format(error)) from error
+        return self._parse()
+
+    def finish(self) -> list[dict[str, Any]]:
+        """Parse what is left at the end of the body, which must complete the document."""
+        self._finished = True
+        emails = self.feed(b'')
+        if not self.done:
+            raise HunterAPIError('Failed to parse JSON: response ended early')
+        return emails
+
+    def _parse(self) -> list[dict[str, Any]]:
+        """Advance as far as the buffered text allows."""
+        emails: list[dict[str, Any]] = []
+        try:
+            advanced = True
+            while advanced:
+                advanced = self._step(emails)
+        except ValueError as error:
+            raise HunterAPIError('Failed to parse JSON: {0}'.format(error)) from error
+        self._buffer = self._buffer[self._pos :]
+        self._pos = 0
+        return emails
+
+    def _step(self, emails: list[dict[str, Any]]) -> bool:
+        """Consume one token; return False when more input is needed or parsing is over."""
+        char = self._peek()
+        if char is None or self._state == _DONE:
+            if char is not None:
+                raise ValueError('Extra data at {0!r}'.format(char))
+            return False
+        if self._state == _VALUE:
+            return self._step_value(char)
+        if self._state in {_ITEM, _ITEM_END}:
+            return self._step_item(char, emails)
+        if self._state == _OBJECT:
+            self._expect(char, '{')
+            self._objects.append(self.envelope)
+            self._state = _KEY
+        elif self._state == _KEY:
+            if char == '}':
+                self._pos += 1
+                self._close_object()
+                return True
+            key = self._decode()
+            if key is _INCOMPLETE:
+                return False
+            if not isinstance(key, str):
+                raise ValueError('Expected a key, got {0!r}'.format(key))
+            self._key = key
+            self._state = _COLON
+        elif self._state == _COLON:
+            self._expect(char, ':')
+            self._state = _VALUE
+        elif char == '}':
+            self._pos += 1
+            self._close_object()
+        else:
+            self._expect(char, ',')
+            self._state = _KEY
+        return True
+
+    def _step_value(self, char: str) -> bool:
+        """Enter ``data`` or ``emails``, or decode any other member value whole."""
+        if self._key == 'data' and char == '{' and len(self._objects) == 1:
+            self._pos += 1
+            data_object: dict[str, Any] = {}
+            self._objects[-1]['data'] = data_object
+            self._objects.append(data_object)
+            self._state = _KEY
+            return True
+        if self._key == 'emails' and char == '[':
+            self._pos += 1
+            self._state = _ITEM
+            return True
+        member_value = self._decode()
+        if member_value is _INCOMPLETE:
+            return False
+        self._objects[-1][self._key] = member_value
+        self._state = _MEMBER_END
+        return True
+
+    def _step_item(self, char: str, emails: list[dict[str, Any]]) -> bool:
+        """Decode the next email or leave the array."""
+        if char == ']':
+            self._pos += 1
+            self._state = _MEMBER_END
+            return True
+        if self._state == _ITEM_END:
+            self._expect(char, ',')
+            self._state = _ITEM
+            return True
+        email = self._decode()
+        if email is _INCOMPLETE:
+            return False
+        emails.append(email)
+        self._state = _ITEM_END
+        return True
+
+    def _close_object(self) -> None:
+        """Leave the innermost object."""
+        self._objects.pop()
+        self._state = _MEMBER_END if self._objects else _DONE
+
+    def _peek(self) -> Optional[str]:
+        """Skip whitespace and return the next character, if buffered."""
+        whitespace = _WHITESPACE.match(self._buffer, self._pos)
+        if whitespace is not None:
+            self._pos = whitespace.end()
+        if self._pos == len(self._buffer):
+            return None
+        return self._buffer[self._pos]
+
+    def _expect(self, char: str, expected: str) -> None:
+        """Consume a structural character or fail."""
+        if char != expected:
+            raise ValueError('Expected {0!r} at {1!r}'.format(expected, char))
+        self._pos += 1
+
+    def _decode(self) -> Any:
+        """Decode one complete JSON value, or return ``_INCOMPLETE`` to wait for more input.
+
+        A value ending exactly at the end of the buffer may be a truncated
+        number, so it is only accepted once the body is finished.
+        """
+        try:
+            decoded, end = self._decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if self._finished:
+                raise
+            return _INCOMPLETE
+        if end == len(self._buffer) and not self._finished:
+            return _INCOMPLETE
+        self._pos = end
+        return decoded
+
+
+class _DomainSearchStream:
+    """Shared state of the sync and async domain search streams."""
+
+    def __init__(
+        self,
+        client: HTTPClientCore,
+        endpoint: str,
+        response: Optional[httpx.Response] = None,
+        cached: Optional[DomainSearchResponse] = None,
+    ) -> None:
+        """Initialize over an unread response or a cached result."""
+        self._client = client
+        self._endpoint = endpoint
+        self._response = response
+        self._cached = cached
+        self._parser = DomainSearchParser()
+        self._validation_seconds = 0.0
+        self._info: Optional[DomainSearchResponse] = None
+
+    @property
+    def info(self) -> DomainSearchResponse:
+        """The response without its emails.
+
+        Members sent before the emails array are available from the first email
+        on; any sent after it once iteration has finished.
+        """
+        if self._info is not None:
+            return self._info
+        if self._cached is not None:
+            return self._cached.model_copy(update={'emails': []})
+        info = validate_response_model(self._parser.envelope, DomainSearchResponse)
+        if self._parser.done:
+            self._info = info
+        return info
+
+    def _validate(self, email_items: list[dict[str, Any]]) -> list[Email]:
+        """Validate decoded emails, teaching the client's pattern index as they pass."""
+        started_at = time.perf_counter()
+        try:
+            emails = [Email.model_validate(email_item) for email_item in email_items]
+        except ValidationError as error:
+            raise HunterAPIError('Validation error: {0}'.format(error)) from error
+        self._validation_seconds += time.perf_counter() - started_at
+        if self._client.pattern_index is not None:
+            for email in emails:
+                self._client.pattern_index.learn(email)
+        return emails
+
+    def _completed(self) -> None:
+        """Report the finished response, without emails, to the hooks."""
+        for hook in self._client.hooks:
+            hook.response_validated(self._endpoint, self.info, self._validation_seconds)
+
+
+class DomainSearchStream(_DomainSearchStream):
+    """Emails of one domain search page, validated as they are read from the socket.
+
+    Iterate once to receive ``Email`` objects; ``info`` holds the rest of the
+    response. Cached results are replayed from memory.
+    """
+
+    def __iter__(self) -> Iterator[Email]:
+        """Yield emails in response order."""
+        if self._cached is not None:
+            yield from self._cached.emails
+            return
+        if self._response is None:
+            return
+        for chunk in self._response.iter_bytes():
+            yield from self._validate(self._parser.feed(chunk))
+        yield from self._validate(self._parser.finish())
+        self._completed()
+
+
+class AsyncDomainSearchStream(_DomainSearchStream):
+    """Async variant of ``DomainSearchStream``."""
+
+    async def __aiter__(self) -> AsyncIterator[Email]:
+        """Yield emails in response order."""
+        if self._cached is not None:
+            for cached_email in self._cached.emails:
+                yield cached_email
+            return
+        if self._response is None:
+            return
+        async for chunk in self._response.aiter_bytes():
+            for email in self._validate(self._parser.feed(chunk)):
+                yield email
+        for email in self._validate(self._parser.finish()):
+            yield email
+        self._completed()
@@ -0,0 +1,172 @@
+"""Per-request breakdown of where time goes, from connection setup to serialization."""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from hunter_client.config import TIMING_MAX_SPANS
+
+# Server-Timing metrics in the order they happen; ``wait`` is the time to the
+# response headers after the connection is set up, including pool queueing
+PHASES = ('connect', 'tls', 'wait', 'download', 'parse', 'validate', 'serialize')
+# httpcore trace events counted as connection setup
+SETUP_EVENTS = {
+    'connection.connect_tcp': 'connect',
+    'connection.connect_unix_socket': 'connect',
+    'connection.start_tls': 'tls',
+}
+TRACE_OUTCOMES = ('.started', '.complete', '.failed')
+
+
+@dataclass(frozen=True)
+class TimingSpan:
+    """One timed step, with its start as an offset from the request start."""
+
+    name: str
+    started: float
+    seconds: float
+
+
+class RequestTimings:
+    """Phase durations and the full trace of spans of one request.
+
+    Durations of a phase add up over every upstream call the request makes.
+    Only the first ``max_spans`` spans are kept; ``dropped_spans`` counts the rest.
+    """
+
+    def __init__(self, max_spans: int = TIMING_MAX_SPANS) -> None:
+        """Start timing now."""
+        self.started_at = time.perf_counter()
+        self.phases: dict[str, float] = {}
+        self.spans: list[TimingSpan] = []
+        self.max_spans = max_spans
+        self.dropped_spans = 0
+
+    def elapsed(self) -> float:
+        """Return the seconds since the request started."""
+        return time.perf_counter() - self.started_at
+
+    def add(self, phase: str, started_at: float, seconds: float) -> None:
+        """Add a step started at ``started_at`` (a ``perf_counter`` value) to a phase."""
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+        self.span(phase, started_at, seconds)
+
+    def span(self, name: str, started_at: float, seconds: float) -> None:
+        """Keep a step in the trace without counting it towards a phase."""
+        if len(self.spans) >= self.max_spans:
+            self.dropped_spans += 1
+            return
+        self.spans.append(TimingSpan(name, started_at - self.started_at, seconds))
+
+    def server_timing(self, total: Optional[float] = None) -> str:
+        """Format the phases, and ``total`` if given, as a ``Server-Timing`` header value in milliseconds."""
+        metrics = [(phase, self.phases[phase]) for phase in PHASES if phase in self.phases]
+        if total is not None:
+            metrics.append(('total', total))
+        return ', '.join('{0};dur={1:.3f}'.format(phase, seconds * 1000) for phase, seconds in metrics)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the phases and spans in milliseconds, for logging."""
+        return {
+            'phases': {phase: round(seconds * 1000, 3) for phase, seconds in self.phases.items()},
+            'spans': [
+                {'name': span.name, 'start': round(span.started * 1000, 3), 'dur': round(span.seconds * 1000, 3)}
+                for span in self.spans
+            ],
+            'dropped_spans': self.dropped_spans,
+        }
+
+
+current_timings: ContextVar[Optional[RequestTimings]] = ContextVar('current_timings', default=None)
+
+
+@contextmanager
+def collect_timings(max_spans: int = TIMING_MAX_SPANS) -> Iterator[RequestTimings]:
+    """Time the client calls made in this context, e.g. to measure a script's calls."""
+    timings = RequestTimings(max_spans)
+    token = current_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        current_timings.reset(token)
+
+
+@contextmanager
+def measure(phase: str) -> Iterator[None]:
+    """Add the duration of the block to a phase of the current request, if it is timed."""
+    timings = current_timings.get()
+    if timings is None:
+        yield
+        return
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(phase, started_at, time.perf_counter() - started_at)
+
+
+class UpstreamTrace:
+    """httpx ``trace`` extension timing the connection setup of one upstream attempt.
+
+    httpcore reports each step as ``<name>.started`` followed by
+    ``<name>.complete`` or ``<name>.failed``; every step becomes a span and
+    connection setup is added to the ``connect`` and ``tls`` phases.
+    """
+
+    def __init__(self, timings: RequestTimings) -> None:
+        """Record into ``timings``."""
+        self.timings = timings
+        self.setup_seconds = 0.0
+        self._started: dict[str, float] = {}
+
+    def __call__(self, event_name: str, info: dict[str, Any]) -> None:
+        """Handle one trace event of a sync client."""
+        now = time.perf_counter()
+        step, outcome = _split_event(event_name)
+        if outcome == '.started':
+            self._started[step] = now
+            return
+        started_at = self._started.pop(step, None)
+        if started_at is None:
+            return
+        phase = SETUP_EVENTS.get(step)
+        if phase is None:
+            self.timings.span(step, started_at, now - started_at)
+            return
+        self.setup_seconds += now - started_at
+        self.timings.add(phase, started_at, now - started_at)
+
+    async def atrace(self, event_name: str, info: dict[str, Any]) -> None:
+        """Handle one trace event of an async client, which httpcore requires to be a coroutine."""
+        self(event_name, info)
+
+
+def start_upstream_trace() -> Optional[UpstreamTrace]:
+    """Return a trace for one upstream attempt, or None when the current request is not timed."""
+    timings = current_timings.get()
+    return None if timings is None else UpstreamTrace(timings)
+
+
+@contextmanager
+def measure_wait(upstream_trace: Optional[UpstreamTrace]) -> Iterator[None]:
+    """Add the time to the response headers, less connection setup, to the ``wait`` phase."""
+    if upstream_trace is None:
+        yield
+        return
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started_at
+        upstream_trace.timings.add('wait', started_at, max(elapsed - upstream_trace.setup_seconds, 0.0))
+
+
+def _split_event(event_name: str) -> tuple[str, str]:
+    """Split an httpcore event name into its step and outcome."""
+    for outcome in TRACE_OUTCOMES:
+        if event_name.endswith(outcome):
+            return event_name[: -len(outcome)], outcome
+    return event_name, ''
@@ -0,0 +1,119 @@
+"""Tests for the FastAPI application."""
+
+import json
+
+import httpx
+import respx
+from fastapi.testclient import TestClient
+
+from hunter_client.config import HUNTER_API_BASE_URL
+from hunter_client.main import app
+from hunter_client.models.verifier import EmailVerifierResponse
+from hunter_client.responses import ModelSerializer, model_serializer
+
+ACCOUNT_PAYLOAD = {
+    "data": {
+        "email": "owner@example.com",
+        "plan_name": "Free",
+        "plan_level": 0,
+        "reset_date": "2024-01-01",
+        "calls": {"used": 1, "available": 25},
+    },
+}
+
+VERIFIER_DATA = {
+    "status": "valid",
+    "result": "deliverable",
+    "score": 100,
+    "regexp": True,
+    "gibberish": False,
+    "disposable": False,
+    "webmail": False,
+    "mx_records": True,
+    "smtp_server": True,
+    "smtp_check": True,
+    "accept_all": False,
+    "block": False,
+}
+
+
+def test_routes_share_lifespan_client(monkeypatch):
+    """Test all requests reuse the client opened at startup."""
+    monkeypatch.setenv("HUNTER_API_KEY", "test_key")
+    with respx.mock:
+        respx.get("{0}/account".format(HUNTER_API_BASE_URL)).mock(
+            return_value=httpx.Response(200, json=ACCOUNT_PAYLOAD),
+        )
+        with TestClient(app) as api:
+            shared_client = app.state.hunter_client
+            assert api.get("/account").status_code == 200
+            assert api.get("/account").status_code == 200
+            assert app.state.hunter_client is shared_client
+
+
+def test_missing_api_key(monkeypatch):
+    """Test routes report a missing API key."""
+    monkeypatch.delenv("HUNTER_API_KEY", raising=False)
+    with TestClient(app) as api:
+        response = api.get("/account")
+    assert response.status_code == 500
+    assert "HUNTER_API_KEY" in response.json()["detail"]
+
+
+def test_bulk_verifier_streams_ndjson(monkeypatch):
+    """Test bulk verification dedupes input and emits one line per address."""
+    monkeypatch.setenv("HUNTER_API_KEY", "test_key")
+
+    def verifier_response(request):
+        email = request.url.params["email"]
+        if email.startswith("bad"):
+            return httpx.Response(400, json={"errors": [{"details": "invalid"}]})
+        payload = dict(VERIFIER_DATA, email=email)
+        return httpx.Response(200, json={"data": payload})
+
+    with respx.mock:
+        route = respx.get("{0}/email-verifier".format(HUNTER_API_BASE_URL)).mock(side_effect=verifier_response)
+        with TestClient(app) as api:
+            response = api.post(
+                "/email-verifier/bulk",
+                json={"emails": ["a@example.com", "a@EXAMPLE.com ", "bad@example.com"], "concurrency": 2},
+            )
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert route.call_count == 2
+    by_email = {line["email"]: line for line in lines}
+    assert by_email["a@example.com"]["result"]["result"] == "deliverable"
+    assert by_email["bad@example.com"]["status_code"] == 400
+
+
+def test_model_responses_serialize_once_and_keep_schema(monkeypatch):
+    """Test routes return pre-serialized models, reuse bytes for cache hits and keep the OpenAPI schema."""
+    monkeypatch.setenv("HUNTER_API_KEY", "test_key")
+    with respx.mock:
+        respx.get("{0}/email-verifier".format(HUNTER_API_BASE_URL)).mock(
+            return_value=httpx.Response(200, json={"data": dict(VERIFIER_DATA, email="a@example.com")}),
+        )
+        with TestClient(app) as api:
+            first = api.post("/email-verifier", json={"email": "a@example.com"})
+            memo_hits = model_serializer.memo.stats.hits
+            second = api.post("/email-verifier", json={"email": "a@example.com"})
+            schema = api.get("/openapi.json").json()
+
+    assert first.headers["content-type"] == "application/json"
+    assert first.json()["result"] == "deliverable"
+    assert first.content == second.content
+    assert model_serializer.memo.stats.hits == memo_hits + 1
+    response_schema = schema["paths"]["/email-verifier"]["post"]["responses"]["200"]["content"]["application/json"]
+    assert response_schema["schema"] == {"$ref": "#/components/schemas/EmailVerifierResponse"}
+
+
+def test_model_serializer_reuses_bytes_per_instance():
+    """Test the serializer memoizes bytes per model instance only."""
+    serializer = ModelSerializer()
+    verification = EmailVerifierResponse(**dict(VERIFIER_DATA, email="a@example.com"))
+    copy = EmailVerifierResponse(**dict(VERIFIER_DATA, email="a@example.com"))
+
+    assert serializer.dumps(verification) is serializer.dumps(verification)
+    assert serializer.dumps(copy) == serializer.dumps(verification)
+    assert serializer.dumps(copy) is not serializer.dumps(verification)
@@ -0,0 +1,108 @@
+"""Tests for resumable batch enrichment."""
+
+import csv
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+from hunter_client.batch import OPERATIONS, Checkpoint, run_batch
+from hunter_client.client import AsyncHunterClient
+from hunter_client.response_handler import HunterAPIError
+from hunter_client.retry import RetryPolicy
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+FINDER_PAYLOAD = json.loads((FIXTURES_DIR / "email_finder.json").read_text())
+VERIFIER_PAYLOAD = json.loads((FIXTURES_DIR / "email_verifier.json").read_text())
+
+
+def make_client(handler):
+    """Build an async client answering from ``handler`` without retries."""
+    return AsyncHunterClient(
+        api_key="test_key",
+        transport=httpx.MockTransport(handler),
+        retry_policy=RetryPolicy(max_attempts=1),
+    )
+
+
+def finder_response(request):
+    """Answer email-finder calls with the recorded payload for the requested domain."""
+    payload = json.loads(json.dumps(FINDER_PAYLOAD))
+    payload["data"]["domain"] = request.url.params["domain"]
+    payload["data"]["email"] = "{0}@{1}".format(request.url.params["first_name"].lower(), request.url.params["domain"])
+    return httpx.Response(200, json=payload)
+
+
+def write_people(path, count):
+    """Write a CSV export of ``count`` people, one of them missing a domain."""
+    with path.open("w", newline="") as people_file:
+        writer = csv.writer(people_file)
+        writer.writerow(["id", "first_name", "last_name", "domain"])
+        for index in range(count):
+            writer.writerow(
+                [index, "Person{0}".format(index), "Doe", "" if index == 2 else "site{0}.com".format(index)]
+            )
+
+
+async def test_batch_find_resumes_without_repeating_rows(tmp_path):
+    """Test an interrupted run resumes after the last written row and keeps output in order."""
+    input_path = tmp_path / "people.csv"
+    output_path = tmp_path / "emails.csv"
+    write_people(input_path, 8)
+    requested = []
+
+    def failing_response(request):
+        requested.append(request.url.params["domain"])
+        if request.url.params["domain"] == "site5.com":
+            return httpx.Response(503, json={"errors": [{"details": "unavailable"}]})
+        return finder_response(request)
+
+    async with make_client(failing_response) as client:
+        with pytest.raises(HunterAPIError):
+            await run_batch(client, OPERATIONS["find"], input_path, output_path, concurrency=3)
+    assert Checkpoint(tmp_path / "emails.csv.checkpoint").load()[0] == 5
+
+    def healthy_response(request):
+        requested.append(request.url.params["domain"])
+        return finder_response(request)
+
+    first_run_calls = len(requested)
+    async with make_client(healthy_response) as client:
+        summary = await run_batch(client, OPERATIONS["find"], input_path, output_path, concurrency=3)
+
+    assert summary.skipped == 5
+    assert summary.written == 3
+    assert requested[first_run_calls:] == ["site5.com", "site6.com", "site7.com"]
+    with output_path.open(newline="") as output_file:
+        output_rows = list(csv.DictReader(output_file))
+    assert [row["id"] for row in output_rows] == [str(index) for index in range(8)]
+    assert output_rows[0]["hunter_email"] == "person0@site0.com"
+    assert output_rows[0]["hunter_score"] == "97"
+    assert "domain" in output_rows[2]["hunter_error"]
+    assert output_rows[2]["hunter_email"] == ""
+
+
+async def test_batch_verify_ndjson(tmp_path):
+    """Test NDJSON input streams to NDJSON output with one result or error per row, including unusable lines."""
+    input_path = tmp_path / "emails.ndjson"
+    output_path = tmp_path / "verified.ndjson"
+    input_path.write_text('{"email": "a@example.com"}\n\n{"email": "bad@example.com"}\n[]\n"x"\n{"email": \n')
+
+    def verifier_response(request):
+        if request.url.params["email"].startswith("bad"):
+            return httpx.Response(400, json={"errors": [{"details": "invalid"}]})
+        return httpx.Response(200, json=VERIFIER_PAYLOAD)
+
+    async with make_client(verifier_response) as client:
+        summary = await run_batch(client, OPERATIONS["verify"], input_path, output_path)
+
+    lines = [json.loads(line) for line in output_path.read_text().splitlines()]
+    assert summary.written == 5
+    assert summary.errors == 4
+    assert lines[0]["row"] == {"email": "a@example.com"}
+    assert lines[0]["result"]["result"] == "deliverable"
+    assert lines[1]["status_code"] == 400
+    assert [line["row"] for line in lines[2:]] == [{"line": "[]"}, {"line": '"x"'}, {"line": '{"email": '}]
+    assert lines[2]["error"] == "Expected a JSON object, got list"
+    assert lines[4]["error"].startswith("Invalid JSON")
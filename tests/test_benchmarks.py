@@ -0,0 +1,56 @@
+"""Tests for the benchmark harness and its mock Hunter.io server."""
+
+import json
+
+import httpx
+
+from benchmarks import run
+from benchmarks.mock_hunter import MockHunter, load_fixture
+from hunter_client.client import HunterClient
+from hunter_client.models.account import AccountInformationResponse
+from hunter_client.models.domain import DomainSearchResponse
+from hunter_client.models.email_finder import EmailFinderResponse
+from hunter_client.models.verifier import EmailVerifierResponse
+from hunter_client.response_handler import validate_response_model
+
+
+def test_recorded_fixtures_validate():
+    """Test the recorded Hunter.io payloads parse into the response models."""
+    domain = validate_response_model(load_fixture("domain_search"), DomainSearchResponse)
+    assert domain.emails[0].email_value == "patrick@example.com"
+    assert validate_response_model(load_fixture("email_finder"), EmailFinderResponse).score == 97
+    assert validate_response_model(load_fixture("email_verifier"), EmailVerifierResponse).status == "valid"
+    assert validate_response_model(load_fixture("account"), AccountInformationResponse).plan_level == 2
+
+
+def test_mock_hunter_paginates_and_fails():
+    """Test the mock serves domain pages and injects configured failures."""
+    with HunterClient(api_key="test_key", transport=MockHunter(total_results=150).transport()) as client:
+        emails = list(client.domain.iter_emails("example.com"))
+    assert len(emails) == 150
+    assert emails[-1].email_value == "user149@example.com"
+
+    failing = MockHunter(error_rate=1)
+    with httpx.Client(transport=failing.transport(), base_url="https://api.hunter.io/v2") as http:
+        assert http.get("/email-verifier").status_code == 503
+
+
+def test_run_writes_results(tmp_path):
+    """Test a short benchmark run writes machine-readable results."""
+    output = tmp_path / "results.json"
+    run.main(["--iterations", "20", "--concurrency", "4", "--memory-emails", "300", "--output", str(output)])
+
+    report = json.loads(output.read_text())
+    assert {
+        "client_get",
+        "parse_domain_search_small",
+        "parse_domain_search_100",
+        "parse_domain_search_100_fast",
+        "parse_email_verifier_fast",
+        "cache_hit",
+        "api_domain_search_hit",
+        "api_domain_search_miss",
+    } <= set(report["results"])
+    assert report["results"]["cache_hit"]["ops_per_sec"] > 0
+    assert report["memory"]["email_table"]["emails"] == 300
+    assert report["memory"]["email_table"]["retained_bytes"] < report["memory"]["email_list"]["retained_bytes"]
@@ -0,0 +1,257 @@
+"""Tests for response cache backends and policies."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+import respx
+from pydantic import ValidationError
+
+from hunter_client.cache import CachePolicy, LRUCache, SQLiteCache, TieredCache
+from hunter_client.client import create_async_client, create_client
+from hunter_client.config import HUNTER_API_BASE_URL
+from hunter_client.http_client import is_cacheable_status
+from hunter_client.response_handler import HunterAPIError
+from hunter_client.retry import RetryPolicy
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_eviction_order():
+    """Test least recently used entries are evicted first."""
+    cache = LRUCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats.evictions == 1
+
+
+def test_ttl_expiry():
+    """Test entries expire after their TTL."""
+    clock = FakeClock()
+    cache = LRUCache(clock=clock)
+    cache.set("key", "value", ttl=10)
+    clock.now = 9
+    assert cache.get("key") == "value"
+    clock.now = 10
+    assert cache.get("key") is None
+    assert cache.stats.expirations == 1
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+def test_byte_bound():
+    """Test the byte budget evicts old entries and rejects oversized ones."""
+    cache = LRUCache(max_bytes=10)
+    cache.set("a", "a", size=6)
+    cache.set("b", "b", size=6)
+    assert cache.get("a") is None
+    assert cache.total_bytes == 6
+    cache.set("huge", "x", size=11)
+    assert cache.get("huge") is None
+
+
+def test_error_caching_is_opt_in():
+    """Test only opted-in client errors are cacheable."""
+    assert is_cacheable_status(200, CachePolicy())
+    assert not is_cacheable_status(404, CachePolicy())
+    assert is_cacheable_status(404, CachePolicy(cache_errors=True))
+    assert not is_cacheable_status(429, CachePolicy(cache_errors=True))
+    assert not is_cacheable_status(502, CachePolicy(cache_errors=True))
+
+
+VERIFIER_PAYLOAD = {
+    "data": {
+        "status": "valid",
+        "result": "deliverable",
+        "score": 100,
+        "email": "a@example.com",
+        "regexp": True,
+        "gibberish": False,
+        "disposable": False,
+        "webmail": False,
+        "mx_records": True,
+        "smtp_server": True,
+        "smtp_check": True,
+        "accept_all": False,
+        "block": False,
+        "sources": [],
+    },
+}
+
+
+@respx.mock
+def test_repeat_call_served_from_cache():
+    """Test identical lookups hit the upstream once and reuse the parsed model."""
+    route = respx.get("{0}/email-verifier".format(HUNTER_API_BASE_URL)).mock(
+        return_value=httpx.Response(200, json=VERIFIER_PAYLOAD),
+    )
+    with create_client(api_key="test_key") as client:
+        first = client.email.verify("a@example.com")
+        second = client.email.verify("a@example.com")
+        assert client.cache.stats.hits == 1
+    assert route.call_count == 1
+    assert second is first
+    with pytest.raises(ValidationError):
+        first.score = 0
+
+
+@respx.mock
+def test_negative_results_cached_when_opted_in():
+    """Test cached errors are re-raised without another upstream call."""
+    route = respx.get("{0}/email-verifier".format(HUNTER_API_BASE_URL)).mock(
+        return_value=httpx.Response(400, json={"errors": []}),
+    )
+    policies = {"/email-verifier": CachePolicy(ttl=60, cache_errors=True)}
+    client = create_client(api_key="test_key")
+    client._http_client.cache_policies = policies
+    for _ in range(2):
+        with pytest.raises(HunterAPIError):
+            client.email.verify("bad@example.com")
+    client.close()
+    assert route.call_count == 1
+
+
+@respx.mock
+def test_stale_entry_served_while_refreshing():
+    """Test a stale entry is returned at once and refreshed once in the background."""
+    stale_score = dict(VERIFIER_PAYLOAD["data"], score=50)
+    route = respx.get("{0}/email-verifier".format(HUNTER_API_BASE_URL)).mock(
+        side_effect=[
+            httpx.Response(200, json={"data": stale_score}),
+            httpx.Response(503, json={"errors": []}),
+            httpx.Response(200, json=VERIFIER_PAYLOAD),
+        ],
+    )
+    client = create_client(api_key="test_key", retry_policy=RetryPolicy(max_attempts=1))
+    client._http_client.cache_policies = {"/email-verifier": CachePolicy(ttl=60, stale_after=0)}
+    assert client.email.verify("a@example.com").score == 50
+    for _ in range(2):
+        assert client.email.verify("a@example.com").score == 50
+        while client._http_client._revalidating:
+            time.sleep(0.01)
+    assert client.email.verify("a@example.com").score == 100
+    client.close()
+    assert route.call_count == 3
+
+
+@respx.mock
+async def test_async_revalidation_is_rate_limited():
+    """Test concurrent stale hits share one refresh and a zero rate disables refreshes."""
+    route = respx.get("{0}/email-verifier".format(HUNTER_API_BASE_URL)).mock(
+        return_value=httpx.Response(200, json=VERIFIER_PAYLOAD),
+    )
+    policies = {"/email-verifier": CachePolicy(ttl=60, stale_after=0)}
+    async with create_async_client(api_key="test_key") as client:
+        client._http_client.cache_policies = policies
+        await client.email.verify("a@example.com")
+        await asyncio.gather(*(client.email.verify("a@example.com") for _ in range(5)))
+        await asyncio.gather(*client._http_client._revalidations)
+    assert route.call_count == 2
+
+    async with create_async_client(api_key="test_key", revalidate_rate=0) as client:
+        client._http_client.cache_policies = policies
+        for _ in range(3):
+            await client.email.verify("a@example.com")
+    assert route.call_count == 3
+
+
+class ThreadRecordingCache(SQLiteCache):
+    """SQLite cache remembering which threads read and wrote it."""
+
+    def __init__(self, *args, **kwargs):
+        self.threads = set()
+        super().__init__(*args, **kwargs)
+
+    def get_entry(self, key):
+        self.threads.add(threading.get_ident())
+        return super().get_entry(key)
+
+    def set(self, key, cache_value, ttl=None, size=0):
+        self.threads.add(threading.get_ident())
+        super().set(key, cache_value, ttl=ttl, size=size)
+
+
+@respx.mock
+async def test_async_client_keeps_disk_cache_off_the_event_loop(tmp_path):
+    """Test the async client reads and writes the SQLite tier from worker threads."""
+    route = respx.get("{0}/email-verifier".format(HUNTER_API_BASE_URL)).mock(
+        return_value=httpx.Response(200, json=VERIFIER_PAYLOAD),
+    )
+    disk = ThreadRecordingCache(str(tmp_path / "cache.sqlite3"), compact_interval=0)
+    async with create_async_client(api_key="test_key", cache=TieredCache(LRUCache(), disk)) as client:
+        await client.email.verify("a@example.com")
+        client.cache.memory.clear()
+        await client.email.verify("a@example.com")
+        assert client.cache.stats.hits == 1
+    disk.close()
+    assert route.call_count == 1
+    assert disk.threads
+    assert threading.get_ident() not in disk.threads
+
+
+def test_sqlite_cache_shared_between_instances(tmp_path):
+    """Test two cache instances on one file see each other's entries."""
+    path = str(tmp_path / "cache.sqlite3")
+    writer = SQLiteCache(path, compact_interval=0, compress_min_bytes=1)
+    reader = SQLiteCache(path, compact_interval=0)
+    writer.set("key", {"answer": 42}, ttl=60)
+
+    assert reader.get("key") == {"answer": 42}
+    assert reader.stats.hits == 1
+    writer.close()
+    reader.close()
+
+
+def test_sqlite_cache_compaction(tmp_path):
+    """Test compaction purges expired rows and trims to the byte budget."""
+    clock = FakeClock()
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite3"), compact_interval=0, clock=clock)
+    cache.set("expired", "x", ttl=1)
+    cache.set("fresh", "y", ttl=100)
+    clock.now = 5
+
+    assert cache.get("expired") is None
+    assert cache.compact() == 1
+    cache.max_bytes = 0
+    assert cache.compact() == 1
+    assert cache.get("fresh") is None
+    cache.close()
+
+
+def test_sqlite_cache_compaction_returns_all_free_pages(tmp_path):
+    """Test compaction vacuums every page freed by purged rows, not just one."""
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite3"), compact_interval=0, compress_min_bytes=10**9)
+    for index in range(20):
+        cache.set("key{0}".format(index), "x" * 10000)
+    cache.max_bytes = 0
+
+    assert cache.compact() == 20
+    assert cache._connection().execute("PRAGMA freelist_count").fetchone()[0] == 0
+    cache.close()
+
+
+def test_tiered_cache_promotes_disk_hits(tmp_path):
+    """Test a disk hit is copied into the memory tier."""
+    disk = SQLiteCache(str(tmp_path / "cache.sqlite3"), compact_interval=0)
+    disk.set("key", "value", ttl=60)
+    cache = TieredCache(LRUCache(), disk)
+
+    assert cache.get("key") == "value"
+    assert cache.memory.get("key") == "value"
+    cache.close()
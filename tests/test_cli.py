@@ -0,0 +1,60 @@
+"""Tests for the hunter-client command line."""
+
+import pytest
+
+from hunter_client import cli
+
+
+def test_serve_passes_tuning_to_uvicorn(monkeypatch):
+    """Test serve starts workers from the import path with the tuned options."""
+    calls = []
+    monkeypatch.setattr(cli.uvicorn, "run", lambda app, **options: calls.append((app, options)))
+    monkeypatch.setenv("HUNTER_CACHE_PATH", "")
+    monkeypatch.setenv("HUNTER_DRAIN_TIMEOUT", "")
+    monkeypatch.setenv("HUNTER_WORKERS", "")
+
+    cli.main(
+        [
+            "serve",
+            "--workers",
+            "4",
+            "--loop",
+            "uvloop",
+            "--http",
+            "httptools",
+            "--backlog",
+            "4096",
+            "--keep-alive",
+            "15",
+            "--drain-timeout",
+            "3",
+            "--cache-path",
+            "/tmp/hunter.sqlite3",
+        ],
+    )
+
+    app, options = calls[0]
+    assert app == cli.APP_IMPORT_PATH
+    assert options["workers"] == 4
+    assert options["loop"] == "uvloop"
+    assert options["http"] == "httptools"
+    assert options["backlog"] == 4096
+    assert options["timeout_keep_alive"] == 15
+    assert options["timeout_graceful_shutdown"] == 30
+    assert not options["access_log"]
+    assert cli.os.environ["HUNTER_CACHE_PATH"] == "/tmp/hunter.sqlite3"
+    assert cli.os.environ["HUNTER_DRAIN_TIMEOUT"] == "3.0"
+    assert cli.os.environ["HUNTER_WORKERS"] == "4"
+
+
+def test_serve_defaults_to_one_worker_per_core(monkeypatch):
+    """Test the default worker count follows the CPUs the process may run on."""
+    monkeypatch.setattr(cli.os, "cpu_count", lambda: 64)
+    monkeypatch.setattr(cli.os, "sched_getaffinity", lambda pid: {0, 1, 2, 3, 4, 5}, raising=False)
+    args = cli.build_parser().parse_args(["serve"])
+    assert args.workers == 6
+    monkeypatch.delattr(cli.os, "sched_getaffinity")
+    assert cli.default_workers() == 64
+    assert args.loop == "auto"
+    with pytest.raises(SystemExit):
+        cli.build_parser().parse_args(["serve", "--loop", "trio"])
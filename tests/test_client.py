@@ -1,9 +1,22 @@
 """Basic tests for Hunter.io client."""
 
+import asyncio
+import json
+from pathlib import Path
+
+import httpx
 import pytest
+import respx
+
+from hunter_client.client import AsyncHunterClient, HunterClient, create_async_client, create_client
+from hunter_client.config import HUNTER_API_BASE_URL
+from hunter_client.models.account import AccountInformationResponse
+from hunter_client.models.domain import DomainSearchResponse
+from hunter_client.models.email_finder import EmailFinderResponse
+from hunter_client.models.verifier import EmailVerifierResponse
+from hunter_client.response_handler import HunterAPIError, process_api_response
 
-from hunter_client.client import HunterClient, create_client
-from hunter_client.response_handler import HunterAPIError
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 
 def test_create_client():
@@ -46,3 +59,157 @@ def test_client_services_exist():
     assert hasattr(client.account, "get_information")
 
     client.close()
+
+
+ACCOUNT_PAYLOAD = {
+    "data": {
+        "email": "owner@example.com",
+        "plan_name": "Free",
+        "plan_level": 0,
+        "reset_date": "2024-01-01",
+        "team_id": 1,
+        "calls": {"used": 1, "available": 25},
+    },
+}
+VERIFIER_DATA = {
+    "status": "valid",
+    "result": "deliverable",
+    "score": 90,
+    "regexp": True,
+    "gibberish": False,
+    "disposable": False,
+    "webmail": False,
+    "mx_records": True,
+    "smtp_server": True,
+    "smtp_check": True,
+    "accept_all": False,
+    "block": False,
+}
+
+
+async def test_async_client_context_manager():
+    """Test async client works as async context manager."""
+    async with create_async_client(api_key="test_key") as client:
+        assert isinstance(client, AsyncHunterClient)
+        assert hasattr(client, "domain")
+        assert hasattr(client, "email")
+        assert hasattr(client, "account")
+
+
+@respx.mock
+async def test_async_account_information():
+    """Test async services await the upstream call and parse the model."""
+    route = respx.get("{0}/account".format(HUNTER_API_BASE_URL)).mock(
+        return_value=httpx.Response(200, json=ACCOUNT_PAYLOAD),
+    )
+    async with create_async_client(api_key="test_key") as client:
+        account = await client.account.get_information()
+
+    assert route.called
+    assert route.calls.last.request.url.params["api_key"] == "test_key"
+    assert account.plan_name == "Free"
+
+
+@respx.mock
+async def test_use_cache_is_deprecated_and_ignored():
+    """Test the removed ``use_cache`` argument still works positionally and by keyword, with a warning."""
+    route = respx.get("{0}/account".format(HUNTER_API_BASE_URL)).mock(
+        return_value=httpx.Response(200, json=ACCOUNT_PAYLOAD),
+    )
+    with create_client(api_key="test_key") as client:
+        with pytest.warns(DeprecationWarning, match="use_cache"):
+            assert client._http_client.get("/account", {}, False).status_code == 200
+    async with create_async_client(api_key="test_key") as async_client:
+        with pytest.warns(DeprecationWarning, match="use_cache"):
+            response = await async_client._http_client.get("/account", use_cache=True)
+    assert response.status_code == 200
+    assert route.call_count == 2
+
+
+async def test_async_close_drains_in_flight_calls():
+    """Test closing with a drain timeout lets a slow upstream call finish."""
+    started = asyncio.Event()
+
+    async def slow_account(request):
+        started.set()
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json=ACCOUNT_PAYLOAD)
+
+    client = AsyncHunterClient(api_key="test_key", transport=httpx.MockTransport(slow_account))
+    lookup = asyncio.create_task(client.account.get_information())
+    await started.wait()
+    await client.aclose(drain_timeout=5)
+
+    assert (await lookup).plan_name == "Free"
+    assert client._http_client.active_calls == 0
+
+
+@respx.mock
+def test_verify_many_dedupes_and_uses_cache():
+    """Test bulk verification skips duplicates and cached addresses, ignoring only the case of domains."""
+
+    def verifier_response(request):
+        return httpx.Response(200, json={"data": dict(VERIFIER_DATA, email=request.url.params["email"])})
+
+    route = respx.get("{0}/email-verifier".format(HUNTER_API_BASE_URL)).mock(side_effect=verifier_response)
+    with create_client(api_key="test_key") as client:
+        client.email.verify("a@example.com")
+        results = list(
+            client.email.verify_many(
+                ["a@example.com", "B@Example.com", "B@example.com", "b@example.com"], concurrency=2
+            ),
+        )
+
+    assert sorted(item.email for item in results) == ["B@Example.com", "a@example.com", "b@example.com"]
+    assert all(item.result is not None for item in results)
+    assert sorted(call.request.url.params["email"] for call in route.calls[1:]) == ["B@example.com", "b@example.com"]
+
+
+async def test_async_verify_many_waits_for_cancelled_calls():
+    """Test a consumer stopping early leaves no verification task running behind it."""
+    started = asyncio.Event()
+
+    async def verifier_response(request):
+        email = request.url.params["email"]
+        if email == "slow@example.com":
+            started.set()
+            await asyncio.sleep(60)
+        return httpx.Response(200, json={"data": dict(VERIFIER_DATA, email=email)})
+
+    async with AsyncHunterClient(api_key="test_key", transport=httpx.MockTransport(verifier_response)) as client:
+        await client.email.verify("a@example.com")
+        results = client.email.verify_many(["slow@example.com", "a@example.com"])
+        assert (await anext(results)).email == "a@example.com"
+        await started.wait()
+        await results.aclose()
+        verifications = [
+            task for task in asyncio.all_tasks() if task.get_coro().__qualname__.endswith("._verify_uncached")
+        ]
+        assert not verifications
+
+
+@pytest.mark.parametrize("fixture_name", ["domain_search", "email_finder", "email_verifier", "account"])
+def test_fast_decode_matches_validate(fixture_name):
+    """Test the fast decode mode builds the same models as full validation."""
+    fixture = json.loads((FIXTURES_DIR / "{0}.json".format(fixture_name)).read_text())
+    response_model = {
+        "domain_search": DomainSearchResponse,
+        "email_finder": EmailFinderResponse,
+        "email_verifier": EmailVerifierResponse,
+        "account": AccountInformationResponse,
+    }[fixture_name]
+    request = httpx.Request("GET", HUNTER_API_BASE_URL)
+    response = httpx.Response(200, json=fixture, request=request)
+
+    parsed = process_api_response(response, response_model, "fast")
+    assert parsed == process_api_response(response, response_model)
+    if "meta" in response_model.model_fields:
+        assert parsed.meta.total_results == fixture["meta"]["results"]
+
+
+def test_fast_decode_reports_invalid_payloads():
+    """Test the fast decode mode raises HunterAPIError for bad bodies."""
+    request = httpx.Request("GET", HUNTER_API_BASE_URL)
+    for body in (b"not json", b'{"data": {"plan_name": "Free"}}'):
+        with pytest.raises(HunterAPIError, match="Validation error"):
+            process_api_response(httpx.Response(200, content=body, request=request), AccountInformationResponse, "fast")
@@ -0,0 +1,111 @@
+"""Tests for the local contact store."""
+
+import json
+import time
+from pathlib import Path
+
+import httpx
+
+from hunter_client.client import AsyncHunterClient, HunterClient
+from hunter_client.contacts import ContactStore
+from hunter_client.models.domain import DomainSearchParams, DomainSearchResponse
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+DOMAIN_SEARCH_PAYLOAD = json.loads((FIXTURES_DIR / "domain_search.json").read_text())
+PAGE = DomainSearchResponse(**DOMAIN_SEARCH_PAYLOAD["data"])
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_store_answers_once_pages_cover_the_domain():
+    """Test filtered searches are answered only from a complete, fresh list."""
+    clock = FakeClock()
+    store = ContactStore(ttl=100, stale_after=50, clock=clock)
+    first_page = PAGE.model_copy(update={"emails": PAGE.emails[:2]})
+    last_page = PAGE.model_copy(update={"emails": PAGE.emails[2:]})
+    executives = DomainSearchParams(domain="example.com", seniority="executive,senior", limit=1, offset=1)
+
+    store.record(DomainSearchParams(domain="example.com", limit=2), first_page)
+    store.record(DomainSearchParams(domain="example.com", department="it", limit=2), last_page)
+    assert store.search(executives) == (None, False)
+
+    store.record(DomainSearchParams(domain="www.Example.com", limit=2, offset=2), last_page)
+    answer, stale = store.search(executives)
+    assert [email.email_value for email in answer.emails] == ["claire@example.com"]
+    assert answer.meta.total_results == 2
+    assert answer.organization == PAGE.organization
+    assert not stale
+    assert [email.email_value for email in store.query("example.com", email_type="personal", min_confidence=90)] == [
+        "patrick@example.com",
+    ]
+
+    clock.now = 60
+    assert store.search(executives)[1]
+    clock.now = 100
+    assert store.search(executives) == (None, False)
+    assert len(store) == 0
+
+
+def test_client_filters_locally_and_refreshes_stale_domains():
+    """Test filtered searches after a full fetch skip upstream until the list goes stale."""
+    calls = []
+
+    def hunter_response(request):
+        calls.append(dict(request.url.params))
+        return httpx.Response(200, json=DOMAIN_SEARCH_PAYLOAD)
+
+    with HunterClient(api_key="test_key", transport=httpx.MockTransport(hunter_response)) as client:
+        store = client.store_contacts(ContactStore(stale_after=0))
+        client.domain.search(domain="example.com")
+        support = client.domain.search(domain="example.com", department="support")
+        assert [email.email_value for email in support.emails] == ["support@example.com"]
+        while client._http_client._revalidating:
+            time.sleep(0.01)
+    assert len(calls) == 2
+    assert "department" not in calls[1]
+    assert store.query("example.com", seniority="junior") == []
+
+
+async def test_async_client_pages_through_local_results():
+    """Test async iteration over a complete domain is served from the store."""
+    calls = []
+
+    def hunter_response(request):
+        calls.append(request.url.params.get("department"))
+        return httpx.Response(200, json=DOMAIN_SEARCH_PAYLOAD)
+
+    async with AsyncHunterClient(api_key="test_key", transport=httpx.MockTransport(hunter_response)) as client:
+        client.store_contacts()
+        await client.domain.search(domain="example.com")
+        emails = [email.email_value async for email in client.domain.iter_emails("example.com", page_size=1)]
+    assert emails == [email.email_value for email in PAGE.emails]
+    assert calls == [None]
+
+
+def test_full_pages_complete_the_store_from_hunter_meta():
+    """Test pages that are all full complete a domain once Hunter.io's meta total is reached."""
+    calls = []
+
+    def hunter_response(request):
+        offset = int(request.url.params["offset"])
+        calls.append(offset)
+        payload = json.loads(json.dumps(DOMAIN_SEARCH_PAYLOAD))
+        payload["data"]["emails"] = payload["data"]["emails"][offset : offset + 1]
+        payload["meta"].update(limit=1, offset=offset)
+        return httpx.Response(200, json=payload)
+
+    with HunterClient(api_key="test_key", transport=httpx.MockTransport(hunter_response)) as client:
+        client.store_contacts()
+        assert len(list(client.domain.iter_emails("example.com", page_size=1))) == len(PAGE.emails)
+        support = client.domain.search(domain="example.com", department="support")
+    assert [email.email_value for email in support.emails] == ["support@example.com"]
+    assert support.meta.total_results == 1
+    assert calls == [0, 1, 2]
@@ -0,0 +1,62 @@
+"""Tests for columnar storage of domain search emails."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from benchmarks.mock_hunter import MockHunter
+from hunter_client.client import AsyncHunterClient, HunterClient
+from hunter_client.email_table import EmailTable
+from hunter_client.models.domain import DomainSearchResponse
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+EMAILS = DomainSearchResponse(**json.loads((FIXTURES_DIR / "domain_search.json").read_text())["data"]).emails
+
+
+def test_table_round_trips_emails_and_shares_categories():
+    """Test rows materialize back into equal models while repeated strings are stored once."""
+    table = EmailTable.from_emails(EMAILS * 2)
+
+    assert len(table) == 6
+    assert list(table) == EMAILS * 2
+    assert table[-1] == EMAILS[-1]
+    assert table.row(1)["sources"][0]["uri"] == "https://example.com/contact"
+    assert table.categories["type"].values == [None, "personal", "generic"]
+    assert table.categories["seniority"][1] is None
+    assert len(table.source_categories["domain"].values) < len(table.source_uri)
+    with pytest.raises(IndexError):
+        table.row(6)
+
+
+def test_exports_share_buffers():
+    """Test NumPy and Arrow exports view the table's numeric and code buffers."""
+    np = pytest.importorskip("numpy")
+    pytest.importorskip("pyarrow")
+    table = EmailTable.from_emails(EMAILS)
+
+    columns = table.to_numpy()
+    assert np.shares_memory(columns["confidence"], np.frombuffer(table.confidence, dtype=np.int32))
+    assert columns["confidence"].tolist() == [email.confidence for email in EMAILS]
+    assert table.to_records()["email_value"].tolist() == [email.email_value for email in EMAILS]
+
+    arrow_table = table.to_arrow()
+    assert arrow_table.column("seniority").to_pylist() == [email.seniority for email in EMAILS]
+    assert arrow_table.column("seniority").null_count == 1
+    assert [len(sources) for sources in arrow_table.column("sources").to_pylist()] == [
+        len(email.sources) for email in EMAILS
+    ]
+    with pytest.raises(BufferError):
+        table.append(EMAILS[0])
+
+
+async def test_services_collect_every_page():
+    """Test the sync and async domain services page into a table."""
+    mock = MockHunter(total_results=150)
+    with HunterClient(api_key="test_key", transport=mock.transport()) as client:
+        table = client.domain.email_table("example.com")
+    async with AsyncHunterClient(api_key="test_key", transport=mock.async_transport()) as async_client:
+        async_table = await async_client.domain.email_table("example.com", page_size=40)
+
+    assert len(table) == len(async_table) == 150
+    assert table[149].email_value == async_table[149].email_value == "user149@example.com"
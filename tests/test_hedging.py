@@ -0,0 +1,173 @@
+"""Tests for hedged upstream requests."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+
+from hunter_client.client import AsyncHunterClient, HunterClient
+from hunter_client.hedging import HedgePolicy, Hedger, LatencyWindow
+from hunter_client.metrics import ClientHooks
+from hunter_client.rate_limit import RateLimiter
+
+ACCOUNT_PAYLOAD = {
+    "data": {
+        "email": "owner@example.com",
+        "plan_name": "Free",
+        "plan_level": 0,
+        "reset_date": "2024-01-01",
+        "calls": {"used": 7, "available": 25},
+    },
+}
+SLOW_SECONDS = 1.0
+
+
+class FinishedAttempts(ClientHooks):
+    """Records the status of every finished attempt."""
+
+    def __init__(self):
+        self.statuses = []
+
+    def request_finished(self, endpoint, status, seconds):
+        self.statuses.append(status)
+
+
+def test_hedger_adapts_delay_within_budget():
+    """Test the delay follows the latency percentile once enough samples exist, and hedges respect the budget."""
+    window = LatencyWindow(size=4)
+    for seconds in (0.4, 0.1, 0.3, 0.2, 0.5):
+        window.add(seconds)
+    assert len(window) == 4
+    assert window.percentile(50) == 0.3
+    assert window.percentile(100) == 0.5
+
+    hedger = Hedger(HedgePolicy(initial_delay=2.0, min_delay=0.05, min_samples=3, budget_ratio=0.5))
+    assert hedger.delay("/account") == 2.0
+    for seconds in (0.01, 0.02, 0.03):
+        hedger.observe("/account", seconds)
+    assert hedger.delay("/account") == 0.05
+    for _ in range(20):
+        hedger.observe("/account", 0.3)
+    assert hedger.delay("/account") == 0.3
+    assert hedger.try_hedge()
+    assert not hedger.try_hedge()
+    assert Hedger(HedgePolicy(endpoints=frozenset(("/account",)))).delay("/domain-search") is None
+    assert Hedger(HedgePolicy()).delay("/email-verifier") is None
+    assert Hedger(HedgePolicy(endpoints=frozenset(("/email-verifier",)))).delay("/email-verifier") is not None
+
+
+def test_hedge_is_charged_only_once_a_token_is_taken():
+    """Test a hedge refused by the rate limiter leaves the budget and counter alone, and vice versa."""
+    client = HunterClient(api_key="test_key", hedge_policy=HedgePolicy(budget_ratio=1.0))
+    http_client = client._http_client
+    rate_limiter = RateLimiter({"/account": 1})
+    bucket = rate_limiter.bucket("/account")
+    client.hedger.delay("/account")
+    assert bucket.try_acquire()
+    assert not http_client._may_hedge("/account", rate_limiter)
+    assert client.hedger.hedges == 0
+
+    bucket.release()
+    assert http_client._may_hedge("/account", rate_limiter)
+    assert client.hedger.hedges == 1
+    assert not bucket.try_acquire()
+
+    bucket.release()
+    assert not http_client._may_hedge("/account", rate_limiter)
+    assert bucket.try_acquire()
+    client.close()
+
+
+def test_sync_client_returns_the_first_answer():
+    """Test a slow first attempt is overtaken by its hedge."""
+    calls = []
+    calls_lock = threading.Lock()
+
+    def hunter_response(request):
+        with calls_lock:
+            calls.append(time.perf_counter())
+            first = len(calls) == 1
+        if first:
+            time.sleep(SLOW_SECONDS)
+        return httpx.Response(200, json=ACCOUNT_PAYLOAD)
+
+    policy = HedgePolicy(initial_delay=0.05, budget_ratio=1.0)
+    with HunterClient(
+        api_key="test_key",
+        transport=httpx.MockTransport(hunter_response),
+        hedge_policy=policy,
+    ) as client:
+        started_at = time.perf_counter()
+        account = client.account.get_information()
+        elapsed = time.perf_counter() - started_at
+        assert client.hedger.hedges == 1
+        assert client.hedger.hedge_wins == 1
+    assert account.email == "owner@example.com"
+    assert elapsed < SLOW_SECONDS
+    assert len(calls) == 2
+
+
+async def test_async_client_cancels_the_losing_attempt():
+    """Test the slower attempt is cancelled and reported as such, and an empty budget stops hedging."""
+    calls = []
+
+    async def hunter_response(request):
+        calls.append(request.url.path)
+        if len(calls) == 1:
+            await asyncio.sleep(SLOW_SECONDS)
+        return httpx.Response(200, json=ACCOUNT_PAYLOAD)
+
+    policy = HedgePolicy(initial_delay=0.05, budget_ratio=1.0)
+    async with AsyncHunterClient(
+        api_key="test_key",
+        transport=httpx.MockTransport(hunter_response),
+        hedge_policy=policy,
+    ) as client:
+        attempts = FinishedAttempts()
+        client.add_hook(attempts)
+        started_at = time.perf_counter()
+        await client.account.get_information()
+        assert time.perf_counter() - started_at < SLOW_SECONDS
+        assert sorted(attempts.statuses) == ["200", "cancelled"]
+        assert client.hedger.hedge_wins == 1
+
+    calls.clear()
+    policy = HedgePolicy(initial_delay=0.05, budget_ratio=0.01)
+    async with AsyncHunterClient(
+        api_key="test_key",
+        transport=httpx.MockTransport(hunter_response),
+        hedge_policy=policy,
+    ) as client:
+        await client.account.get_information()
+        assert client.hedger.hedges == 0
+    assert len(calls) == 1
+
+
+async def test_delay_holds_under_a_steady_slow_tail():
+    """Test abandoned slow attempts still count, so the delay does not fall to the fast hedges' latency."""
+    in_flight = []
+
+    async def hunter_response(request):
+        # First attempts are slow; hedges, sent while one is pending, answer at once
+        if not in_flight:
+            in_flight.append(request)
+            try:
+                await asyncio.sleep(SLOW_SECONDS)
+            finally:
+                in_flight.remove(request)
+        return httpx.Response(200, json=ACCOUNT_PAYLOAD)
+
+    policy = HedgePolicy(initial_delay=0.05, min_delay=0.001, min_samples=3, budget_ratio=1.0)
+    async with AsyncHunterClient(
+        api_key="test_key",
+        transport=httpx.MockTransport(hunter_response),
+        hedge_policy=policy,
+    ) as client:
+        # Hedges only take spare rate limit tokens; leave enough for every call
+        client._http_client.rate_limiter = RateLimiter({"/account": 0})
+        for _ in range(5):
+            await client.account.get_information()
+            client.cache.clear()
+        assert client.hedger.hedge_wins == 5
+        assert client.hedger.delay("/account") >= policy.initial_delay
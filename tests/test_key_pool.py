@@ -0,0 +1,124 @@
+"""Tests for routing calls across several API keys."""
+
+import httpx
+import pytest
+import respx
+from fastapi.testclient import TestClient
+
+from hunter_client.client import create_client
+from hunter_client.config import HUNTER_API_BASE_URL
+from hunter_client.key_pool import APIKeyPool, parse_reset_date
+from hunter_client.main import app
+from hunter_client.models.account import AccountInformationResponse
+from hunter_client.rate_limit import QuotaExceededError
+
+RESET_DATE = "2024-03-01"
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def make_account(used, available, reset_date=RESET_DATE):
+    """Build an account response with the given call counters."""
+    return AccountInformationResponse(
+        email="owner@example.com",
+        plan_name="Starter",
+        plan_level=1,
+        reset_date=reset_date,
+        calls={"used": used, "available": available},
+    )
+
+
+def test_pool_routes_to_most_remaining_then_least_loaded():
+    """Test keys with more credits win, and in-flight calls count against a key."""
+    key_pool = APIKeyPool(["key_a", "key_b"])
+    key_pool.update("key_a", make_account(used=90, available=100))
+    key_pool.update("key_b", make_account(used=92, available=100))
+
+    first = key_pool.acquire("/domain-search")
+    assert first.api_key == "key_a"
+    busy = [key_pool.acquire("/domain-search") for _ in range(5)]
+    assert [pooled_key.api_key for pooled_key in busy].count("key_b") == 2
+    for pooled_key in [first, *busy]:
+        key_pool.release(pooled_key)
+    assert all(pooled_key.in_flight == 0 for pooled_key in key_pool.keys)
+
+
+def test_exhausted_key_is_ejected_until_reset_date():
+    """Test a key at its reserve leaves the pool until its plan resets."""
+    reset_at = parse_reset_date(RESET_DATE)
+    clock = FakeClock(reset_at - 3600)
+    key_pool = APIKeyPool(["key_a", "key_b"], reserve=5, clock=clock)
+    key_pool.update("key_a", make_account(used=90, available=100))
+    key_pool.update("key_b", make_account(used=99, available=100))
+
+    assert key_pool.acquire("/email-finder").api_key == "key_a"
+    summary = key_pool.summary()
+    assert summary.active_keys == 1
+    assert summary.accounts[1].status == "ejected"
+    assert summary.accounts[1].available_at.timestamp() == reset_at
+    assert summary.calls == {"used": 189, "available": 200}
+    assert summary.accounts[0].key == "...ey_a"
+    # Ejected keys are skipped for free endpoints too
+    assert key_pool.acquire("/account").api_key == "key_a"
+
+    key_pool.update("key_a", make_account(used=100, available=100))
+    with pytest.raises(QuotaExceededError):
+        key_pool.acquire("/email-finder")
+
+    clock.now = reset_at
+    assert key_pool.summary().active_keys == 2
+    assert key_pool.keys[1].quota.remaining is None
+
+
+@respx.mock
+def test_throttled_key_is_ejected_and_call_rerouted():
+    """Test a 429 on one key retries immediately on another key."""
+
+    def verifier_response(request):
+        if request.url.params["api_key"] == "key_a":
+            return httpx.Response(429, headers={"Retry-After": "60"})
+        return httpx.Response(200, json={"data": {"status": "valid", "email": "a@example.com"}})
+
+    route = respx.get("{0}/email-verifier".format(HUNTER_API_BASE_URL)).mock(side_effect=verifier_response)
+    with create_client(api_key=["key_a", "key_b"]) as client:
+        key_pool = client.key_pool
+        key_pool.update("key_a", make_account(used=0, available=100))
+        key_pool.update("key_b", make_account(used=50, available=100))
+        response = client._http_client.get("/email-verifier", {"email": "a@example.com"})
+        summary = key_pool.summary()
+
+    assert response.status_code == 200
+    assert [call.request.url.params["api_key"] for call in route.calls] == ["key_a", "key_b"]
+    assert summary.accounts[0].status == "ejected"
+    assert summary.accounts[1].remaining == 49
+
+
+def test_account_route_aggregates_keys(monkeypatch):
+    """Test /account reports every key and summed credits when a pool is configured."""
+    monkeypatch.setenv("HUNTER_API_KEYS", "key_a, key_b")
+
+    def account_response(request):
+        used = 10 if request.url.params["api_key"] == "key_a" else 20
+        account = make_account(used=used, available=100).model_dump()
+        return httpx.Response(200, json={"data": account})
+
+    with respx.mock:
+        respx.get("{0}/account".format(HUNTER_API_BASE_URL)).mock(side_effect=account_response)
+        with TestClient(app) as api:
+            response = api.get("/account")
+
+    assert response.status_code == 200
+    account_pool = response.json()
+    assert account_pool["keys"] == 2
+    assert account_pool["active_keys"] == 2
+    assert account_pool["calls"] == {"used": 30, "available": 200}
+    assert account_pool["reset_date"] == RESET_DATE
+    assert [account["remaining"] for account in account_pool["accounts"]] == [90, 80]
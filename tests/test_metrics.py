@@ -0,0 +1,103 @@
+"""Tests for Prometheus metrics."""
+
+import httpx
+import pytest
+import respx
+from fastapi.testclient import TestClient
+
+from hunter_client.client import HunterClient
+from hunter_client.config import HUNTER_API_BASE_URL
+from hunter_client.main import app
+from hunter_client.metrics import ClientHooks, Counter, Histogram, MetricsRegistry
+from hunter_client.response_handler import HunterAPIError
+from hunter_client.retry import RetryPolicy
+
+ACCOUNT_PAYLOAD = {
+    "data": {
+        "email": "owner@example.com",
+        "plan_name": "Free",
+        "plan_level": 0,
+        "reset_date": "2024-01-01",
+        "calls": {"used": 7, "available": 25},
+    },
+}
+
+
+def test_registry_renders_exposition_format():
+    """Test counters and cumulative histogram buckets render as Prometheus text."""
+    registry = MetricsRegistry()
+    calls = registry.register(Counter("calls_total", "Calls.", ("endpoint",)))
+    latency = registry.register(Histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0)))
+    calls.inc('/say "hi"')
+    latency.observe(0.1)
+    latency.observe(0.5)
+    latency.observe(5)
+
+    lines = registry.render().splitlines()
+    assert "# TYPE calls_total counter" in lines
+    assert 'calls_total{endpoint="/say \\"hi\\""} 1' in lines
+    assert 'latency_seconds_bucket{le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{le="1.0"} 2' in lines
+    assert 'latency_seconds_bucket{le="+Inf"} 3' in lines
+    assert "latency_seconds_sum 5.6" in lines
+    assert "latency_seconds_count 3" in lines
+
+
+@respx.mock
+def test_client_metrics_record_calls_validation_cache_and_credits():
+    """Test an instrumented client records upstream, validation, cache and credit metrics."""
+    respx.get("{0}/account".format(HUNTER_API_BASE_URL)).mock(
+        side_effect=[httpx.Response(200, json=ACCOUNT_PAYLOAD), httpx.Response(200, json={"data": {}})],
+    )
+    with HunterClient(api_key="test_key", retry_policy=RetryPolicy(max_attempts=1)) as client:
+        metrics = client.instrument()
+        client.account.get_information()
+        client.account.get_information()
+        with pytest.raises(HunterAPIError):
+            client.account.refresh_information()
+        rendered = metrics.registry.render()
+
+    assert metrics.upstream_requests.value("/account", "200") == 2
+    assert metrics.upstream_latency.count("/account") == 2
+    assert metrics.upstream_in_flight.value("/account") == 0
+    assert metrics.validation_latency.count("/account", "ok") == 1
+    assert metrics.validation_latency.count("/account", "error") == 1
+    assert metrics.credits_used.value() == 7
+    assert metrics.credits_available.value() == 25
+    assert "hunter_cache_hits_total 1" in rendered
+    assert "hunter_cache_entries 1" in rendered
+
+
+@respx.mock
+def test_hooks_see_transport_errors():
+    """Test hooks are told about attempts that fail without a response."""
+    respx.get("{0}/account".format(HUNTER_API_BASE_URL)).mock(side_effect=httpx.ConnectError("refused"))
+    finished = []
+
+    class RecordingHooks(ClientHooks):
+        def request_finished(self, endpoint, status, seconds):
+            finished.append((endpoint, status))
+
+    with HunterClient(api_key="test_key", retry_policy=RetryPolicy(max_attempts=1)) as client:
+        client.add_hook(RecordingHooks())
+        with pytest.raises(httpx.ConnectError):
+            client.account.get_information()
+    assert finished == [("/account", "error")]
+
+
+def test_metrics_route_reports_routes_and_upstream(monkeypatch):
+    """Test /metrics exposes route and upstream metrics of the shared client."""
+    monkeypatch.setenv("HUNTER_API_KEY", "test_key")
+    with respx.mock:
+        respx.get("{0}/account".format(HUNTER_API_BASE_URL)).mock(
+            return_value=httpx.Response(200, json=ACCOUNT_PAYLOAD),
+        )
+        with TestClient(app) as api:
+            assert api.get("/account").status_code == 200
+            response = api.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'hunter_http_requests_total{method="GET",route="/account",status="200"}' in response.text
+    assert 'hunter_upstream_requests_total{endpoint="/account",status="200"}' in response.text
+    assert "hunter_account_credits_available 25" in response.text
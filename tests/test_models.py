@@ -0,0 +1,21 @@
+"""Tests for the Hunter.io response models."""
+
+from hunter_client.models.common import Email
+
+EMAIL_DATA = {
+    "type": "personal",
+    "confidence": 94,
+    "sources": [],
+    "first_name": "Alexis",
+    "last_name": "Martin",
+}
+
+
+def test_email_reads_hunter_value_key():
+    """Test the address is read from Hunter.io's ``value`` key as well as ``email_value``."""
+    from_api = Email.model_validate({**EMAIL_DATA, "value": "alexis@example.com"})
+    from_callers = Email(**EMAIL_DATA, email_value="alexis@example.com")
+
+    assert from_api.email_value == "alexis@example.com"
+    assert from_api == from_callers
+    assert from_api.model_dump()["email_value"] == "alexis@example.com"
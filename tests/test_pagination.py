@@ -0,0 +1,115 @@
+"""Tests for auto-paginating domain search."""
+
+import json
+
+import httpx
+import pytest
+import respx
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+
+from hunter_client.client import create_async_client, create_client
+from hunter_client.config import HUNTER_API_BASE_URL, MAX_LIMIT
+from hunter_client.main import app
+from hunter_client.models.domain import DomainSearchParams
+
+TOTAL_RESULTS = 4
+
+
+def domain_page(request):
+    """Serve a slice of a fake domain with TOTAL_RESULTS emails, shaped like Hunter.io's responses."""
+    limit = int(request.url.params["limit"])
+    offset = int(request.url.params["offset"])
+    emails = [
+        {"value": "user{0}@example.com".format(index), "type": "personal", "confidence": 90, "sources": []}
+        for index in range(offset, min(offset + limit, TOTAL_RESULTS))
+    ]
+    data = {
+        "domain": "example.com",
+        "disposable": False,
+        "webmail": False,
+        "accept_all": False,
+        "emails": emails,
+    }
+    meta = {
+        "results": TOTAL_RESULTS,
+        "limit": limit,
+        "offset": offset,
+        "params": {"domain": "example.com", "type": None},
+    }
+    return httpx.Response(200, json={"data": data, "meta": meta})
+
+
+def test_limit_above_max_rejected():
+    """Test page sizes above the API maximum are rejected."""
+    with pytest.raises(ValidationError):
+        DomainSearchParams(domain="example.com", limit=MAX_LIMIT + 1)
+
+
+@respx.mock
+def test_iter_emails_walks_all_pages():
+    """Test the iterator stops at the total in ``meta`` instead of fetching an empty page, caching only the first."""
+    route = respx.get("{0}/domain-search".format(HUNTER_API_BASE_URL)).mock(side_effect=domain_page)
+    with create_client(api_key="test_key") as client:
+        emails = [email.email_value for email in client.domain.iter_emails("example.com", page_size=2)]
+        assert len(client.cache) == 1
+
+    assert emails == ["user{0}@example.com".format(index) for index in range(TOTAL_RESULTS)]
+    assert route.call_count == 2
+
+
+@respx.mock
+async def test_async_iter_emails_walks_all_pages():
+    """Test the async iterator fetches every page exactly once."""
+    route = respx.get("{0}/domain-search".format(HUNTER_API_BASE_URL)).mock(side_effect=domain_page)
+    async with create_async_client(api_key="test_key") as client:
+        emails = [email.email_value async for email in client.domain.iter_emails("example.com", page_size=2)]
+
+    assert len(emails) == TOTAL_RESULTS
+    assert route.call_count == 2
+    assert len(client.cache) == 1
+
+
+def test_stream_route(monkeypatch):
+    """Test the streaming route emits one NDJSON line per email."""
+    monkeypatch.setenv("HUNTER_API_KEY", "test_key")
+    with respx.mock:
+        respx.get("{0}/domain-search".format(HUNTER_API_BASE_URL)).mock(side_effect=domain_page)
+        with TestClient(app) as api:
+            response = api.get("/domain-search/stream", params={"domain": "example.com", "page_size": 3})
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert len(lines) == TOTAL_RESULTS
+    assert lines[0]["email_value"] == "user0@example.com"
+
+
+@pytest.mark.parametrize(
+    ("upstream", "status_code"),
+    [
+        (httpx.Response(401, json={"errors": [{"details": "No user found for the API key supplied"}]}), 401),
+        (httpx.UnsupportedProtocol("unsupported"), 500),
+    ],
+)
+def test_stream_route_maps_first_page_errors(monkeypatch, upstream, status_code):
+    """Test errors fetching the first page answer with a status like the other routes, not a broken stream."""
+    monkeypatch.setenv("HUNTER_API_KEY", "test_key")
+    with respx.mock:
+        respx.get("{0}/domain-search".format(HUNTER_API_BASE_URL)).mock(side_effect=[upstream])
+        with TestClient(app) as api:
+            response = api.get("/domain-search/stream", params={"domain": "example.com"})
+
+    assert response.status_code == status_code
+    assert response.json()["detail"]
+
+
+def test_domain_search_route_keeps_meta(monkeypatch):
+    """Test the top-level meta of Hunter.io's response reaches the model and the route's body."""
+    monkeypatch.setenv("HUNTER_API_KEY", "test_key")
+    with respx.mock:
+        respx.get("{0}/domain-search".format(HUNTER_API_BASE_URL)).mock(side_effect=domain_page)
+        with TestClient(app) as api:
+            body = api.get("/domain-search", params={"domain": "example.com", "limit": 3}).json()
+
+    assert body["meta"]["total_results"] == TOTAL_RESULTS
+    assert body["meta"]["limit"] == 3
+    assert body["meta"]["search_params"] == {"domain": "example.com", "type": None}
@@ -0,0 +1,70 @@
+"""Tests for learning domain email patterns and inferring addresses."""
+
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+from hunter_client.client import HunterClient
+from hunter_client.models.domain import DomainSearchResponse
+from hunter_client.patterns import PatternIndex, PatternNotFoundError, derive_pattern, render_pattern
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+DOMAIN_SEARCH_PAYLOAD = json.loads((FIXTURES_DIR / "domain_search.json").read_text())
+
+
+def test_derive_and_render_patterns():
+    """Test patterns are derived unambiguously and rendered from normalized names."""
+    assert derive_pattern("patrick.collins@example.com", "Patrick", "Collins") == "{first}.{last}"
+    assert derive_pattern("pcollins@example.com", "Patrick", "Collins") == "{f}{last}"
+    assert derive_pattern("ab@example.com", "A", "B") is None
+    assert derive_pattern("sales@example.com", "Patrick", "Collins") is None
+    assert render_pattern("{f}{last}", "José", "Núñez-Díaz") == "jnunezdiaz"
+    assert render_pattern("{first}.{last}", "Cher", "") is None
+    assert render_pattern("{unknown}", "Jane", "Doe") is None
+
+
+def test_index_trusts_consistent_patterns_only():
+    """Test a pattern is used once it is observed often and consistently enough."""
+    index = PatternIndex(min_confidence=0.75, min_observations=3)
+    index.learn(DomainSearchResponse(**DOMAIN_SEARCH_PAYLOAD["data"]))
+    inferred = index.infer("WWW.Example.com", full_name="Jane van Doe")
+    assert inferred.email == "jane@example.com"
+    assert inferred.inferred
+    assert inferred.score == 100
+
+    index.observe("example.com", "{first}.{last}")
+    assert index.best("example.com").confidence == 0.75
+    index.observe("example.com", "{first}.{last}")
+    assert index.best("example.com") is None
+    assert index.infer("unknown.com", "Jane", "Doe") is None
+
+
+def test_find_infers_locally_after_domain_search():
+    """Test finds use the learned pattern only when asked to and fall back upstream otherwise."""
+    finder_calls = []
+
+    def hunter_response(request):
+        if request.url.path.endswith("/domain-search"):
+            return httpx.Response(200, json=DOMAIN_SEARCH_PAYLOAD)
+        finder_calls.append(request.url.params["domain"])
+        return httpx.Response(200, json={"data": {"email": "jane@other.com", "domain": "other.com", "score": 90}})
+
+    with HunterClient(api_key="test_key", transport=httpx.MockTransport(hunter_response)) as client:
+        with pytest.raises(ValueError):
+            client.email.find("example.com", "Jane", "Doe", infer="prefer")
+        client.learn_patterns()
+        client.domain.search(domain="example.com")
+
+        inferred = client.email.find("example.com", "Jane", "Doe", infer="prefer")
+        assert inferred.email == "jane@example.com"
+        assert inferred.inferred
+        assert not finder_calls
+
+        assert not client.email.find("example.com", "Jane", "Doe").inferred
+        assert client.email.find("other.com", "Jane", "Doe", infer="prefer").email == "jane@other.com"
+        assert finder_calls == ["example.com", "other.com"]
+        with pytest.raises(PatternNotFoundError) as error_info:
+            client.email.find("unknown.com", "Jane", "Doe", infer="only")
+        assert error_info.value.status_code == 404
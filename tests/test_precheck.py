@@ -0,0 +1,98 @@
+"""Tests for local pre-verification of email addresses."""
+
+import json
+from pathlib import Path
+
+import httpx
+
+from hunter_client.client import AsyncHunterClient, HunterClient
+from hunter_client.models.verifier import EmailVerifierRequest
+from hunter_client.precheck import PreVerifier
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+EMAIL_VERIFIER_PAYLOAD = json.loads((FIXTURES_DIR / "email_verifier.json").read_text())
+
+
+def verifier_payload(email, **checks):
+    """Return the verifier fixture for another address."""
+    payload = json.loads(json.dumps(EMAIL_VERIFIER_PAYLOAD))
+    payload["data"].update(email=email, **checks)
+    return payload
+
+
+def test_checks_syntax_lists_and_opt_in_rules(tmp_path):
+    """Test certain failures are rejected, risky ones only when asked, and lists reload."""
+    disposable_path = tmp_path / "disposable.txt"
+    disposable_path.write_text("# extra domains\nburner.example\n")
+    verifier = PreVerifier(disposable_path=disposable_path)
+
+    assert verifier.check("not-an-email").regexp is False
+    assert verifier.check("a..b@example.com").status == "invalid"
+    assert verifier.check("user@example.xn--p1ai") is None
+    assert verifier.check("user@example.xn--").regexp is False
+    assert verifier.check("x@inbox.mailinator.com").disposable
+    assert verifier.check("x@Burner.example").status == "disposable"
+    assert verifier.check("jane@gmail.com") is None
+    assert verifier.check("xkcdqwrtz@example.com") is None
+
+    disposable_path.write_text("other.example\n")
+    verifier.reload()
+    assert verifier.check("x@burner.example") is None
+    assert verifier.check("x@other.example") is not None
+
+    strict = PreVerifier(reject_webmail=True, reject_gibberish=True)
+    assert strict.check("jane@gmail.com").verification_result == "risky"
+    assert strict.check("xkcdqwrtz@example.com").gibberish
+    assert verifier.rejections == {"regexp": 3, "disposable": 3}
+
+
+def test_client_skips_upstream_and_learns_domains_without_mx():
+    """Test local answers cost no call and a no-MX response covers the rest of its domain."""
+    calls = []
+
+    def hunter_response(request):
+        email = request.url.params["email"]
+        calls.append(email)
+        return httpx.Response(200, json=verifier_payload(email, status="invalid", mx_records=False, smtp_server=False))
+
+    with HunterClient(api_key="test_key", transport=httpx.MockTransport(hunter_response)) as client:
+        verifier = client.pre_verify()
+        assert client.email.verify("jane@yopmail.com").status == "disposable"
+        assert client.email.verify("jane@dead.example").status == "invalid"
+        assert client.email.verify("john@dead.example").score == 0
+        verifier.forget_domain("dead.example")
+        client.email.verify("joe@dead.example")
+    assert calls == ["jane@dead.example", "joe@dead.example"]
+    assert verifier.rejections == {"disposable": 1, "no_mx": 1}
+
+
+async def test_async_verify_many_mixes_local_and_upstream_results():
+    """Test bulk verification only sends addresses that pass the local checks."""
+    calls = []
+
+    def hunter_response(request):
+        calls.append(request.url.params["email"])
+        return httpx.Response(200, json=verifier_payload(request.url.params["email"]))
+
+    async with AsyncHunterClient(api_key="test_key", transport=httpx.MockTransport(hunter_response)) as client:
+        client.pre_verify()
+        results = {
+            item.email: item.result.status
+            async for item in client.email.verify_many(["a@example.com", "bad@", "b@mailinator.com"])
+        }
+    assert results == {"a@example.com": "valid", "bad@": "invalid", "b@mailinator.com": "disposable"}
+    assert calls == ["a@example.com"]
+
+
+def test_accepts_internationalized_addresses():
+    """Test UTF-8 local parts, IDN domains and punycode TLDs are left to Hunter.io, also after EmailStr."""
+    verifier = PreVerifier()
+    addresses = ["josé@example.com", "user@münchen.de", "user@example.xn--p1ai", "user@example.рф"]
+    for address in addresses:
+        assert verifier.check(address) is None
+        assert verifier.check(str(EmailVerifierRequest(email=address).email)) is None
+
+    assert verifier.check("x@mailinator.com") is not None
+    assert verifier.check("user@xn--mnchen-3ya.de") is None
+    assert verifier.check("{0}@example.com".format("é" * 33)).regexp is False
+    assert verifier.check("user@exa mple.de").regexp is False
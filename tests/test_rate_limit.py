@@ -0,0 +1,102 @@
+"""Tests for client-side rate limiting and quota tracking."""
+
+import httpx
+import pytest
+import respx
+
+from hunter_client.client import create_client
+from hunter_client.config import HUNTER_API_BASE_URL
+from hunter_client.dependencies import get_client
+from hunter_client.models.account import AccountInformationResponse
+from hunter_client.rate_limit import QuotaExceededError, QuotaTracker, RateLimiter, TokenBucket
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_account(used, available):
+    """Build an account response with the given call counters."""
+    return AccountInformationResponse(
+        email="owner@example.com",
+        plan_name="Starter",
+        plan_level=1,
+        reset_date="2024-01-01",
+        calls={"used": used, "available": available},
+    )
+
+
+def test_token_bucket_reservations_queue_callers():
+    """Test callers beyond the burst are told to wait in arrival order."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, clock=clock)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1.0)
+    clock.now = 1.0
+    assert bucket.reserve() == pytest.approx(0.5)
+
+
+def test_token_bucket_pause():
+    """Test a pause holds tokens back for the given time."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10, clock=clock)
+    bucket.pause(2)
+    assert bucket.reserve() == pytest.approx(2.1)
+
+
+def test_rate_limiter_uses_endpoint_rates():
+    """Test endpoint defaults and overrides."""
+    limiter = RateLimiter(rates={"/email-verifier": 3})
+    assert limiter.bucket("/email-verifier").rate == 3
+    assert limiter.bucket("/domain-search").rate == 15
+    assert limiter.bucket("/unknown") is None
+
+
+def test_rate_limiter_splits_rates_between_workers(monkeypatch):
+    """Test workers sharing the API keys each get an equal share of every rate."""
+    limiter = RateLimiter(rates={"/email-verifier": 3}, workers=4)
+    assert limiter.bucket("/email-verifier").rate == 0.75
+    assert limiter.bucket("/domain-search").rate == 3.75
+    with pytest.raises(ValueError):
+        RateLimiter(workers=0)
+
+    monkeypatch.setenv("HUNTER_API_KEYS", "key_a,key_b")
+    monkeypatch.setenv("HUNTER_WORKERS", "5")
+    client = get_client()
+    assert client._http_client.rate_limiter.bucket("/domain-search").rate == 3
+    for pooled_key in client.key_pool.keys:
+        assert pooled_key.rate_limiter.bucket("/domain-search").rate == 3
+    client.close()
+
+
+def test_quota_tracker_rejects_at_reserve():
+    """Test billable calls stop at the reserve while free ones continue."""
+    tracker = QuotaTracker(reserve=1)
+    tracker.check("/domain-search")
+    tracker.update(make_account(used=8, available=10))
+    tracker.check("/domain-search")
+    tracker.consume("/domain-search")
+
+    with pytest.raises(QuotaExceededError) as error_info:
+        tracker.check("/domain-search")
+    assert error_info.value.status_code == 429
+    tracker.check("/account")
+
+
+@respx.mock
+def test_upstream_429_penalizes_endpoint():
+    """Test a 429 with Retry-After holds back the endpoint bucket."""
+    respx.get("{0}/email-verifier".format(HUNTER_API_BASE_URL)).mock(
+        return_value=httpx.Response(429, headers={"Retry-After": "30"}),
+    )
+    with create_client(api_key="test_key") as client:
+        client._http_client.get("/email-verifier", {"email": "a@example.com"})
+        assert client._http_client.rate_limiter.bucket("/email-verifier").reserve() > 29
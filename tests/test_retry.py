@@ -0,0 +1,116 @@
+"""Tests for retries and circuit breaking."""
+
+import httpx
+import pytest
+import respx
+
+from hunter_client.client import create_async_client, create_client
+from hunter_client.config import HUNTER_API_BASE_URL
+from hunter_client.http_client import BaseHTTPClient
+from hunter_client.rate_limit import QuotaExceededError, QuotaTracker
+from hunter_client.retry import CircuitBreaker, CircuitBreakerRegistry, CircuitOpenError, RetryBudget, RetryPolicy
+
+ACCOUNT_URL = "{0}/account".format(HUNTER_API_BASE_URL)
+DOMAIN_SEARCH_URL = "{0}/domain-search".format(HUNTER_API_BASE_URL)
+FAST_RETRIES = RetryPolicy(backoff_base=0.001)
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@respx.mock
+def test_transient_errors_are_retried():
+    """Test a 502 and a timeout are retried until a response succeeds."""
+    route = respx.get(ACCOUNT_URL).mock(
+        side_effect=[httpx.Response(502), httpx.ConnectTimeout("timeout"), httpx.Response(200, json={})],
+    )
+    with create_client(api_key="test_key", retry_policy=FAST_RETRIES) as client:
+        response = client._http_client.get("/account")
+    assert response.status_code == 200
+    assert route.call_count == 3
+
+
+@respx.mock
+async def test_async_client_gives_up_after_max_attempts():
+    """Test the async client returns the last error after its attempts run out."""
+    route = respx.get(ACCOUNT_URL).mock(return_value=httpx.Response(503))
+    async with create_async_client(api_key="test_key", retry_policy=FAST_RETRIES) as client:
+        response = await client._http_client.get("/account")
+    assert response.status_code == 503
+    assert route.call_count == FAST_RETRIES.max_attempts
+
+
+@respx.mock
+def test_client_errors_are_not_retried():
+    """Test non-transient statuses return immediately."""
+    route = respx.get(ACCOUNT_URL).mock(return_value=httpx.Response(401))
+    with create_client(api_key="test_key", retry_policy=FAST_RETRIES) as client:
+        client._http_client.get("/account")
+    assert route.call_count == 1
+
+
+def test_retry_budget():
+    """Test retries stop once the budget is spent and refill with traffic."""
+    budget = RetryBudget(ratio=0.5, min_retries=1)
+    assert budget.withdraw()
+    assert not budget.withdraw()
+    budget.deposit()
+    budget.deposit()
+    assert budget.withdraw()
+
+
+def test_circuit_breaker_opens_and_probes():
+    """Test the circuit fails fast while open and closes after a good probe."""
+    clock = FakeClock()
+    breaker = CircuitBreaker("/account", failure_threshold=2, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+    breaker.before_request()
+    breaker.record_failure()
+    with pytest.raises(CircuitOpenError) as error_info:
+        breaker.before_request()
+    assert error_info.value.status_code == 503
+
+    clock.now = 10
+    breaker.before_request()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+@respx.mock
+def test_half_open_probe_is_released_when_it_ends_without_an_outcome():
+    """Test a probe rejected by the quota or failing with a non-retryable error does not keep the circuit open."""
+    route = respx.get(DOMAIN_SEARCH_URL).mock(
+        side_effect=[httpx.Response(502), ValueError("bad response"), httpx.Response(200, json={})],
+    )
+    quota = QuotaTracker()
+    client = BaseHTTPClient(
+        api_key="test_key",
+        retry_policy=RetryPolicy(max_attempts=1),
+        circuit_breakers=CircuitBreakerRegistry(failure_threshold=1, reset_timeout=0),
+        quota=quota,
+    )
+    breaker = client.circuit_breakers.get("/domain-search")
+    try:
+        client.get("/domain-search")
+        assert breaker.state == "half_open"
+
+        quota.remaining = 0
+        with pytest.raises(QuotaExceededError):
+            client.get("/domain-search")
+        quota.remaining = None
+        with pytest.raises(ValueError):
+            client.get("/domain-search")
+        assert client.get("/domain-search").status_code == 200
+    finally:
+        client.close()
+    assert breaker.state == "closed"
+    assert route.call_count == 3
@@ -0,0 +1,109 @@
+"""Tests for request coalescing."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+import respx
+
+from hunter_client.client import create_async_client, create_client
+from hunter_client.config import HUNTER_API_BASE_URL
+from hunter_client.singleflight import AsyncSingleFlight, SingleFlight
+
+ACCOUNT_URL = "{0}/account".format(HUNTER_API_BASE_URL)
+ACCOUNT_DATA = {
+    "email": "owner@example.com",
+    "plan_name": "Free",
+    "plan_level": 0,
+    "reset_date": "2024-01-01",
+    "calls": {"used": 1, "available": 25},
+}
+
+
+def test_single_flight_shares_result_between_threads():
+    """Test concurrent callers for one key run the call once."""
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow_call():
+        calls.append(1)
+        started.set()
+        release.wait()
+        return "result"
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        leader = executor.submit(flight.do, "key", slow_call)
+        started.wait()
+        followers = [executor.submit(flight.do, "key", slow_call) for _ in range(3)]
+        time.sleep(0.05)
+        release.set()
+        results = [leader.result()] + [follower.result() for follower in followers]
+
+    assert results == ["result"] * 4
+    assert len(calls) == 1
+    assert len(flight) == 0
+
+
+def test_single_flight_shares_errors():
+    """Test the leader's exception propagates and the key is released."""
+    flight = SingleFlight()
+
+    def failing_call():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        flight.do("key", failing_call)
+    assert flight.do("key", lambda: "ok") == "ok"
+
+
+async def test_async_single_flight_survives_cancelled_caller():
+    """Test cancelling one waiter does not cancel the shared call."""
+    flight = AsyncSingleFlight()
+
+    async def slow_call():
+        await asyncio.sleep(0.05)
+        return "result"
+
+    first = asyncio.create_task(flight.do("key", slow_call))
+    second = asyncio.create_task(flight.do("key", slow_call))
+    await asyncio.sleep(0)
+    first.cancel()
+    assert await second == "result"
+
+
+@respx.mock
+async def test_concurrent_identical_lookups_hit_upstream_once():
+    """Test concurrent identical service calls share one upstream request."""
+
+    async def slow_account(request):
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"data": ACCOUNT_DATA})
+
+    route = respx.get(ACCOUNT_URL).mock(side_effect=slow_account)
+    async with create_async_client(api_key="test_key") as client:
+        results = await asyncio.gather(*(client.account.get_information() for _ in range(5)))
+
+    assert route.call_count == 1
+    assert all(result is results[0] for result in results)
+
+
+@respx.mock
+def test_sync_refreshes_are_coalesced():
+    """Test concurrent cache-bypassing refreshes from threads share one request."""
+
+    def slow_account(request):
+        time.sleep(0.05)
+        return httpx.Response(200, json={"data": ACCOUNT_DATA})
+
+    route = respx.get(ACCOUNT_URL).mock(side_effect=slow_account)
+    with create_client(api_key="test_key") as client:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: client.account.refresh_information(), range(4)))
+
+    assert route.call_count == 1
+    assert len({id(result) for result in results}) == 1
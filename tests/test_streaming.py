@@ -0,0 +1,94 @@
+"""Tests for incremental decoding of domain search responses."""
+
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+from hunter_client.client import AsyncHunterClient, HunterClient
+from hunter_client.models.domain import DomainSearchResponse
+from hunter_client.response_handler import HunterAPIError
+from hunter_client.streaming import DomainSearchParser
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+DOMAIN_SEARCH_PAYLOAD = json.loads((FIXTURES_DIR / "domain_search.json").read_text())
+
+
+def test_parser_handles_arbitrary_chunk_boundaries():
+    """Test emails complete one by one however the body is split, including inside UTF-8 characters."""
+    payload = json.loads(json.dumps(DOMAIN_SEARCH_PAYLOAD))
+    payload["data"]["emails"][0]["first_name"] = "Zoë"
+    payload["data"]["linked_domains"] = ["example.org"]
+    body = json.dumps(payload, indent=2, ensure_ascii=False).encode()
+
+    parser = DomainSearchParser()
+    emails = []
+    emails_seen_before_end = 0
+    for index in range(len(body)):
+        emails.extend(parser.feed(body[index : index + 1]))
+        if index < len(body) - 2:
+            emails_seen_before_end = len(emails)
+    emails.extend(parser.finish())
+
+    assert emails == payload["data"]["emails"]
+    assert emails_seen_before_end == len(emails)
+    assert parser.envelope["meta"] == payload["meta"]
+    assert parser.envelope["data"]["linked_domains"] == ["example.org"]
+    assert "emails" not in parser.envelope["data"]
+
+
+def test_parser_rejects_truncated_and_malformed_bodies():
+    """Test incomplete or invalid JSON is reported once the body ends."""
+    body = json.dumps(DOMAIN_SEARCH_PAYLOAD).encode()
+    parser = DomainSearchParser()
+    parser.feed(body[:-40])
+    with pytest.raises(HunterAPIError):
+        parser.finish()
+    with pytest.raises(HunterAPIError):
+        DomainSearchParser().feed(b'["not an object"]')
+
+
+def test_stream_yields_emails_and_reuses_cache():
+    """Test streamed emails match a regular search and cached pages are replayed."""
+    calls = []
+
+    def hunter_response(request):
+        calls.append(request.url.path)
+        if request.url.params["domain"] == "missing.com":
+            return httpx.Response(400, json={"errors": [{"details": "invalid domain"}]})
+        return httpx.Response(200, json=DOMAIN_SEARCH_PAYLOAD)
+
+    with HunterClient(api_key="test_key", transport=httpx.MockTransport(hunter_response)) as client:
+        with client.domain.stream(domain="example.com") as results:
+            streamed = list(results)
+            info = results.info
+        expected = DomainSearchResponse(**DOMAIN_SEARCH_PAYLOAD["data"])
+        assert streamed == expected.emails
+        assert info.organization == expected.organization
+        assert info.emails == []
+        assert len(calls) == 1
+
+        client.domain.search(domain="example.com")
+        with client.domain.stream(domain="example.com") as results:
+            assert list(results) == expected.emails
+        assert len(calls) == 2
+
+        with pytest.raises(HunterAPIError) as error_info:
+            with client.domain.stream(domain="missing.com"):
+                pass
+        assert error_info.value.status_code == 400
+
+
+async def test_async_stream_teaches_pattern_index():
+    """Test async streams yield validated emails and feed the pattern index as they go."""
+    async with AsyncHunterClient(
+        api_key="test_key",
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json=DOMAIN_SEARCH_PAYLOAD)),
+    ) as client:
+        index = client.learn_patterns()
+        async with client.domain.stream(domain="example.com", limit=10) as results:
+            emails = [email.email_value async for email in results]
+
+    assert emails == [email["value"] for email in DOMAIN_SEARCH_PAYLOAD["data"]["emails"]]
+    assert index.best("example.com") is not None
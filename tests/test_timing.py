@@ -0,0 +1,86 @@
+"""Tests for per-request phase timings."""
+
+import httpx
+import respx
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from hunter_client.client import HunterClient
+from hunter_client.config import HUNTER_API_BASE_URL
+from hunter_client.main import app
+from hunter_client.metrics import ServerTimingMiddleware, SlowRequestSampler
+from hunter_client.timing import RequestTimings, UpstreamTrace, collect_timings
+
+ACCOUNT_PAYLOAD = {
+    "data": {
+        "email": "owner@example.com",
+        "plan_name": "Free",
+        "plan_level": 0,
+        "reset_date": "2024-01-01",
+        "calls": {"used": 7, "available": 25},
+    },
+}
+
+
+def test_client_calls_record_phases_within_collect_timings():
+    """Test upstream, parsing and validation phases are timed, and only inside the context."""
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=ACCOUNT_PAYLOAD))
+    with HunterClient(api_key="test_key", transport=transport) as client:
+        with collect_timings() as timings:
+            client.account.get_information()
+        client.account.get_information()
+
+    assert set(timings.phases) == {"wait", "download", "parse", "validate"}
+    assert [span.name for span in timings.spans] == ["wait", "download", "parse", "validate"]
+    assert timings.spans[0].started >= 0
+    assert timings.server_timing(0.0123).endswith("total;dur=12.300")
+
+
+def test_upstream_trace_splits_connection_setup():
+    """Test httpcore trace events add connection setup to its phases and other steps to the trace."""
+    timings = RequestTimings(max_spans=3)
+    upstream_trace = UpstreamTrace(timings)
+    for step in ("connection.connect_tcp", "connection.start_tls", "http11.receive_response_headers"):
+        upstream_trace("{0}.started".format(step), {})
+        upstream_trace("{0}.complete".format(step), {"return_value": None})
+    upstream_trace("http11.response_closed.started", {})
+    upstream_trace("http11.response_closed.failed", {"exception": OSError()})
+
+    assert set(timings.phases) == {"connect", "tls"}
+    assert upstream_trace.setup_seconds == timings.phases["connect"] + timings.phases["tls"]
+    assert [span.name for span in timings.spans] == ["connect", "tls", "http11.receive_response_headers"]
+    assert timings.dropped_spans == 1
+    assert timings.server_timing().startswith("connect;dur=")
+
+
+def test_routes_report_server_timing_and_sample_slow_requests(monkeypatch):
+    """Test responses carry Server-Timing and slow traces are dumped at the sampler's rate."""
+    monkeypatch.setenv("HUNTER_API_KEY", "test_key")
+    with respx.mock:
+        respx.get("{0}/account".format(HUNTER_API_BASE_URL)).mock(
+            return_value=httpx.Response(200, json=ACCOUNT_PAYLOAD),
+        )
+        with TestClient(app) as api:
+            server_timing = api.get("/account").headers["server-timing"]
+    assert [metric.split(";")[0] for metric in server_timing.split(", ")] == [
+        "wait",
+        "download",
+        "parse",
+        "validate",
+        "serialize",
+        "total",
+    ]
+
+    dumped = []
+    sampler = SlowRequestSampler(threshold=0, rate=1, dump=dumped.append)
+    slow_app = FastAPI()
+    slow_app.add_middleware(ServerTimingMiddleware, sampler=sampler)
+    slow_app.get("/ping")(lambda: {"ok": True})
+    with TestClient(slow_app) as api:
+        assert api.get("/ping").headers["server-timing"].startswith("total;dur=")
+        api.get("/ping")
+    assert sampler.dumped == 1
+    assert sampler.suppressed == 1
+    assert dumped[0]["route"] == "/ping"
+    assert dumped[0]["status"] == 200
+    assert dumped[0]["phases"] == {}